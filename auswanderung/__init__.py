@@ -0,0 +1 @@
+"""Scoring and report building for the Auswanderungsanalyse documents"""
@@ -0,0 +1,299 @@
+"""Benchmarks for the report building blocks on synthetic matrices.
+
+Each benchmark runs on a matrix of a given size (countries x criteria x
+explanation length) and is timed as the best of ``--repeat`` runs. Building
+the document and table it works on is setup and not part of the time. Peak
+memory is the peak RSS of one more run in a fresh process, which includes
+lxml's allocations and the interpreter itself. It is read from VmHWM on
+Linux (``ru_maxrss`` survives fork and exec there), from ``ru_maxrss``
+elsewhere, and from tracemalloc, which only sees Python objects, where
+neither exists. Results are written as JSON; with ``--baseline``
+they are compared against an earlier run and any benchmark that got slower
+by more than ``--tolerance`` makes the command exit with status 1.
+
+Usage: python -m auswanderung.bench [--size CxKxE ...] [--repeat N] [--output FILE]
+                                    [--baseline FILE] [--tolerance T]
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+import docx
+from docx import Document
+
+from auswanderung.buildcache import save_deterministic
+from auswanderung.reports import load_report
+from auswanderung.styles import style_ids
+from auswanderung.tables import create_matrix_cell, create_table_original_style, set_cell_shading
+from auswanderung.xmltable import SYMBOL_FILLS, add_matrix_table, matrix_cell_xml
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+SIZES = ((13, 20, 20), (40, 30, 40))
+SYMBOLS = (('--', '0'), ('o', '1'), ('++', '2'))
+WORDS = ('EU-Recht', 'Visum', 'Klima', 'mild', 'Jobs', 'Englisch', 'sicher', 'teuer', 'Flug', 'ZJ')
+
+
+def synthetic_matrix(countries, criteria, explanation, seed=0):
+    """Return ``matrix_rows`` of the given size with explanations of ``explanation`` characters"""
+    rng = random.Random(seed)
+
+    def text():
+        words = []
+        while len(' '.join(words)) < explanation:
+            words.append(rng.choice(WORDS))
+        return ' '.join(words)[:explanation]
+
+    rows = [["Kriterium"] + [f"L{i}" for i in range(countries)]]
+    for j in range(criteria):
+        row = [f"Kriterium {j} x{rng.choice(('0.5', '1', '1.5', '2'))}"]
+        for _ in range(countries):
+            symbol, points = rng.choice(SYMBOLS)
+            row.append((symbol, points, text()))
+        rows.append(row)
+    return rows
+
+
+def flat_rows(matrix_rows):
+    """The matrix as plain text rows, the way the ranking and comparison tables look"""
+    return [matrix_rows[0]] + [[row[0]] + [f"{s} ({p}) {e}" for s, p, e in row[1:]]
+                               for row in matrix_rows[1:]]
+
+
+def new_document():
+    """An empty document with the table styles registered and their IDs looked up"""
+    doc = Document()
+    style_ids(doc.part)
+    return doc
+
+
+def new_table(matrix_rows):
+    """An empty table of the size of ``matrix_rows``, its cells and its width"""
+    table = new_document().add_table(rows=len(matrix_rows), cols=len(matrix_rows[0]))
+    return table._cells, len(matrix_rows[0])
+
+
+# Each benchmark does its setup when called and returns the operation to time
+
+
+def bench_table_fill(matrix_rows, workdir):
+    doc, rows = new_document(), flat_rows(matrix_rows)
+
+    def operation():
+        create_table_original_style(doc, rows)
+    return operation
+
+
+def bench_cell_creation(matrix_rows, workdir):
+    cells, width = new_table(matrix_rows)
+
+    def operation():
+        for i, row in enumerate(matrix_rows[1:], start=1):
+            for j, (symbol, points, explanation) in enumerate(row[1:], start=1):
+                create_matrix_cell(cells[i * width + j], symbol, points, explanation)
+    return operation
+
+
+def bench_shading(matrix_rows, workdir):
+    cells, width = new_table(matrix_rows)
+
+    def operation():
+        for i, row in enumerate(matrix_rows[1:], start=1):
+            for j, cell in enumerate(row[1:], start=1):
+                set_cell_shading(cells[i * width + j], SYMBOL_FILLS[cell[0]])
+    return operation
+
+
+def bench_matrix_xml(matrix_rows, workdir):
+    matrix_cell_xml.cache_clear()
+    doc = new_document()
+
+    def operation():
+        add_matrix_table(doc, matrix_rows)
+    return operation
+
+
+def bench_save(matrix_rows, workdir):
+    doc = new_document()
+    add_matrix_table(doc, matrix_rows)
+    output = Path(workdir) / 'save.docx'
+
+    def operation():
+        save_deterministic(doc, output)
+        return output.stat().st_size
+    return operation
+
+
+def bench_report(matrix_rows, workdir):
+    module = load_report('final_v4')
+    output = Path(workdir) / 'report.docx'
+
+    def operation():
+        save_deterministic(module.build_report(), output)
+        return output.stat().st_size
+    return operation
+
+
+# name -> (function, whether it runs on the synthetic matrix)
+BENCHMARKS = {
+    'table_fill': (bench_table_fill, True),
+    'cell_creation': (bench_cell_creation, True),
+    'shading': (bench_shading, True),
+    'matrix_xml': (bench_matrix_xml, True),
+    'save': (bench_save, True),
+    'report_final_v4': (bench_report, False),
+}
+
+
+def parse_size(text):
+    """Parse a size like "13x20x20" (countries x criteria x explanation length)"""
+    try:
+        countries, criteria, explanation = (int(part) for part in text.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected COUNTRIESxCRITERIAxEXPLANATION, got {text!r}")
+    return countries, criteria, explanation
+
+
+def peak_rss():
+    """Peak resident set size of this process in bytes, or None where it cannot be read"""
+    status = Path('/proc/self/status')
+    if status.exists():
+        for line in status.read_text().splitlines():
+            if line.startswith('VmHWM:'):
+                return int(line.split()[1]) * 1024
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+    return None
+
+
+def peak_memory(name, size, workdir):
+    """Run one benchmark and return the peak memory of this process"""
+    function, synthetic = BENCHMARKS[name]
+    matrix_rows = synthetic_matrix(*size) if synthetic else None
+    if peak_rss() is None:
+        tracemalloc.start()
+        try:
+            function(matrix_rows, workdir)()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    function(matrix_rows, workdir)()
+    return peak_rss()
+
+
+def measure(name, size, workdir, repeat):
+    """Best wall time of ``repeat`` runs, then the peak memory of one run in a fresh process.
+
+    Every run gets a fresh setup, which is not timed.
+    """
+    function, synthetic = BENCHMARKS[name]
+    matrix_rows = synthetic_matrix(*size) if synthetic else None
+    seconds, output_bytes = float('inf'), None
+    for _ in range(repeat):
+        operation = function(matrix_rows, workdir)
+        start = time.perf_counter()
+        output_bytes = operation()
+        seconds = min(seconds, time.perf_counter() - start)
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as pool:
+        peak = pool.submit(peak_memory, name, size, workdir).result()
+    return seconds, output_bytes, peak
+
+
+def run(sizes=SIZES, names=None, repeat=3):
+    """Run the benchmarks and return one result dict per benchmark and size"""
+    names = names or list(BENCHMARKS)
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for name in names:
+            synthetic = BENCHMARKS[name][1]
+            for size in sizes if synthetic else [None]:
+                cells = size[0] * size[1] if synthetic else None
+                seconds, output_bytes, peak = measure(name, size, workdir, repeat)
+                results.append({
+                    'benchmark': name,
+                    'size': 'x'.join(map(str, size)) if synthetic else None,
+                    'cells': cells,
+                    'seconds': seconds,
+                    'cells_per_second': cells / seconds if cells else None,
+                    'output_bytes': output_bytes,
+                    'peak_bytes': peak,
+                })
+                print_result(results[-1])
+    return results
+
+
+def print_result(result):
+    rate = f"{result['cells_per_second']:>12,.0f} Zellen/s" if result['cells'] else ' ' * 21
+    size = f"{result['output_bytes']:>10,} B" if result['output_bytes'] else ' ' * 12
+    print(f"{result['benchmark']:<16} {result['size'] or '-':<10} {result['seconds'] * 1000:>9.2f} ms"
+          f"  {rate}  {size}  Peak {result['peak_bytes'] / 1e6:>7.2f} MB")
+
+
+def key(result):
+    return result['benchmark'], result['size']
+
+
+def compare(results, baseline, tolerance):
+    """Print the change against ``baseline`` results; return the benchmarks slower than allowed"""
+    previous = {key(result): result for result in baseline}
+    regressions = []
+    for result in results:
+        before = previous.get(key(result))
+        if before is None:
+            continue
+        ratio = result['seconds'] / before['seconds']
+        flag = ''
+        if ratio > 1 + tolerance:
+            regressions.append(result)
+            flag = '  REGRESSION'
+        print(f"{result['benchmark']:<16} {result['size'] or '-':<10} {ratio:>6.2f}x{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('benchmarks', nargs='*',
+                        help=f"benchmarks to run (default: all of {', '.join(BENCHMARKS)})")
+    parser.add_argument('--size', '-s', type=parse_size, action='append',
+                        help="countries x criteria x explanation length, e.g. 13x20x20 (repeatable)")
+    parser.add_argument('--repeat', '-r', type=int, default=3, help="timed runs per benchmark")
+    parser.add_argument('--output', '-o', type=Path, help="write the results to this JSON file")
+    parser.add_argument('--baseline', '-b', type=Path, help="compare against an earlier JSON file")
+    parser.add_argument('--tolerance', '-t', type=float, default=0.2,
+                        help="allowed slowdown against the baseline (default: 0.2 = 20%%)")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.benchmarks if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+
+    results = run(args.size or SIZES, args.benchmarks, args.repeat)
+    report = {
+        'python': platform.python_version(),
+        'python_docx': getattr(docx, '__version__', None),
+        'machine': platform.machine(),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+    if args.baseline:
+        print(f"Vergleich mit {args.baseline}:")
+        baseline = json.loads(args.baseline.read_text())['results']
+        if compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+"""Build all report variants in parallel.
+
+Every module in auswanderung.reports is a report definition: it builds the
+document in ``build_report()`` and names its file in ``OUTPUT_FILE``. The
+reports are independent, so they are rendered in a process pool and the
+whole set takes about as long as the slowest report. Reports whose inputs
+are unchanged since the existing output was built are skipped (see
+auswanderung.buildcache). With ``--stream`` each report writes its finished
+sections to disk while it is built (see auswanderung.streaming). With
+``--trace DIR`` every built report writes a Chrome trace and a text summary
+of its sections to DIR (see auswanderung.tracing); ``--trace-memory`` adds
+the Python allocation per section, at several times the build time.
+
+Usage: python -m auswanderung.build [--jobs N] [--output-dir DIR] [--force] [--stream]
+                                    [--trace DIR] [--trace-memory] [REPORT ...]
+"""
+import argparse
+import time
+from collections import namedtuple
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from auswanderung.buildcache import output_file, report_hash, save_deterministic, stored_hash
+from auswanderung.reports import REPORTS, load_report
+from auswanderung.streaming import StreamWriter
+from auswanderung.tracing import Tracer, span
+
+ROOT = Path(__file__).resolve().parent.parent
+OUTPUT_DIR = ROOT / 'Samples'
+
+Report = namedtuple('Report', ['name', 'script'])
+BuildResult = namedtuple('BuildResult', ['name', 'output', 'seconds', 'cached'])
+
+
+def discover_reports():
+    """Return a report definition for every module in auswanderung.reports"""
+    return [Report(name, Path(load_report(name).__file__)) for name in REPORTS]
+
+
+def render_report(report, output_dir, digest=None, stream=False, trace_dir=None,
+                  trace_memory=False):
+    """Build one report and save its document into ``output_dir``"""
+    start = time.perf_counter()
+    module = load_report(report.name)
+    output = Path(output_dir) / module.OUTPUT_FILE
+    writer = StreamWriter() if stream else None
+    on_section = writer.section if writer else None
+    tracer = Tracer(trace_memory, on_section) if trace_dir else None
+    with tracer or nullcontext():
+        with span('build_report'):
+            doc = module.build_report(on_section=tracer.section if tracer else on_section)
+            if tracer:
+                tracer.end_section()
+        with span('save'):
+            if writer:
+                writer.save(doc, output, digest)
+            else:
+                save_deterministic(doc, output, digest)
+    if tracer:
+        tracer.write_chrome_trace(Path(trace_dir) / f'{report.name}.trace.json')
+        (Path(trace_dir) / f'{report.name}.txt').write_text(tracer.summary() + '\n',
+                                                            encoding='utf-8')
+    return BuildResult(report.name, output, time.perf_counter() - start, False)
+
+
+def print_result(result):
+    timing = "unverändert" if result.cached else f"{result.seconds:.2f}s"
+    print(f"{result.name:<32} {timing:>11}  {result.output.name}")
+
+
+def build_all(reports, output_dir=OUTPUT_DIR, jobs=None, force=False, stream=False, trace_dir=None,
+              trace_memory=False):
+    """Render ``reports`` across ``jobs`` worker processes, printing each as it finishes"""
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    if trace_dir:
+        Path(trace_dir).mkdir(parents=True, exist_ok=True)
+    results, pending = [], []
+    for report in reports:
+        digest = report_hash(report.script)
+        output = Path(output_dir) / output_file(report.script)
+        if not force and stored_hash(output) == digest:
+            results.append(BuildResult(report.name, output, 0.0, True))
+            print_result(results[-1])
+        else:
+            pending.append((report, digest))
+    if not pending:
+        return results
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(render_report, report, output_dir, digest, stream, trace_dir,
+                               trace_memory)
+                   for report, digest in pending]
+        for future in as_completed(futures):
+            results.append(future.result())
+            print_result(results[-1])
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('reports', nargs='*', help="report names (default: all)")
+    parser.add_argument('--jobs', '-j', type=int, default=None, help="worker processes")
+    parser.add_argument('--output-dir', '-o', type=Path, default=OUTPUT_DIR)
+    parser.add_argument('--force', '-f', action='store_true', help="rebuild unchanged reports too")
+    parser.add_argument('--stream', action='store_true', help="write sections to disk while building")
+    parser.add_argument('--trace', type=Path, metavar='DIR', help="write section traces to DIR")
+    parser.add_argument('--trace-memory', action='store_true',
+                        help="also trace Python allocations per section (slow)")
+    args = parser.parse_args(argv)
+
+    reports = discover_reports()
+    if args.reports:
+        known = {report.name: report for report in reports}
+        unknown = [name for name in args.reports if name not in known]
+        if unknown:
+            parser.error(f"unknown report(s): {', '.join(unknown)}")
+        reports = [known[name] for name in args.reports]
+
+    start = time.perf_counter()
+    if args.trace_memory and not args.trace:
+        parser.error("--trace-memory needs --trace DIR")
+    results = build_all(reports, args.output_dir, args.jobs, args.force, args.stream, args.trace,
+                        args.trace_memory)
+    wall = time.perf_counter() - start
+    built = [result for result in results if not result.cached]
+    total = sum(result.seconds for result in built)
+    slowest = max(built, key=lambda result: result.seconds, default=None)
+    print(f"{len(built)} Berichte in {wall:.2f}s erstellt, {len(results) - len(built)} unverändert "
+          f"(Summe der Einzelzeiten {total:.2f}s"
+          + (f", langsamster: {slowest.name} {slowest.seconds:.2f}s)" if slowest else ")"))
+
+
+if __name__ == '__main__':
+    main()
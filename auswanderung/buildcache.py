@@ -0,0 +1,82 @@
+"""Content-hash cache for report builds and deterministic .docx output.
+
+A report's hash covers its report module (data and narrative), the
+package code it renders with and the python-docx template. The hash is
+stored as ``dc:identifier`` in the core properties of the output, so an
+existing file whose identifier matches is known to be up to date.
+"""
+import ast
+import hashlib
+import io
+import zipfile
+from pathlib import Path
+from xml.etree import ElementTree
+
+import docx
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+TEMPLATE = Path(docx.__file__).resolve().parent / 'templates' / 'default.docx'
+
+HASH_PREFIX = 'sha256:'
+CORE_PROPERTIES = 'docProps/core.xml'
+DC_IDENTIFIER = '{http://purl.org/dc/elements/1.1/}identifier'
+
+# Earliest timestamp a zip entry can carry
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+def output_file(script):
+    """Return the ``OUTPUT_FILE`` a report module assigns, without importing it"""
+    tree = ast.parse(Path(script).read_bytes())
+    for node in tree.body:
+        if (isinstance(node, ast.Assign) and len(node.targets) == 1
+                and getattr(node.targets[0], 'id', None) == 'OUTPUT_FILE'):
+            return ast.literal_eval(node.value)
+    raise ValueError(f"{script} does not define OUTPUT_FILE")
+
+
+def report_hash(script):
+    """Hash the inputs of one report: module, package sources, template and python-docx version"""
+    digest = hashlib.sha256()
+    sources = [Path(script)] + sorted(PACKAGE_DIR.glob('*.py')) + [TEMPLATE]
+    for path in sources:
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    digest.update(getattr(docx, '__version__', '').encode())
+    return HASH_PREFIX + digest.hexdigest()
+
+
+def stored_hash(path):
+    """Return the build hash stored in an existing .docx, or None"""
+    try:
+        with zipfile.ZipFile(path) as package:
+            core = ElementTree.fromstring(package.read(CORE_PROPERTIES))
+    except (OSError, KeyError, zipfile.BadZipFile, ElementTree.ParseError):
+        return None
+    identifier = core.findtext(DC_IDENTIFIER)
+    return identifier if identifier and identifier.startswith(HASH_PREFIX) else None
+
+
+def save_deterministic(doc, path, identifier=None):
+    """Save ``doc`` so that the same content always gives byte-identical files.
+
+    python-docx writes the parts in a stable order but stamps every zip entry
+    with the current time; the entries are rewritten with a fixed timestamp.
+    """
+    if identifier is not None:
+        doc.core_properties.identifier = identifier
+    buffer, output = io.BytesIO(), io.BytesIO()
+    doc.save(buffer)
+    with zipfile.ZipFile(buffer) as source, \
+            zipfile.ZipFile(output, 'w', zipfile.ZIP_DEFLATED) as target:
+        for info in source.infolist():
+            target.writestr(zip_entry(info.filename), source.read(info.filename))
+    Path(path).write_bytes(output.getvalue())
+
+
+def zip_entry(name):
+    """Return a ZipInfo for ``name`` with the fixed timestamp and permissions of every build"""
+    entry = zipfile.ZipInfo(name, date_time=ZIP_DATE_TIME)
+    entry.compress_type = zipfile.ZIP_DEFLATED
+    entry.external_attr = 0o644 << 16
+    return entry
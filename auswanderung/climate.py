@@ -0,0 +1,234 @@
+"""Streaming ingestion of daily weather-station data into climate metrics.
+
+The Klima, Sonne, Tennis-Wetter and Wind cells are typed from memory. This
+module reads daily station dumps, CSV files with a header row and one row
+per station and day:
+
+* ``station``: location name, the key of the result
+* ``tmax``: daily maximum temperature in °C
+* ``precipitation``: daily precipitation in mm
+* ``sunshine``: daily sunshine duration in hours
+* ``wind``: daily mean wind speed in km/h
+
+Only ``station`` is required; other columns are ignored, empty fields
+count as missing. Station names may take up to STATION_BYTES bytes of
+UTF-8; a longer name is an error rather than silently cut off. A file
+is read in chunks of CHUNK_BYTES, each parsed by ``np.loadtxt`` into
+columns and reduced right away to per-station sums and counts with
+``np.bincount``; station names are only compared at the boundaries of
+runs, since dumps usually come sorted by station. Memory therefore
+depends on the chunk size, not on the file.
+
+The sums and counts of every file are cached (``.npz``, a few bytes per
+station and statistic) under a fingerprint of its path, size and
+modification time, so adding one file to a directory of decades of data
+only parses the new one. The merged counts become per-station metrics:
+
+* ``sunshine_hours``, ``tennis_days``, ``heat_days``, ``precipitation_mm``:
+  per year, scaled from the days with data, so gaps do not bias them
+* ``mean_wind``: mean daily wind speed in km/h
+
+Tennis days follow auswanderung.tennis.DEFAULT_RULE; a heat day is one
+with at least HEAT_DAY °C. The metrics are a rules.MetricTable and can be
+written as the CSV auswanderung.rules reads.
+
+Usage: python -m auswanderung.climate CSV [CSV ...] [--cache DIR] [--output METRICS.csv]
+"""
+import argparse
+import hashlib
+import io
+import time
+from collections import namedtuple
+from pathlib import Path
+
+import numpy as np
+
+from auswanderung.rules import MetricTable, write_metrics
+from auswanderung.tennis import playable
+
+# Bytes of text parsed at a time
+CHUNK_BYTES = 1 << 24
+
+COLUMNS = ('tmax', 'precipitation', 'sunshine', 'wind')
+STATION_BYTES = 64
+# One byte more than a name may take, so a longer name shows up as filling it
+STATION_DTYPE = f'S{STATION_BYTES + 1}'
+
+DAYS_PER_YEAR = 365.25
+HEAT_DAY = 30.0
+
+# Daily statistics summed per station, and whether the metric is per year
+STATISTICS = ('sunshine_hours', 'tennis_days', 'heat_days', 'precipitation_mm', 'mean_wind')
+ANNUAL = np.array([True, True, True, True, False])
+
+Totals = namedtuple('Totals', ['stations', 'sums', 'counts'])
+Totals.__doc__ = """Per-station sums of the daily STATISTICS and the number of days with data.
+
+sums is a float array and counts an int array, both (stations, statistics).
+"""
+
+
+def read_chunks(path, columns=COLUMNS, key='station', chunk_bytes=CHUNK_BYTES):
+    """Yield the ``key`` and ``columns`` of a CSV file as structured arrays of ~chunk_bytes.
+
+    Columns missing from the file are left out of the arrays.
+    """
+    with open(path, 'rb') as source:
+        header = source.readline().decode('utf-8-sig').strip().split(',')
+        if key not in header:
+            raise ValueError(f"{path}: no {key!r} column in the header")
+        names = [key] + [name for name in columns if name in header]
+        dtype = np.dtype([(name, STATION_DTYPE if name == key else np.float64)
+                          for name in names])
+        columns = [header.index(name) for name in names]
+        while True:
+            data = source.read(chunk_bytes)
+            if not data:
+                break
+            data += source.readline()
+            # loadtxt stores bytes fields latin-1 encoded; decoding latin-1 here
+            # keeps the UTF-8 bytes of the names as they are in the file
+            text = data.decode('latin-1').replace('\r\n', '\n')
+            # loadtxt has no notion of missing values; empty fields become nan
+            for _ in range(2):
+                text = text.replace(',,', ',nan,')
+            text = text.replace(',\n', ',nan\n')
+            if text.endswith(','):
+                text += 'nan'
+            chunk = np.loadtxt(io.StringIO(text), delimiter=',', dtype=dtype, usecols=columns,
+                               ndmin=1)
+            long = np.char.str_len(chunk[key]) > STATION_BYTES
+            if long.any():
+                name = chunk[key][long][0].decode('utf-8', 'replace')
+                raise ValueError(f"{path}: {key} longer than {STATION_BYTES} bytes: {name!r}...")
+            if len(chunk):
+                yield chunk
+
+
+def station_ids(names):
+    """Station (or region) names of a chunk and the index of each row's name"""
+    heads = np.flatnonzero(np.concatenate([[True], names[1:] != names[:-1]]))
+    stations, head_ids = np.unique(names[heads], return_inverse=True)
+    ids = np.repeat(head_ids, np.diff(np.append(heads, len(names))))
+    return [name.decode('utf-8') for name in stations], ids
+
+
+def daily_statistics(chunk):
+    """(rows, statistics) array of the daily values, nan where an input is missing"""
+    missing = np.full(len(chunk), np.nan)
+    tmax, precipitation, sunshine, wind = (
+        chunk[name] if name in chunk.dtype.names else missing for name in COLUMNS)
+    tennis = playable(tmax, precipitation, wind).astype(np.float64)
+    with np.errstate(invalid='ignore'):
+        heat = (tmax >= HEAT_DAY).astype(np.float64)
+    tennis[np.isnan(tmax) | np.isnan(precipitation) | np.isnan(wind)] = np.nan
+    heat[np.isnan(tmax)] = np.nan
+    return np.stack([sunshine, tennis, heat, precipitation, wind], axis=1)
+
+
+def chunk_totals(chunk):
+    """Group one chunk by station into Totals"""
+    stations, ids = station_ids(chunk['station'])
+    values = daily_statistics(chunk)
+    valid = ~np.isnan(values)
+    values[~valid] = 0.0
+    sums = np.stack([np.bincount(ids, weights=values[:, k], minlength=len(stations))
+                     for k in range(len(STATISTICS))], axis=1)
+    counts = np.stack([np.bincount(ids[valid[:, k]], minlength=len(stations))
+                       for k in range(len(STATISTICS))], axis=1)
+    return Totals(stations, sums, counts)
+
+
+def grow_rows(array, rows):
+    """``array`` extended with rows of zeros to ``rows`` rows"""
+    extra = np.zeros((rows - len(array),) + array.shape[1:], dtype=array.dtype)
+    return np.concatenate([array, extra])
+
+
+def merge_totals(items):
+    """Add up Totals, matching stations by name.
+
+    Each item is added to a running total as it arrives, so merging the
+    chunks of a file holds one chunk's Totals at a time, not all of them.
+    """
+    index = {}
+    sums = np.zeros((0, len(STATISTICS)))
+    counts = np.zeros((0, len(STATISTICS)), dtype=np.int64)
+    for item in items:
+        rows = np.array([index.setdefault(station, len(index)) for station in item.stations],
+                        dtype=np.intp)
+        if len(index) > len(sums):
+            sums, counts = grow_rows(sums, len(index)), grow_rows(counts, len(index))
+        sums[rows] += item.sums
+        counts[rows] += item.counts
+    return Totals(tuple(index), sums, counts)
+
+
+def ingest_file(path, chunk_bytes=CHUNK_BYTES):
+    """Stream one station file into Totals"""
+    return merge_totals(chunk_totals(chunk) for chunk in read_chunks(path, chunk_bytes=chunk_bytes))
+
+
+def fingerprint(path):
+    """Cache key of a source file: its resolved path, size and modification time"""
+    path = Path(path).resolve()
+    stat = path.stat()
+    return f"{path}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def cache_path(path, cache_dir, kind='climate'):
+    """Cache file of the ``kind`` results of ``path`` in ``cache_dir``"""
+    digest = hashlib.sha256(fingerprint(path).encode()).hexdigest()[:32]
+    return Path(cache_dir) / f"{kind}-{digest}.npz"
+
+
+def cached_totals(path, cache_dir):
+    """Totals of ``path`` from the cache in ``cache_dir``, ingesting and caching on a miss"""
+    key = fingerprint(path)
+    cache = cache_path(path, cache_dir)
+    if cache.exists():
+        with np.load(cache) as stored:
+            if str(stored['fingerprint']) == key:
+                return Totals(tuple(str(name) for name in stored['stations']), stored['sums'],
+                              stored['counts'])
+    totals = ingest_file(path)
+    cache.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache, 'wb') as output:
+        np.savez(output, fingerprint=np.array(key), stations=np.array(totals.stations, dtype=str),
+                 sums=totals.sums, counts=totals.counts.astype(np.int32))
+    return totals
+
+
+def ingest(paths, cache_dir=None):
+    """Merge the Totals of all ``paths``, through the cache if ``cache_dir`` is given"""
+    if cache_dir is None:
+        return merge_totals(ingest_file(path) for path in paths)
+    return merge_totals(cached_totals(path, cache_dir) for path in paths)
+
+
+def climate_metrics(totals):
+    """Turn Totals into a MetricTable of the STATISTICS, nan where a station has no data"""
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = totals.sums / totals.counts
+    values = np.where(ANNUAL, means * DAYS_PER_YEAR, means)
+    return MetricTable(tuple(totals.stations), STATISTICS, values)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('sources', nargs='+', type=Path, help="daily station CSV files")
+    parser.add_argument('--cache', type=Path, metavar='DIR', help="cache per-file totals in DIR")
+    parser.add_argument('--output', '-o', type=Path, help="write the metrics to this CSV file")
+    args = parser.parse_args(argv)
+    start = time.perf_counter()
+    table = climate_metrics(ingest(args.sources, args.cache))
+    print(f"{'Station':<24}" + ''.join(f" {name:>16}" for name in table.metrics))
+    for station, row in zip(table.countries, table.values):
+        print(f"{station[:24]:<24}" + ''.join(f" {value:>16.1f}" for value in row))
+    if args.output:
+        write_metrics(args.output, table)
+    print(f"\n{len(table.countries)} Stationen in {time.perf_counter() - start:.2f} s")
+
+
+if __name__ == '__main__':
+    main()
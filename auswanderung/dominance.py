@@ -0,0 +1,163 @@
+"""Pareto dominance between countries and the efficient frontier.
+
+Country a dominates country b if a has at least b's points on every
+criterion and more on at least one. Under non-negative weights a dominated
+country can at best share first place (see auswanderung.inverse), so it can
+be pruned before the sensitivity analysis or the report rendering.
+
+The dominance graph is kept as a bit matrix: bit a of row b is set if a
+dominates b. Points take few distinct values per criterion, so for every
+criterion and value there is one bitset of the countries that reach it.
+The countries weakly dominating b are the AND of b's bitsets over all
+criteria, less those tied with b everywhere. That is countries x criteria
+x countries / 8 byte operations, done in blocks of rows, and the graph of
+5000 regions takes 3 MB.
+
+Countries are then peeled into fronts: front 0 is the Pareto frontier,
+front k holds the countries whose best dominator is in front k - 1.
+
+Usage: python -m auswanderung.dominance REPORT [--criterion NAME ...]
+"""
+import argparse
+from collections import namedtuple
+
+import numpy as np
+
+from auswanderung.reports import load_report
+from auswanderung.scoring import load_matrix
+
+# Rows of the bit matrix computed per block
+BLOCK = 1024
+
+Dominance = namedtuple('Dominance', ['countries', 'graph', 'dominated_by', 'fronts'])
+Dominance.__doc__ = """Dominance graph of a set of countries.
+
+graph is the packed bit matrix (np.packbits, little bit order) of shape
+(countries, ceil(countries / 8)); bit a of row b is set if a dominates b.
+dominated_by counts the dominators of each country and fronts gives the
+Pareto front of each country, 0 for the frontier.
+"""
+
+
+def level_bitsets(points):
+    """Per criterion and value rank: bitsets of the countries at or above it and exactly at it"""
+    countries, criteria = points.shape
+    ranks = np.empty((countries, criteria), dtype=np.intp)
+    levels = 1
+    for j in range(criteria):
+        _, ranks[:, j] = np.unique(points[:, j], return_inverse=True)
+        levels = max(levels, int(ranks[:, j].max()) + 1 if countries else 1)
+    values = np.arange(levels)[None, :, None]
+    columns = ranks.T[:, None, :]
+    at_least = np.packbits(columns >= values, axis=2, bitorder='little')
+    exactly = np.packbits(columns == values, axis=2, bitorder='little')
+    return ranks, at_least, exactly
+
+
+def dominance_graph(points):
+    """Return the packed bit matrix whose bit a of row b is set if a dominates b"""
+    points = np.asarray(points)
+    countries, criteria = points.shape
+    ranks, at_least, exactly = level_bitsets(points)
+    width = at_least.shape[2]
+    graph = np.zeros((countries, width), dtype=np.uint8)
+    if not criteria:
+        return graph
+    criterion = np.arange(criteria)[None, :]
+    for start in range(0, countries, BLOCK):
+        block = ranks[start:start + BLOCK]
+        weak = np.bitwise_and.reduce(at_least[criterion, block], axis=1)
+        tied = np.bitwise_and.reduce(exactly[criterion, block], axis=1)
+        graph[start:start + BLOCK] = weak & ~tied
+    return graph
+
+
+def dominators(result, country):
+    """Indices of the countries dominating ``country`` (an index)"""
+    row = np.unpackbits(result.graph[country], count=len(result.countries), bitorder='little')
+    return np.flatnonzero(row)
+
+
+def direct_dominators(result, country):
+    """Dominators of ``country`` that do not dominate it through another of its dominators"""
+    above = dominators(result, country)
+    if len(above) < 2:
+        return above
+    indirect = np.bitwise_or.reduce(result.graph[above], axis=0)
+    row = result.graph[country] & ~indirect
+    return np.flatnonzero(np.unpackbits(row, count=len(result.countries), bitorder='little'))
+
+
+def edges(result):
+    """Yield every (dominator, dominated) index pair of the graph"""
+    for start in range(0, len(result.countries), BLOCK):
+        rows = np.unpackbits(result.graph[start:start + BLOCK], axis=1,
+                             count=len(result.countries), bitorder='little')
+        for dominated, dominator in zip(*np.nonzero(rows)):
+            yield int(dominator), int(start + dominated)
+
+
+def dominance(matrix, criteria=None):
+    """Compute the Dominance of the countries of ``matrix``, over ``criteria`` if given"""
+    points = np.asarray(matrix.points)
+    if criteria is not None:
+        index = {name: j for j, name in enumerate(matrix.criteria)}
+        unknown = [name for name in criteria if name not in index]
+        if unknown:
+            raise ValueError(f"unknown criteria: {unknown}")
+        points = points[:, [index[name] for name in criteria]]
+    graph = dominance_graph(points)
+    countries = len(matrix.countries)
+    counts = np.unpackbits(graph, axis=1, count=countries, bitorder='little').sum(axis=1)
+    # A dominator has more points in total, so descending totals are a
+    # topological order and each front follows from finished ones
+    fronts = np.zeros(countries, dtype=np.intp)
+    for b in np.argsort(-points.sum(axis=1, dtype=np.float64), kind='stable'):
+        if counts[b]:
+            above = np.unpackbits(graph[b], count=countries, bitorder='little').astype(bool)
+            fronts[b] = fronts[above].max() + 1
+    return Dominance(tuple(matrix.countries), graph, counts, fronts)
+
+
+def frontier(result):
+    """Names of the countries no other country dominates"""
+    return [country for country, front in zip(result.countries, result.fronts) if front == 0]
+
+
+def prune_rows(matrix_rows, keep):
+    """Return ``matrix_rows`` with only the countries in ``keep``, in their original order"""
+    keep = set(keep)
+    columns = [0] + [j for j, country in enumerate(matrix_rows[0]) if j and country in keep]
+    return [[row[j] for j in columns] for row in matrix_rows]
+
+
+def summary(result):
+    """Return the frontier and every dominated country with its direct dominators"""
+    countries = result.countries
+    lines = [f"Pareto-Front: {', '.join(frontier(result))}"]
+    for b in np.argsort(result.fronts, kind='stable'):
+        if result.fronts[b]:
+            above = ', '.join(countries[a] for a in direct_dominators(result, b))
+            lines.append(f"  {countries[b]:<10} Front {result.fronts[b]}, "
+                         f"{result.dominated_by[b]} Dominatoren, direkt: {above}")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('report', help="report name, e.g. final_v8_tennis_wind")
+    parser.add_argument('--criterion', '-k', action='append',
+                        help="only compare on this criterion (repeatable)")
+    args = parser.parse_args(argv)
+    data = load_report(args.report).DATA
+    if 'matrix_rows' not in data:
+        parser.error(f"{args.report} hat keine Detailmatrix")
+    try:
+        result = dominance(load_matrix(data['matrix_rows']), args.criterion)
+    except ValueError as error:
+        parser.error(str(error))
+    print(summary(result))
+
+
+if __name__ == '__main__':
+    main()
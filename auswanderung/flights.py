@@ -0,0 +1,239 @@
+"""Great-circle distances and flight times to Germany from an airport dataset.
+
+"Nähe DE (Flug)" and "Nähe EU" are typed as "3-4h", "12h" or "24h". Here
+the flight time of a place follows from geometry: the place is matched to
+its nearest airport, and the flight from there to the nearest of the
+REFERENCE_AIRPORTS in Germany is estimated as FLIGHT_OVERHEAD (taxi,
+climb, descent) plus the great-circle distance at CRUISE_SPEED, with
+CONNECTION_HOURS added beyond MAX_NONSTOP km.
+
+The airports come from a local CSV file, either with the columns
+``code``, ``latitude``, ``longitude`` or in the OurAirports layout
+(``iata_code``, ``latitude_deg``, ``longitude_deg``; only airports with
+scheduled service, or of SCHEDULED_TYPES, are kept). Places are a CSV with
+the name in the first column and ``latitude``, ``longitude``, or the
+country codes of COUNTRY_PLACES.
+
+The nearest airport is found through a ``cKDTree`` over the airports as
+unit vectors, where the nearest chord is also the nearest great circle, so
+thousands of towns against tens of thousands of airports are one query.
+The distances from those airports to the reference airports are one
+vectorized haversine over (places, references). Per place the result gives
+
+* ``flight_hours``: the estimated flight to the nearest reference airport,
+  the metric of the Nähe EU rule of auswanderung.rules,
+* ``distance_km``: its great-circle distance,
+* ``airport_km``: the distance from the place to its airport, and
+* ``travel_hours``: the flight plus the way to the airport at GROUND_SPEED.
+
+Usage: python -m auswanderung.flights AIRPORTS.csv [PLACES.csv] [--countries]
+                                      [--output METRICS.csv]
+"""
+import argparse
+import csv
+import time
+from collections import namedtuple
+from pathlib import Path
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from auswanderung.rules import MetricTable, write_metrics
+
+# Mean earth radius in km
+EARTH_RADIUS = 6371.0088
+
+# Hours for taxi, climb and descent, block speed in km/h, and the longest
+# distance flown without a stop; longer trips get a connection
+FLIGHT_OVERHEAD = 0.5
+CRUISE_SPEED = 800.0
+MAX_NONSTOP = 14000.0
+CONNECTION_HOURS = 2.0
+
+# km/h on the way from a place to its airport
+GROUND_SPEED = 60.0
+
+REFERENCE_AIRPORTS = {
+    'FRA': (50.0379, 8.5622),
+    'MUC': (48.3538, 11.7861),
+    'BER': (52.3667, 13.5033),
+    'DUS': (51.2895, 6.7668),
+    'HAM': (53.6304, 9.9882),
+}
+
+# One representative place per country code of the report matrices
+COUNTRY_PLACES = {
+    'AU': (-33.87, 151.21),
+    'CL': (-33.45, -70.67),
+    'CR': (9.93, -84.08),
+    'CY': (34.68, 33.04),
+    'DE': (50.11, 8.68),
+    'ES': (36.72, -4.42),
+    'ES-S': (36.72, -4.42),
+    'KAN': (28.46, -16.25),
+    'NAM': (-22.56, 17.08),
+    'NG': (6.52, 3.38),
+    'NI': (12.11, -86.24),
+    'NZ': (-36.85, 174.76),
+    'SE': (59.33, 18.07),
+    'UY': (-34.90, -56.16),
+}
+
+# Accepted names of the columns, the plain one first
+CODE_COLUMNS = ('code', 'iata_code', 'iata')
+LATITUDE_COLUMNS = ('latitude', 'latitude_deg', 'lat')
+LONGITUDE_COLUMNS = ('longitude', 'longitude_deg', 'lon')
+SCHEDULED_TYPES = ('large_airport', 'medium_airport')
+
+Points = namedtuple('Points', ['names', 'coordinates'])
+Points.__doc__ = """Named points; coordinates is a (points, 2) array of latitude and longitude"""
+
+AirportIndex = namedtuple('AirportIndex', ['airports', 'tree'])
+AirportIndex.__doc__ = """Airports and a cKDTree over their unit vectors"""
+
+Flights = namedtuple('Flights', ['places', 'airports', 'airport_km', 'references', 'distances'])
+Flights.__doc__ = """Nearest airport of every place and its distances to the references.
+
+airports holds the code of each place's airport, airport_km the way to it;
+distances is a (places, references) array in km.
+"""
+
+
+def points(values):
+    """Build Points from ``{name: (latitude, longitude)}``"""
+    return Points(tuple(values), np.array(list(values.values()), dtype=np.float64).reshape(-1, 2))
+
+
+def find_column(path, header, names):
+    for name in names:
+        if name in header:
+            return header.index(name)
+    raise ValueError(f"{path}: none of the columns {', '.join(names)} in the header")
+
+
+def read_airports(path):
+    """Read the airports with a code and coordinates from a CSV file"""
+    with open(path, newline='', encoding='utf-8-sig') as source:
+        reader = csv.reader(source)
+        header = next(reader)
+        code, latitude, longitude = (find_column(path, header, names) for names in
+                                     (CODE_COLUMNS, LATITUDE_COLUMNS, LONGITUDE_COLUMNS))
+        kind = header.index('type') if 'type' in header else None
+        scheduled = header.index('scheduled_service') if 'scheduled_service' in header else None
+        names, coordinates = [], []
+        for row in reader:
+            if len(row) < len(header) or not row[code].strip() \
+                    or not row[latitude].strip() or not row[longitude].strip():
+                continue
+            if scheduled is not None and row[scheduled] != 'yes':
+                continue
+            if scheduled is None and kind is not None and row[kind] not in SCHEDULED_TYPES:
+                continue
+            names.append(row[code].strip())
+            coordinates.append((float(row[latitude]), float(row[longitude])))
+    return Points(tuple(names), np.array(coordinates, dtype=np.float64).reshape(-1, 2))
+
+
+def read_places(path):
+    """Read places from a CSV file: the name first, then ``latitude`` and ``longitude``"""
+    with open(path, newline='', encoding='utf-8-sig') as source:
+        reader = csv.reader(source)
+        header = next(reader)
+        latitude, longitude = (find_column(path, header, names)
+                               for names in (LATITUDE_COLUMNS, LONGITUDE_COLUMNS))
+        rows = [row for row in reader if row]
+    return Points(tuple(row[0] for row in rows),
+                  np.array([(float(row[latitude]), float(row[longitude])) for row in rows],
+                           dtype=np.float64).reshape(-1, 2))
+
+
+def haversine(coordinates, other):
+    """Great-circle distances in km between (n, 2) and (m, 2) coordinates, shape (n, m)"""
+    latitude, longitude = np.radians(coordinates).T
+    other_latitude, other_longitude = np.radians(other).T
+    sine = (np.sin((other_latitude[None, :] - latitude[:, None]) / 2.0) ** 2
+            + np.cos(latitude)[:, None] * np.cos(other_latitude)[None, :]
+            * np.sin((other_longitude[None, :] - longitude[:, None]) / 2.0) ** 2)
+    return 2.0 * EARTH_RADIUS * np.arcsin(np.sqrt(np.clip(sine, 0.0, 1.0)))
+
+
+def unit_vectors(coordinates):
+    """(n, 3) unit vectors of (n, 2) coordinates"""
+    latitude, longitude = np.radians(coordinates).T
+    return np.stack([np.cos(latitude) * np.cos(longitude), np.cos(latitude) * np.sin(longitude),
+                     np.sin(latitude)], axis=1)
+
+
+def airport_index(airports):
+    """AirportIndex over Points of airports"""
+    if not len(airports.names):
+        raise ValueError("no airports to index")
+    return AirportIndex(airports, cKDTree(unit_vectors(airports.coordinates)))
+
+
+def nearest_airports(index, coordinates):
+    """Index of the nearest airport of each (n, 2) coordinate and the distance to it in km"""
+    chords, nearest = index.tree.query(unit_vectors(coordinates))
+    return nearest, 2.0 * EARTH_RADIUS * np.arcsin(np.minimum(chords / 2.0, 1.0))
+
+
+def flight_time(distances):
+    """Estimated hours of flight over great-circle ``distances`` in km"""
+    distances = np.asarray(distances, dtype=np.float64)
+    return (FLIGHT_OVERHEAD + distances / CRUISE_SPEED
+            + np.where(distances > MAX_NONSTOP, CONNECTION_HOURS, 0.0))
+
+
+def flights(places, airports, references=REFERENCE_AIRPORTS):
+    """Flights from the nearest airport of each of ``places`` to the ``references``.
+
+    ``airports`` is Points or an AirportIndex, so one index serves many
+    calls; ``references`` maps codes to coordinates.
+    """
+    index = airports if isinstance(airports, AirportIndex) else airport_index(airports)
+    nearest, airport_km = nearest_airports(index, places.coordinates)
+    references = points(references)
+    distances = haversine(index.airports.coordinates[nearest], references.coordinates)
+    return Flights(tuple(places.names), tuple(index.airports.names[i] for i in nearest),
+                   airport_km, references.names, distances)
+
+
+def flight_metrics(result):
+    """MetricTable of flight hours, flight distance, way to the airport and travel hours"""
+    distance = result.distances.min(axis=1)
+    hours = flight_time(distance)
+    values = np.column_stack([hours, distance, result.airport_km,
+                              hours + result.airport_km / GROUND_SPEED])
+    return MetricTable(result.places, ('flight_hours', 'distance_km', 'airport_km',
+                                       'travel_hours'), values)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('airports', type=Path, help="airport CSV file")
+    parser.add_argument('places', nargs='?', type=Path, help="CSV file of places")
+    parser.add_argument('--countries', action='store_true',
+                        help="the places of COUNTRY_PLACES, named by country code")
+    parser.add_argument('--output', '-o', type=Path, help="write the metrics to this CSV file")
+    args = parser.parse_args(argv)
+    if bool(args.places) == args.countries:
+        parser.error("give either PLACES.csv or --countries")
+    places = points(COUNTRY_PLACES) if args.countries else read_places(args.places)
+    airports = read_airports(args.airports)
+    start = time.perf_counter()
+    result = flights(places, airports)
+    table = flight_metrics(result)
+    seconds = time.perf_counter() - start
+    print(f"{'Ort':<20} {'Flughafen':<9} {'km':>6}"
+          + ''.join(f" {code:>6}" for code in result.references) + f" {'Flug':>6} {'Reise':>6}")
+    for place, airport, row, (hours, _, way, travel) in zip(
+            result.places, result.airports, flight_time(result.distances), table.values):
+        print(f"{place[:20]:<20} {airport[:9]:<9} {way:>6.0f}"
+              + ''.join(f" {value:>5.1f}h" for value in row) + f" {hours:>5.1f}h {travel:>5.1f}h")
+    print(f"\n{len(result.places)} Orte, {len(airports.names)} Flughäfen in {seconds:.2f} s")
+    if args.output:
+        write_metrics(args.output, table)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,173 @@
+"""Group decisions for several families with their own weights.
+
+The reports score "Familie 1" and "Familie 2" with one weight set, though
+the remote Data Architect with two children and the couple looking for
+local jobs weigh Zeitzone or Jobs F2 very differently. Here every family
+has its own weights, scores every country in percent of its own maximum
+and the group ranks countries by one of these compromises:
+
+* ``'weighted_sum'``: the families' percentages weighted by their shares
+  (equal by default, always scaled to sum to 1)
+* ``'nash'``: Nash product of the gains over a disagreement point (0% by
+  default), each raised to the family's share, i.e. their weighted
+  geometric mean; 0 for a country some family gains nothing from
+* ``'regret'``: the largest regret of any family, its distance in percent
+  to that family's own favourite; smaller is better
+
+The group Pareto set holds the countries no other country beats for one
+family without losing for another (auswanderung.dominance on the
+percentages).
+
+Weights may be (families, criteria) for one group or (groups, families,
+criteria) for many; all groups are scored with one matrix multiply.
+
+Usage: python -m auswanderung.group REPORT --family "NAME:CRITERION=WEIGHT;..." ...
+                                    [--share S ...] [--method METHOD]
+"""
+import argparse
+from collections import namedtuple
+
+import numpy as np
+
+from auswanderung.dominance import dominance_graph
+from auswanderung.ranking import check_countries
+from auswanderung.reports import load_report
+from auswanderung.scoring import MAX_POINTS, load_matrix, rank_desc, weight_matrix
+
+METHODS = ('weighted_sum', 'nash', 'regret')
+
+# Groups whose pairwise comparison fits in this many elements are compared
+# by broadcasting; larger ones go through the dominance bitsets
+PARETO_BLOCK = 1 << 22
+
+GroupScores = namedtuple('GroupScores', ['percent', 'weighted_sum', 'nash', 'regret', 'pareto'])
+GroupScores.__doc__ = """Scores of one group, or of many with a leading group axis.
+
+percent has shape ([groups,] families, countries); weighted_sum, nash,
+regret (the largest regret, in points of percent) and pareto (a boolean
+mask) have shape ([groups,] countries).
+"""
+
+
+def family_weights(matrix, families):
+    """(families, criteria) weights: the matrix weights updated by each family's dict"""
+    weights = weight_matrix(families, matrix.criteria, default=np.nan)
+    return np.where(np.isnan(weights), np.asarray(matrix.weights, dtype=np.float64), weights)
+
+
+def group_scores(matrix, weights, shares=None, disagreement=0.0, modifiers=None):
+    """Score every family of every group and combine them into GroupScores"""
+    weights = np.asarray(weights, dtype=np.float64)
+    single = weights.ndim == 2
+    if single:
+        weights = weights[None]
+    if weights.ndim != 3 or weights.shape[2] != len(matrix.criteria):
+        raise ValueError(f"expected weights of shape ([groups,] families, "
+                         f"{len(matrix.criteria)}), got {weights.shape}")
+    families = weights.shape[1]
+    shares = np.full(families, 1.0 / families) if shares is None \
+        else np.asarray(shares, dtype=np.float64)
+    if shares.shape[-1] != families or (shares < 0).any() or (shares.sum(axis=-1) <= 0).any():
+        raise ValueError(f"expected {families} non-negative shares, got {shares}")
+    shares = shares / shares.sum(axis=-1, keepdims=True)
+    modifiers = modifiers or {}
+    check_countries('modifiers', modifiers, matrix.countries, complete=False)
+    offsets = np.array([modifiers.get(country, 0) for country in matrix.countries],
+                       dtype=np.float64)
+
+    totals = weights @ np.asarray(matrix.points, dtype=np.float64).T + offsets
+    max_totals = MAX_POINTS * weights.sum(axis=2, keepdims=True)
+    percent = np.divide(100.0 * totals, max_totals, out=np.zeros_like(totals),
+                        where=max_totals != 0)
+    share_axis = shares[..., :, None]
+    weighted_sum = (share_axis * percent).sum(axis=-2)
+    gains = percent - np.asarray(disagreement, dtype=np.float64)[..., None]
+    logs = np.where(gains > 0, np.log(np.maximum(gains, 1e-300)), -np.inf)
+    # A family with share 0 has no say, even where it gains nothing
+    nash = np.exp(np.where(share_axis > 0, share_axis * logs, 0.0).sum(axis=-2))
+    regret = (percent.max(axis=-1, keepdims=True) - percent).max(axis=-2)
+    scores = GroupScores(percent, weighted_sum, nash, regret, pareto_mask(percent))
+    return GroupScores(*(item[0] for item in scores)) if single else scores
+
+
+def pareto_mask(percent):
+    """(groups, countries) mask of the countries no other country of the group dominates"""
+    groups, families, countries = percent.shape
+    size = countries * countries * families
+    if size > PARETO_BLOCK:
+        return np.stack([~np.unpackbits(dominance_graph(group.T), axis=1, count=countries,
+                                        bitorder='little').any(axis=1) for group in percent])
+    mask = np.empty((groups, countries), dtype=bool)
+    step = max(1, PARETO_BLOCK // size)
+    for start in range(0, groups, step):
+        block = percent[start:start + step, :, :, None]
+        other = percent[start:start + step, :, None, :]
+        # dominated[g, a, b]: country a is dominated by country b
+        dominated = (other >= block).all(axis=1) & (other > block).any(axis=1)
+        mask[start:start + step] = ~dominated.any(axis=2)
+    return mask
+
+
+def group_ranks(scores, method='weighted_sum'):
+    """Competition ranks (1 = best) of the countries of one group under ``method``"""
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {METHODS}, got {method!r}")
+    values = getattr(scores, method)
+    return rank_desc(-values if method == 'regret' else values)
+
+
+def parse_family(text, criteria):
+    """Parse "NAME:CRITERION=WEIGHT;..." into the name and a ``{criterion: weight}`` dict"""
+    name, _, spec = text.partition(':')
+    weights = {}
+    for item in filter(None, (part.strip() for part in spec.split(';'))):
+        criterion, separator, weight = item.rpartition('=')
+        if not separator or criterion.strip() not in criteria:
+            raise ValueError(f"{name}: expected CRITERION=WEIGHT with a known criterion, "
+                             f"got {item!r}")
+        weights[criterion.strip()] = float(weight.replace(',', '.'))
+    return name.strip(), weights
+
+
+def summary(matrix, names, scores, method='weighted_sum'):
+    """Return the group ranking under ``method`` with every family's percentage"""
+    ranks = group_ranks(scores, method)
+    header = ''.join(f" {name[:12]:>12}" for name in names)
+    lines = [f"{'#':>3} {'Land':<10}{header} {'Summe':>7} {'Nash':>7} {'Reue':>6}  Pareto"]
+    for i in np.lexsort((np.arange(len(ranks)), ranks)):
+        values = ''.join(f" {value:>11.0f}%" for value in scores.percent[:, i])
+        lines.append(f"{ranks[i]:>3} {matrix.countries[i]:<10}{values} "
+                     f"{scores.weighted_sum[i]:>6.1f}% {scores.nash[i]:>6.1f}% "
+                     f"{scores.regret[i]:>6.1f}  {'ja' if scores.pareto[i] else ''}")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('report', help="report name, e.g. final_v8_tennis_wind")
+    parser.add_argument('--family', '-f', action='append', required=True,
+                        help='"NAME:CRITERION=WEIGHT;..." - weights differing from the report '
+                             '(repeatable, one per family)')
+    parser.add_argument('--share', '-s', type=float, action='append',
+                        help="share of each family, in --family order (default: equal)")
+    parser.add_argument('--method', '-m', default='weighted_sum',
+                        help=f"ranking method: {', '.join(METHODS)} (default: weighted_sum)")
+    args = parser.parse_args(argv)
+    if args.method not in METHODS:
+        parser.error(f"--method must be one of {', '.join(METHODS)}")
+    if args.share and len(args.share) != len(args.family):
+        parser.error("--share must be given once per --family")
+    data = load_report(args.report).DATA
+    if 'matrix_rows' not in data:
+        parser.error(f"{args.report} hat keine Detailmatrix")
+    matrix = load_matrix(data['matrix_rows'])
+    try:
+        names, families = zip(*(parse_family(text, matrix.criteria) for text in args.family))
+    except ValueError as error:
+        parser.error(str(error))
+    scores = group_scores(matrix, family_weights(matrix, families), args.share)
+    print(summary(matrix, names, scores, args.method))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,196 @@
+"""Smallest weight change under which a given country ranks first.
+
+"What would it take for Zypern to beat Neuseeland?" For country c the
+weights w + d must satisfy, for every other country o,
+
+    (p_c - p_o) . (w + d) + (m_c - m_o) >= margin
+
+with points p, modifiers m and w + d >= 0. By default the weights also
+keep their sum, so totals stay comparable to the maximum. Among all such
+d the solver returns the smallest:
+
+* ``'l1'``: least total absolute change, a linear program (HiGHS via
+  scipy.optimize.linprog). Its solutions change few weights.
+* ``'l2'``: least Euclidean change, a least-distance program solved
+  through non-negative least squares (Lawson and Hanson). Its solutions
+  spread the change over many weights.
+
+The default margin of half a point means a clear win rather than a shared
+first place. A country that another country beats or ties on every
+criterion cannot get ahead by any weights and has no solution.
+
+The constraints of all countries are built from one broadcast difference
+of the points; each country is then solved on its own, since the problems
+are independent and small. Results are cached under a hash of the points,
+weights, modifiers and options, so asking again about the same matrix
+version costs a dictionary lookup.
+
+Usage: python -m auswanderung.inverse REPORT [--norm l1|l2] [--margin M] [--free-total]
+"""
+import argparse
+import hashlib
+from collections import namedtuple
+
+import numpy as np
+from scipy.linalg import null_space
+from scipy.optimize import linprog, nnls
+
+from auswanderung.ranking import check_countries, format_points
+from auswanderung.reports import load_report
+from auswanderung.scoring import load_matrix
+
+NORMS = ('l1', 'l2')
+
+# Solutions of this many matrix versions are kept
+CACHE_SIZE = 64
+
+# Slack allowed when checking a solution against its constraints
+TOLERANCE = 1e-7
+
+WeightChange = namedtuple('WeightChange', ['country', 'feasible', 'distance', 'weights', 'delta'])
+WeightChange.__doc__ = """Smallest weight change that puts ``country`` first.
+
+distance is the L1 or L2 norm of delta and weights the changed weights
+w + delta. Without a solution feasible is False, distance infinite and
+weights and delta are None.
+"""
+
+CACHE = {}
+
+
+def matrix_version(points, weights, offsets, norm, margin, keep_total):
+    """Hash of everything a set of solutions depends on"""
+    digest = hashlib.sha256()
+    for values in (points, weights, offsets):
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        digest.update(str(values.shape).encode())
+        digest.update(values.tobytes())
+    digest.update(f"{norm}:{margin!r}:{keep_total}".encode())
+    return digest.hexdigest()
+
+
+def constraints(points, weights, offsets, margin):
+    """Constraints ``G d >= h`` of every country, as (C, C - 1, K) and (C, C - 1) arrays"""
+    countries = points.shape[0]
+    differences = points[:, None, :] - points[None, :, :]
+    required = margin - (offsets[:, None] - offsets[None, :]) - differences @ weights
+    others = ~np.eye(countries, dtype=bool)
+    return (differences[others].reshape(countries, countries - 1, -1),
+            required[others].reshape(countries, countries - 1))
+
+
+def solve_l1(rows, required, weights, keep_total):
+    """Least total absolute change: minimize sum(u + v) with d = u - v, u, v >= 0"""
+    criteria = len(weights)
+    identity = np.eye(criteria)
+    # G (u - v) >= h and u - v >= -w, written as A_ub x <= b_ub
+    a_ub = np.vstack([np.hstack([-rows, rows]), np.hstack([-identity, identity])])
+    b_ub = np.concatenate([-required, weights])
+    a_eq = np.hstack([np.ones(criteria), -np.ones(criteria)])[None, :] if keep_total else None
+    b_eq = np.zeros(1) if keep_total else None
+    result = linprog(np.ones(2 * criteria), A_ub=a_ub, b_ub=b_ub, A_eq=a_eq, b_eq=b_eq,
+                     bounds=(0, None), method='highs')
+    if result.status != 0:
+        return None
+    return result.x[:criteria] - result.x[criteria:]
+
+
+def least_distance(matrix, bound):
+    """Smallest x with ``matrix @ x >= bound`` via NNLS, or None if there is none"""
+    columns = matrix.shape[1]
+    system = np.vstack([matrix.T, bound[None, :]])
+    target = np.zeros(columns + 1)
+    target[-1] = 1.0
+    solution, _ = nnls(system, target, maxiter=50 * system.shape[1])
+    residual = system @ solution - target
+    if np.linalg.norm(residual) < TOLERANCE or abs(residual[-1]) < TOLERANCE:
+        return None
+    return -residual[:-1] / residual[-1]
+
+
+def solve_l2(rows, required, weights, keep_total):
+    """Least Euclidean change, as a least-distance program"""
+    matrix = np.vstack([rows, np.eye(len(weights))])
+    bound = np.concatenate([required, -weights])
+    if not keep_total:
+        return least_distance(matrix, bound)
+    # d = basis @ z with the basis orthonormal, so |d| = |z| and sum(d) = 0
+    basis = null_space(np.ones((1, len(weights))))
+    reduced = least_distance(matrix @ basis, bound)
+    return None if reduced is None else basis @ reduced
+
+
+SOLVERS = {'l1': solve_l1, 'l2': solve_l2}
+
+
+def inverse_weights(matrix, norm='l1', margin=0.5, modifiers=None, keep_total=True):
+    """Return the WeightChange of every country of ``matrix``, in matrix order"""
+    if norm not in NORMS:
+        raise ValueError(f"norm must be one of {NORMS}, got {norm!r}")
+    modifiers = modifiers or {}
+    check_countries('modifiers', modifiers, matrix.countries, complete=False)
+    points = np.asarray(matrix.points, dtype=np.float64)
+    weights = np.asarray(matrix.weights, dtype=np.float64)
+    offsets = np.array([modifiers.get(country, 0) for country in matrix.countries],
+                       dtype=np.float64)
+    version = matrix_version(points, weights, offsets, norm, margin, keep_total)
+    if version in CACHE:
+        return CACHE[version]
+
+    rows, required = constraints(points, weights, offsets, margin)
+    changes = []
+    for i, country in enumerate(matrix.countries):
+        delta = SOLVERS[norm](rows[i], required[i], weights, keep_total)
+        if delta is not None and ((rows[i] @ delta < required[i] - TOLERANCE).any()
+                                  or (weights + delta < -TOLERANCE).any()):
+            delta = None
+        if delta is None:
+            changes.append(WeightChange(country, False, float('inf'), None, None))
+            continue
+        delta[np.abs(delta) < TOLERANCE] = 0.0
+        distance = np.abs(delta).sum() if norm == 'l1' else np.linalg.norm(delta)
+        changes.append(WeightChange(country, True, float(distance),
+                                    np.maximum(weights + delta, 0.0), delta))
+    changes = tuple(changes)
+    if len(CACHE) >= CACHE_SIZE:
+        del CACHE[next(iter(CACHE))]
+    CACHE[version] = changes
+    return changes
+
+
+def summary(matrix, changes, count=4):
+    """Return the changes as a text table, nearest first, with the largest weight shifts"""
+    lines = [f"{'Land':<12} {'Abstand':>8}  Größte Änderungen"]
+    for change in sorted(changes, key=lambda item: item.distance):
+        if not change.feasible:
+            lines.append(f"{change.country:<12} {'-':>8}  mit keiner Gewichtung vorn")
+            continue
+        largest = [j for j in np.argsort(-np.abs(change.delta), kind='stable')[:count]
+                   if change.delta[j]]
+        shifts = ', '.join(f"{matrix.criteria[j]} x{format_points(round(matrix.weights[j], 2))}"
+                           f" -> x{format_points(round(change.weights[j], 2))}" for j in largest)
+        lines.append(f"{change.country:<12} {change.distance:>8.2f}  {shifts or 'schon vorn'}")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('report', help="report name, e.g. final_v5_zypern")
+    parser.add_argument('--norm', default='l1', help="l1 (few weights change) or l2 (default: l1)")
+    parser.add_argument('--margin', '-m', type=float, default=0.5,
+                        help="points the country must lead by (default: 0.5)")
+    parser.add_argument('--free-total', action='store_true',
+                        help="let the sum of the weights change too")
+    args = parser.parse_args(argv)
+    if args.norm not in NORMS:
+        parser.error(f"--norm must be one of {', '.join(NORMS)}")
+    data = load_report(args.report).DATA
+    if 'matrix_rows' not in data:
+        parser.error(f"{args.report} hat keine Detailmatrix")
+    matrix = load_matrix(data['matrix_rows'])
+    changes = inverse_weights(matrix, args.norm, args.margin, keep_total=not args.free_total)
+    print(summary(matrix, changes))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,228 @@
+"""Columnar on-disk format for score matrices, loaded with NumPy memmaps.
+
+A matrix file holds one matrix and its scenario layers:
+
+    magic (8 bytes) | header length (uint64 LE) | JSON header | columns
+
+Every column starts on a 64-byte boundary and is mapped straight from the
+file, so opening even a 500 x 200 matrix reads only the header and the
+pages are shared between worker processes through the page cache. Columns:
+
+* ``weights``: float64, one per criterion
+* ``points``: int8, (countries, criteria)
+* ``symbols``: uint8 codes into the header's symbol list, (countries, criteria)
+* ``explanations``: int32 indices into the ``strings`` table, (countries, criteria)
+* ``countries``, ``criteria``, ``strings``: string tables, each an int64
+  offsets column (``<name>.offsets``) into a UTF-8 blob (``<name>.data``);
+  explanations are interned, so repeated texts are stored once
+
+Scenario layers (auswanderung.scenarios) are deltas and small by
+construction; they are kept as JSON in the header.
+
+Usage: python -m auswanderung.matrixfile REPORT OUTPUT
+"""
+import json
+import struct
+import sys
+from collections import namedtuple
+from pathlib import Path
+
+import numpy as np
+
+from auswanderung.reports import load_report
+from auswanderung.scenarios import Scenario
+from auswanderung.scoring import Matrix, load_matrix
+
+MAGIC = b'AUSWMTX1'
+ALIGNMENT = 64
+LENGTH = struct.Struct('<Q')
+
+MatrixFile = namedtuple('MatrixFile', ['countries', 'criteria', 'weights', 'points', 'symbols',
+                                       'explanations', 'symbol_table', 'strings', 'layers'])
+MatrixFile.__doc__ = """A matrix mapped from disk.
+
+weights, points, symbols and explanations are read-only memmaps; countries,
+criteria and strings are StringTables. It has the ``points`` and
+``weights`` of a Matrix, so auswanderung.scoring.score accepts it directly.
+"""
+
+
+class StringTable:
+    """Read-only sequence of strings decoded on access from an offsets and a data column"""
+
+    __slots__ = ('offsets', 'data')
+
+    def __init__(self, offsets, data):
+        self.offsets, self.data = offsets, data
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return bytes(self.data[self.offsets[index]:self.offsets[index + 1]]).decode('utf-8')
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def index(self, value):
+        """Position of ``value``; a linear scan, meant for the small name tables"""
+        for i, item in enumerate(self):
+            if item == value:
+                return i
+        raise ValueError(f"{value!r} is not in the table")
+
+
+def string_columns(strings):
+    """Encode strings as an offsets and a data column"""
+    encoded = [text.encode('utf-8') for text in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype='<i8')
+    np.cumsum([len(item) for item in encoded], out=offsets[1:])
+    return offsets, np.frombuffer(b''.join(encoded), dtype=np.uint8)
+
+
+def scenario_to_json(layer):
+    return {
+        'name': layer.name,
+        'add_criteria': {label: {country: list(cell) for country, cell in cells.items()}
+                         for label, cells in layer.add_criteria.items()},
+        'remove_criteria': list(layer.remove_criteria),
+        'add_countries': {country: {name: list(cell) for name, cell in cells.items()}
+                          for country, cells in layer.add_countries.items()},
+        'overrides': [[country, name, list(cell)]
+                      for (country, name), cell in layer.overrides.items()],
+        'modifiers': dict(layer.modifiers),
+    }
+
+
+def scenario_from_json(data):
+    return Scenario(
+        data['name'],
+        {label: {country: tuple(cell) for country, cell in cells.items()}
+         for label, cells in data['add_criteria'].items()},
+        tuple(data['remove_criteria']),
+        {country: {name: tuple(cell) for name, cell in cells.items()}
+         for country, cells in data['add_countries'].items()},
+        {(country, name): tuple(cell) for country, name, cell in data['overrides']},
+        dict(data['modifiers']),
+    )
+
+
+def write_matrix(path, matrix, layers=()):
+    """Write a scoring.Matrix and its scenario layers to ``path``"""
+    symbol_table, symbol_codes = [], {}
+    strings, string_codes = [], {}
+    symbols = np.empty(matrix.points.shape, dtype=np.uint8)
+    explanations = np.empty(matrix.points.shape, dtype='<i4')
+    for j, row in enumerate(matrix.cells):
+        for i, (symbol, _, explanation) in enumerate(row):
+            if symbol not in symbol_codes:
+                symbol_codes[symbol] = len(symbol_table)
+                symbol_table.append(symbol)
+            if explanation not in string_codes:
+                string_codes[explanation] = len(strings)
+                strings.append(explanation)
+            symbols[i, j] = symbol_codes[symbol]
+            explanations[i, j] = string_codes[explanation]
+    if len(symbol_table) > 256:
+        raise ValueError(f"at most 256 distinct symbols, got {len(symbol_table)}")
+
+    columns = {
+        'weights': np.asarray(matrix.weights, dtype='<f8'),
+        'points': np.ascontiguousarray(matrix.points, dtype=np.int8),
+        'symbols': symbols,
+        'explanations': explanations,
+    }
+    for name, values in (('countries', matrix.countries), ('criteria', matrix.criteria),
+                         ('strings', strings)):
+        columns[f'{name}.offsets'], columns[f'{name}.data'] = string_columns(values)
+
+    header = {
+        'version': 1,
+        'symbols': symbol_table,
+        'layers': [scenario_to_json(layer) for layer in layers],
+        'columns': {},
+    }
+    # Offsets depend on the header length, which depends on the offsets:
+    # reserve room by laying out with a padded length until it fits
+    reserved = 0
+    while True:
+        offset = align(len(MAGIC) + LENGTH.size + reserved)
+        for name, values in columns.items():
+            header['columns'][name] = {'dtype': values.dtype.str, 'shape': list(values.shape),
+                                       'offset': offset}
+            offset = align(offset + values.nbytes)
+        encoded = json.dumps(header, ensure_ascii=False).encode('utf-8')
+        if len(encoded) <= reserved:
+            break
+        reserved = align(len(encoded))
+    with open(path, 'wb') as output:
+        output.write(MAGIC + LENGTH.pack(reserved) + encoded.ljust(reserved, b' '))
+        for name, values in columns.items():
+            output.seek(header['columns'][name]['offset'])
+            output.write(values.tobytes())
+        output.truncate(offset)
+    return Path(path)
+
+
+def align(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def read_matrix(path):
+    """Map the matrix file at ``path``; only the header is read eagerly"""
+    with open(path, 'rb') as source:
+        if source.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a matrix file")
+        (length,) = LENGTH.unpack(source.read(LENGTH.size))
+        header = json.loads(source.read(length))
+    if header['version'] != 1:
+        raise ValueError(f"{path}: unsupported matrix file version {header['version']}")
+
+    def column(name):
+        spec = header['columns'][name]
+        if not all(spec['shape']):
+            return np.empty(spec['shape'], dtype=spec['dtype'])
+        return np.memmap(path, dtype=spec['dtype'], mode='r', offset=spec['offset'],
+                         shape=tuple(spec['shape']))
+
+    def table(name):
+        return StringTable(column(f'{name}.offsets'), column(f'{name}.data'))
+
+    return MatrixFile(table('countries'), table('criteria'), column('weights'), column('points'),
+                      column('symbols'), column('explanations'), tuple(header['symbols']),
+                      table('strings'), [scenario_from_json(layer) for layer in header['layers']])
+
+
+def to_matrix(matrix_file):
+    """Materialize a MatrixFile as a scoring.Matrix with cell tuples"""
+    symbols = np.asarray(matrix_file.symbols)
+    explanations = np.asarray(matrix_file.explanations)
+    points = np.asarray(matrix_file.points)
+    strings = list(matrix_file.strings)
+    cells = tuple(
+        tuple((matrix_file.symbol_table[symbols[i, j]], str(points[i, j]), strings[explanations[i, j]])
+              for i in range(points.shape[0]))
+        for j in range(points.shape[1]))
+    return Matrix(tuple(matrix_file.countries), tuple(matrix_file.criteria),
+                  np.array(matrix_file.weights), np.ascontiguousarray(points), cells)
+
+
+def main(argv=None):
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) != 2:
+        sys.exit(__doc__.rsplit('\n\n', 1)[-1].strip())
+    data = load_report(args[0]).DATA
+    if 'matrix_rows' not in data:
+        sys.exit(f"{args[0]} hat keine Detailmatrix")
+    path = write_matrix(args[1], load_matrix(data['matrix_rows']))
+    print(f"{args[0]}: {path} ({path.stat().st_size:,} Bytes)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,208 @@
+"""Ranking tables derived from the detail matrix.
+
+The ranking tables of the reports used to be typed by hand next to the
+matrix and drifted from it. Here they are built from the scoring engine:
+the matrix is scored once, sorted once, and every row of every ranking
+table is filled from that single pass. Country names, free-text comments
+and modifiers must cover exactly the countries of the matrix, otherwise
+building the table raises ``ValueError``.
+
+A table is described by its columns, ``(header, field)`` pairs where field
+is one of
+
+* ``'rank'``: competition rank (equal scores share a rank)
+* ``'name'``: the country name from ``names``
+* ``'points'``: final points and maximum, "40/48"
+* ``'basis'``, ``'modifier'``, ``'total'``: points before the modifier,
+  the modifier ("+2", "-4") and points after it; with ``replace`` the
+  modifiers stand in for that criterion, which basis, total and maximum
+  leave out
+* ``'percent'``: final points in percent of the maximum, "83%"
+* ``'note'``: the next free-text entry of ``notes[country]``; only the
+  winner's notes may carry the TROPHY
+* a criterion name: the symbol ("++", "o", "--") the country has there
+
+The narrative around the tables takes its placements from the same pass:
+``placements`` maps every country to its Entry, the ``*_text`` helpers
+format them, and ``check_order`` fails the build when sections written
+for a given order of countries no longer follow the derived ranking.
+``check_recommendations`` fails it when a recommended country no longer
+ranks above every rejected one, and ``recommendations`` orders the
+closing options by rank, so the first choice is always the derived winner.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from auswanderung.scenarios import base, evaluate, scenario
+from auswanderung.scoring import load_matrix
+
+TROPHY = '🏆'
+
+FIELDS = ('rank', 'name', 'points', 'basis', 'modifier', 'total', 'percent', 'note')
+
+Entry = namedtuple('Entry', ['rank', 'country', 'basis', 'modifier', 'total', 'percent'])
+Entry.__doc__ = """One country of a ranking, in points before and after its modifier"""
+
+
+def format_points(value):
+    """Format points the German way: 39.5 -> '39,5', 40.0 -> '40'"""
+    return f"{value:g}".replace('.', ',')
+
+
+def check_countries(what, mapping, countries, complete=True):
+    """Raise ValueError unless ``mapping`` covers ``countries`` (exactly, if ``complete``)"""
+    unknown = sorted(set(mapping) - set(countries))
+    missing = [country for country in countries if country not in mapping] if complete else []
+    if unknown or missing:
+        raise ValueError(f"{what} do not match the matrix: unknown {unknown}, missing {missing}")
+
+
+def ranking(matrix, modifiers=None, replace=None):
+    """Score ``matrix`` once; return its entries best first and the maximum total.
+
+    ``replace`` names a criterion the ``modifiers`` stand in for: it is left
+    out of the totals and the maximum, and every country needs a modifier.
+    """
+    modifiers = modifiers or {}
+    check_countries('modifiers', modifiers, matrix.countries, complete=replace is not None)
+    removed = [] if replace is None else [replace]
+    matrix_base = base(matrix)
+    _, scores = evaluate(matrix_base, scenario('ranking', remove_criteria=removed,
+                                                  modifiers=modifiers))
+    return [Entry(int(scores.ranks[i]), matrix.countries[i],
+                  float(scores.totals[i]) - modifiers.get(matrix.countries[i], 0),
+                  modifiers.get(matrix.countries[i], 0), float(scores.totals[i]),
+                  float(scores.percent[i]))
+            for i in scores.order], scores.max_total
+
+
+def placements(matrix_rows, modifiers=None, replace=None):
+    """Score ``matrix_rows`` once; return ``{country: Entry}`` and the maximum total"""
+    entries, max_total = ranking(load_matrix(matrix_rows), modifiers, replace)
+    return {entry.country: entry for entry in entries}, max_total
+
+
+def score_text(entry):
+    """Points and percent of an Entry: '39,5 Punkte / 90%'"""
+    return f"{format_points(entry.total)} Punkte / {entry.percent:.0f}%"
+
+
+def placement_text(entry):
+    """Rank and percent of an Entry: 'Platz 2, 83%'"""
+    return f"Platz {entry.rank}, {entry.percent:.0f}%"
+
+
+def rank_range(places, countries):
+    """Ranks spanned by ``countries``: '5-8', or '5' for a single rank"""
+    ranks = [places[country].rank for country in countries]
+    low, high = min(ranks), max(ranks)
+    return str(low) if low == high else f"{low}-{high}"
+
+
+def check_order(what, places, countries):
+    """Raise ValueError unless ``countries`` are listed in the order of their derived rank"""
+    check_countries(what, dict.fromkeys(countries), list(places), complete=False)
+    ranks = [places[country].rank for country in countries]
+    if ranks != sorted(ranks):
+        listed = ', '.join(f"{country} ({places[country].rank}.)" for country in countries)
+        raise ValueError(f"{what} do not follow the ranking: {listed}")
+
+
+def check_recommendations(places, recommended, rejected):
+    """Raise ValueError unless every ``recommended`` country ranks above every ``rejected`` one"""
+    check_countries('recommendations', dict.fromkeys(list(recommended) + list(rejected)),
+                    list(places), complete=False)
+    worst = max(recommended, key=lambda country: places[country].rank)
+    best = min(rejected, key=lambda country: places[country].rank)
+    if places[worst].rank >= places[best].rank:
+        raise ValueError(f"recommended {worst} ({places[worst].rank}.) does not rank above "
+                         f"rejected {best} ({places[best].rank}.)")
+
+
+def order_options(places, options):
+    """Sort options ``(countries, title, content)`` by the best rank among their countries.
+
+    Raises ValueError unless the first option holds the derived winner.
+    """
+    for countries, title, _ in options:
+        check_countries(f"recommendation {title!r}", dict.fromkeys(countries), list(places),
+                        complete=False)
+    ordered = sorted(options, key=lambda option: min(places[country].rank
+                                                     for country in option[0]))
+    if all(places[country].rank != 1 for country in ordered[0][0]):
+        winners = [country for country, entry in places.items() if entry.rank == 1]
+        raise ValueError(f"no recommendation holds the winner {winners}")
+    return ordered
+
+
+def recommendations(places, options):
+    """Label closing options ``(countries, title, lines)`` best first: [(heading, lines)].
+
+    Options are ordered by order_options. The first is 'ERSTE WAHL', the
+    others are 'ALTERNATIVE', or 'ALTERNATIVE A', 'B', ... when there are
+    several.
+    """
+    ordered = order_options(places, options)
+    alternatives = len(ordered) - 1
+    labels = ['ERSTE WAHL'] + (['ALTERNATIVE'] if alternatives == 1 else
+                               [f"ALTERNATIVE {chr(ord('A') + i)}" for i in range(alternatives)])
+    return [(f"{label}: {title}", lines) for label, (_, title, lines) in zip(labels, ordered)]
+
+
+def criteria_order(matrix_rows, criteria):
+    """Countries best first by their weighted points in ``criteria``, ties by total points"""
+    matrix = load_matrix(matrix_rows)
+    unknown = [name for name in criteria if name not in matrix.criteria]
+    if unknown:
+        raise ValueError(f"unknown criteria {unknown}")
+    columns = [matrix.criteria.index(name) for name in criteria]
+    part = matrix.points[:, columns] @ matrix.weights[columns]
+    totals = matrix.points @ matrix.weights
+    return [matrix.countries[i] for i in np.lexsort((-totals, -part))]
+
+
+def ranking_table(matrix_rows, columns, names, notes=None, modifiers=None, replace=None):
+    """Build a ranking table (header row first) for ``matrix_rows`` in one sorted pass"""
+    matrix = load_matrix(matrix_rows)
+    check_countries('country names', names, matrix.countries)
+    note_columns = sum(1 for _, field in columns if field == 'note')
+    if note_columns:
+        check_countries('notes', notes or {}, matrix.countries)
+        short = sorted(country for country, texts in notes.items() if len(texts) != note_columns)
+        if short:
+            raise ValueError(f"notes need {note_columns} entries per country: {short}")
+    symbol_of = {name: j for j, name in enumerate(matrix.criteria)}
+    unknown = [field for _, field in columns if field not in FIELDS and field not in symbol_of]
+    if unknown:
+        raise ValueError(f"unknown ranking fields: {unknown}")
+
+    entries, max_total = ranking(matrix, modifiers, replace)
+    if note_columns:
+        trophies = sorted(entry.country for entry in entries if entry.rank != 1
+                          and any(TROPHY in text for text in notes[entry.country]))
+        if trophies:
+            raise ValueError(f"{TROPHY} in the notes of countries that are not first: {trophies}")
+    country_index = {country: i for i, country in enumerate(matrix.countries)}
+    rows = [[header for header, _ in columns]]
+    for entry in entries:
+        values = {
+            'rank': str(entry.rank),
+            'name': names[entry.country],
+            'points': f"{format_points(entry.total)}/{format_points(max_total)}",
+            'basis': format_points(entry.basis),
+            'modifier': f"{entry.modifier:+g}".replace('.', ','),
+            'total': format_points(entry.total),
+            'percent': f"{entry.percent:.0f}%",
+        }
+        texts = iter(notes[entry.country]) if note_columns else None
+        row = []
+        for _, field in columns:
+            if field == 'note':
+                row.append(next(texts))
+            elif field in values:
+                row.append(values[field])
+            else:
+                row.append(matrix.cells[symbol_of[field]][country_index[entry.country]][0])
+        rows.append(row)
+    return rows
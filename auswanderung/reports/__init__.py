@@ -0,0 +1,41 @@
+"""Report definitions.
+
+Every module here is one document variant. It keeps its tables as
+module-level constants collected in ``DATA``, its profile strings in
+``PROFILE``, names its file in ``OUTPUT_FILE`` and builds the document with
+``build_report(profile=None, data=None, on_section=None)``. python-docx is only
+imported inside ``build_report``, so the data can be imported without it.
+
+``on_section(doc, title)`` is called at every banner of the report, before the
+section's content is added; auswanderung.streaming uses it to flush finished
+sections.
+"""
+from importlib import import_module
+
+REPORTS = (
+    'final_document',
+    'final_v3',
+    'final_v4',
+    'final_v5_zypern',
+    'final_v6_corona',
+    'final_v7_korrigiert',
+    'final_v8_tennis_wind',
+    'word_analysis',
+    'word_analysis_styled',
+)
+
+
+def skip_section(doc, title):
+    """Default section hook: do nothing"""
+
+
+def load_report(name):
+    """Import and return the report module called ``name``"""
+    if name not in REPORTS:
+        raise ValueError(f"unknown report: {name}")
+    return import_module(f'{__name__}.{name}')
+
+
+def build_report(name, profile=None, data=None, on_section=None):
+    """Build report ``name``, optionally with another profile or data, and return the Document"""
+    return load_report(name).build_report(profile, data, on_section)
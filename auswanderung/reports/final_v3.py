@@ -0,0 +1,747 @@
+"""Komplett v3: detail matrix with symbol, points and explanation per cell"""
+
+OUTPUT_FILE = 'Auswanderungsanalyse_2025_Komplett_v3.docx'
+
+PROFILE = {
+    'tagline': '500k+ EUR Kapital | Remote IT (Data Architect) | Zwei-Familien-Projekt | Handwerklich kompetent',
+    'extended': 'ERWEITERT: Fließend Englisch | Zeugen Jehovas | Familie 2: Viel Eigenkapital + Vor-Ort-Jobs',
+}
+
+RANKING_COLUMNS = [
+    ('#', 'rank'),
+    ('Land', 'name'),
+    ('Punkte', 'points'),
+    ('%', 'percent'),
+    ('Für euer Profil', 'note'),
+]
+
+COUNTRY_NAMES = {
+    'UY': 'Uruguay',
+    'NZ': 'Neuseeland',
+    'ES-S': 'Spanien (Süden)',
+    'AU': 'Australien',
+    'KAN': 'Kanarische Inseln',
+    'CR': 'Costa Rica',
+    'CL': 'Chile (Mitte)',
+    'DE': 'Deutschland',
+    'SE': 'Schweden',
+    'NI': 'Nicaragua',
+    'NG': 'Nigeria',
+}
+
+RANKING_NOTES = {
+    'UY': ['Günstig + sicher, aber weniger Jobs F2'],
+    'NZ': ['Englisch + Jobs + ZJ + Sicherheit!'],
+    'ES-S': ['EU-Rechte + Sonne + dt. Versammlungen'],
+    'AU': ['Englisch + Jobs, aber Klima extremer'],
+    'KAN': ['EU + bestes Klima + dt. Versammlungen'],
+    'CR': ['Höchster ZJ-Anteil, Zeitzone -7h'],
+    'CL': ['Günstig, Erdbeben, schwerer Dialekt'],
+    'DE': ['Nur als Basis/Backup'],
+    'SE': ['Geopolitisch riskant, kalt'],
+    'NI': ['Rechtsunsicherheit, Ortega-Regime'],
+    'NG': ['Nicht empfohlen - Sicherheitsprobleme'],
+}
+
+MATRIX_ROWS = [
+    # Header row
+    ["Kriterium (Gewicht)", "UY", "NZ", "ES-S", "AU", "KAN", "CR", "CL", "DE", "SE", "NI", "NG"],
+    
+    # Geopolitische Sicherheit x2
+    ["Geopolitische Sicherheit\nx2",
+     ("++", "2", "Neutral"),
+     ("++", "2", "Isoliert"),
+     ("o", "1", "EU-Rand"),
+     ("o", "1", "AUKUS"),
+     ("++", "2", "Weit weg"),
+     ("++", "2", "Kein Militär"),
+     ("++", "2", "Isoliert"),
+     ("--", "0", "NATO-Front"),
+     ("--", "0", "NATO-Ostsee"),
+     ("o", "1", "Instabil"),
+     ("--", "0", "Unsicher")],
+    
+    # Einwanderung (500k + IT) x1.5
+    ["Einwanderung (500k + IT)\nx1.5",
+     ("++", "2", "Sehr einfach"),
+     ("++", "2", "IT auf Liste"),
+     ("++", "2", "EU-Recht"),
+     ("++", "2", "IT auf Liste"),
+     ("++", "2", "EU-Recht"),
+     ("++", "2", "Investor OK"),
+     ("++", "2", "Einfach"),
+     ("++", "2", "EU"),
+     ("++", "2", "EU"),
+     ("o", "1", "Einfach"),
+     ("o", "1", "Kompliziert")],
+    
+    # Arbeiten mit Englisch vor Ort x1.5
+    ["Arbeiten mit Englisch vor Ort\nx1.5",
+     ("o", "1", "Spanisch\nnötig"),
+     ("++", "2", "Mutter-\nsprache"),
+     ("o", "1", "Spanisch\nbesser"),
+     ("++", "2", "Mutter-\nsprache"),
+     ("o", "1", "Spanisch\nbesser"),
+     ("o", "1", "Viel Englisch"),
+     ("--", "0", "Nur Spanisch"),
+     ("++", "2", "Deutsch\nnötig"),
+     ("o", "1", "Schwedisch"),
+     ("o", "1", "Etwas\nEnglisch"),
+     ("o", "1", "Amtssprache")],
+    
+    # Grundstück 2-Familien (10+ ha) x1.5
+    ["Grundstück 2-Familien (10+ ha)\nx1.5",
+     ("++", "2", "50-150k USD"),
+     ("o", "1", "Teuer 500k+"),
+     ("++", "2", "Hinterland\nOK"),
+     ("o", "1", "Teuer"),
+     ("o", "1", "Sehr\nbegrenzt"),
+     ("o", "1", "Gestiegen"),
+     ("++", "2", "Sehr günstig"),
+     ("--", "0", "Sehr teuer"),
+     ("--", "0", "Norden OK"),
+     ("++", "2", "Billig"),
+     ("++", "2", "Risiko")],
+    
+    # Remote-Work Zeitzone (zu DE) x1
+    ["Remote-Work Zeitzone (zu DE)\nx1",
+     ("++", "2", "-4h ideal"),
+     ("--", "0", "+11h schwer"),
+     ("++", "2", "Gleich"),
+     ("--", "0", "+9h schwer"),
+     ("++", "2", "Gleich"),
+     ("o", "1", "-7h OK"),
+     ("o", "1", "-5h OK"),
+     ("++", "2", "Basis"),
+     ("++", "2", "Gleich"),
+     ("o", "1", "-7h OK"),
+     ("o", "1", "+1h gut")],
+    
+    # Selbstversorgung (Klima/Boden) x1
+    ["Selbstversorgung (Klima/Boden)\nx1",
+     ("++", "2", "Ideal"),
+     ("++", "2", "Nordinsel top"),
+     ("++", "2", "Sehr gut"),
+     ("o", "1", "Wasser knapp"),
+     ("o", "1", "Wasser\nknapp"),
+     ("o", "1", "Tropisch"),
+     ("o", "1", "Feucht/kühl"),
+     ("o", "1", "Bürokratie"),
+     ("--", "0", "Kurze Saison"),
+     ("o", "1", "Tropisch"),
+     ("--", "0", "Unsicher")],
+    
+    # Klima (mild, Sonne, Meer) x1
+    ["Klima (mild, Sonne, Meer)\nx1",
+     ("++", "2", "2400h mild"),
+     ("++", "2", "2200h mild"),
+     ("++", "2", "3000h"),
+     ("o", "1", "Extreme"),
+     ("++", "2", "2800h\nperfekt"),
+     ("o", "1", "Tropisch"),
+     ("o", "1", "1700h feucht"),
+     ("o", "1", "1600h"),
+     ("--", "0", "Kalt dunkel"),
+     ("--", "0", "Heiss feucht"),
+     ("--", "0", "Heiss feucht")],
+    
+    # Rechtssicherheit/Eigentum x1.5
+    ["Rechtssicherheit/Eigentum\nx1.5",
+     ("++", "2", "Stabil"),
+     ("++", "2", "Exzellent"),
+     ("++", "2", "EU-Standard"),
+     ("++", "2", "Stark"),
+     ("++", "2", "EU-Standard"),
+     ("++", "2", "Gut"),
+     ("o", "1", "OK"),
+     ("++", "2", "Stark"),
+     ("++", "2", "Stark"),
+     ("--", "0", "Schwach"),
+     ("--", "0", "Korrupt")],
+    
+    # Gesundheitsversorgung x1
+    ["Gesundheitsversorgung\nx1",
+     ("o", "1", "Gut"),
+     ("++", "2", "Sehr gut"),
+     ("++", "2", "Sehr gut"),
+     ("++", "2", "Exzellent"),
+     ("++", "2", "Sehr gut"),
+     ("++", "2", "Gut"),
+     ("o", "1", "OK"),
+     ("++", "2", "Exzellent"),
+     ("++", "2", "Sehr gut"),
+     ("--", "0", "Schwach"),
+     ("--", "0", "Schwach")],
+    
+    # ZJ-Gemeinschaft x2
+    ["ZJ-Gemeinschaft\nx2",
+     ("o", "1", "13k klein"),
+     ("++", "2", "14k aktiv"),
+     ("++", "2", "113k groß"),
+     ("++", "2", "68k aktiv"),
+     ("++", "2", "8k + dt.\nVersamml."),
+     ("++", "2", "28k 0,54%!"),
+     ("++", "2", "79k groß"),
+     ("++", "2", "176k"),
+     ("o", "1", "Klein"),
+     ("o", "1", "Klein"),
+     ("++", "2", "407k!")],
+    
+    # Deutsche ZJ-Versammlungen x1
+    ["Deutsche ZJ-Versammlungen\nx1",
+     ("--", "0", "Keine"),
+     ("--", "0", "Keine"),
+     ("++", "2", "Costa del\nSol"),
+     ("--", "0", "Keine"),
+     ("++", "2", "Teneriffa\nGran Can."),
+     ("--", "0", "Keine"),
+     ("--", "0", "Keine"),
+     ("++", "2", "Überall"),
+     ("--", "0", "Keine"),
+     ("--", "0", "Keine"),
+     ("--", "0", "Keine")],
+    
+    # Jobs für Familie 2 x2
+    ["Jobs für Familie 2\nx2",
+     ("--", "0", "Sehr\nbegrenzt"),
+     ("++", "2", "Arbeits-\nkräftemangel"),
+     ("o", "1", "Hohe\nArbeitslos."),
+     ("++", "2", "Arbeits-\nkräftemangel"),
+     ("o", "1", "Tourismus"),
+     ("o", "1", "Begrenzt"),
+     ("o", "1", "Moderat"),
+     ("++", "2", "Gut"),
+     ("++", "2", "Gut"),
+     ("--", "0", "Riskant"),
+     ("--", "0", "Gefährlich")],
+    
+    # Nähe Europa (Flug) x0.5
+    ["Nähe Europa (Flug)\nx0.5",
+     ("o", "1", "12-14h"),
+     ("--", "0", "24h"),
+     ("++", "2", "2-3h"),
+     ("--", "0", "22h"),
+     ("++", "2", "4h"),
+     ("o", "1", "12h"),
+     ("o", "1", "14h"),
+     ("++", "2", "Basis"),
+     ("++", "2", "1-2h"),
+     ("o", "1", "12h"),
+     ("o", "1", "6h")],
+]
+
+# Closing options (countries, title, lines); the report orders them by derived rank
+RECOMMENDATIONS = [
+    (('NZ',), 'NEUSEELAND', [
+        '• Englisch = Sofortige Integration',
+        '• IT-Skills = Skilled Migrant Visa',
+        '• Arbeitskräftemangel = Jobs für Familie 2',
+        '• Aktive ZJ-Gemeinschaft',
+        '• Maximale geopolitische Sicherheit',
+    ]),
+    (('ES-S', 'KAN'), 'SPANIEN/KANAREN', [
+        '• EU-Rechte, gleiche Zeitzone',
+        '• 2-3h nach DE',
+        '• Deutschsprachige ZJ-Versammlungen',
+    ]),
+]
+
+DATA = {
+    'ranking_columns': RANKING_COLUMNS,
+    'country_names': COUNTRY_NAMES,
+    'ranking_notes': RANKING_NOTES,
+    'matrix_rows': MATRIX_ROWS,
+    'recommendations': RECOMMENDATIONS,
+}
+
+
+def build_report(profile=None, data=None, on_section=None):
+    """Build the report; profile and data default to PROFILE and DATA.
+
+    ``on_section(doc, title)`` is called at the start of every section.
+    """
+    from docx import Document
+    from docx.shared import Pt, Cm, RGBColor
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+
+    from auswanderung.ranking import (check_order, check_recommendations, placement_text,
+                                      placements, rank_range, ranking_table, recommendations,
+                                      score_text)
+    from auswanderung.reports import skip_section
+    from auswanderung.styles import register_styles
+    from auswanderung.tables import create_table_original_style
+    from auswanderung.xmltable import add_matrix_table
+
+    profile = PROFILE if profile is None else profile
+    data = DATA if data is None else data
+    on_section = skip_section if on_section is None else on_section
+
+    # Create document
+    doc = Document()
+    register_styles(doc)
+
+    # Narrow margins
+    for section in doc.sections:
+        section.top_margin = Cm(1.5)
+        section.bottom_margin = Cm(1.5)
+        section.left_margin = Cm(1.5)
+        section.right_margin = Cm(1.5)
+
+    # =============================================================================
+    # TITLE
+    # =============================================================================
+    on_section(doc, 'TITLE')
+    title = doc.add_paragraph()
+    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    run = title.add_run('AUSWANDERUNGSANALYSE 2025')
+    run.bold = True
+    run.font.size = Pt(26)
+
+    subtitle = doc.add_paragraph()
+    subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    run = subtitle.add_run('PERSONALISIERT FÜR EUER PROFIL')
+    run.font.size = Pt(14)
+    run.font.color.rgb = RGBColor(47, 84, 150)
+
+    tagline = doc.add_paragraph()
+    tagline.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    run = tagline.add_run(profile['tagline'])
+    run.font.size = Pt(10)
+    run.font.italic = True
+
+    tagline2 = doc.add_paragraph()
+    tagline2.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    run = tagline2.add_run(profile['extended'])
+    run.font.size = Pt(10)
+    run.font.bold = True
+    run.font.color.rgb = RGBColor(192, 0, 0)
+
+    doc.add_paragraph()
+
+    # =============================================================================
+    # EUER PROFIL - STÄRKEN
+    # =============================================================================
+    on_section(doc, 'EUER PROFIL - STÄRKEN')
+    h = doc.add_paragraph()
+    run = h.add_run('EUER PROFIL - STÄRKEN')
+    run.bold = True
+    run.font.size = Pt(14)
+    run.font.color.rgb = RGBColor(47, 84, 150)
+
+    doc.add_paragraph()
+
+    p1 = doc.add_paragraph()
+    p1.add_run('1. Kapital (500k+ EUR): ').bold = True
+    p1.add_run('Öffnet praktisch alle Türen. Mit Eigenkapital Familie 2 noch mehr Optionen.')
+
+    p2 = doc.add_paragraph()
+    p2.add_run('2. Remote IT-Job (Familie 1): ').bold = True
+    p2.add_run('Stabiles Einkommen. Data Architect öffnet Visa-Optionen (NZ, AU).')
+
+    p3 = doc.add_paragraph()
+    p3.add_run('3. FLIESSEND ENGLISCH (beide Familien): ').bold = True
+    p3.add_run('Öffnet NZ und AU! Keine Sprachbarriere = sofortige Integration.')
+
+    p4 = doc.add_paragraph()
+    p4.add_run('4. Zwei-Familien-Projekt: ').bold = True
+    p4.add_run('Geteilte Kosten, soziales Netz von Tag 1.')
+
+    p5 = doc.add_paragraph()
+    p5.add_run('5. Handwerkliche Kompetenz: ').bold = True
+    p5.add_run('Spart enorm bei Hausbau und Infrastruktur.')
+
+    p6 = doc.add_paragraph()
+    p6.add_run('6. Familie 2 - Eigenkapital + Vor-Ort-Jobs: ').bold = True
+    p6.add_run('Flexibel für lokalen Arbeitsmarkt, keine Zeitzonenbindung.')
+
+    p7 = doc.add_paragraph()
+    p7.add_run('7. Zeugen Jehovas: ').bold = True
+    p7.add_run('Weltweites Netzwerk, sofortige Gemeinschaft in jedem Land.')
+
+    doc.add_paragraph()
+
+    # =============================================================================
+    # GESAMTRANKING
+    # =============================================================================
+    on_section(doc, 'GESAMTRANKING')
+    h = doc.add_paragraph()
+    run = h.add_run('GESAMTRANKING - ANGEPASST AN EUER PROFIL')
+    run.bold = True
+    run.font.size = Pt(14)
+    run.font.color.rgb = RGBColor(47, 84, 150)
+
+    doc.add_paragraph()
+
+    ranking_data = ranking_table(data['matrix_rows'], data['ranking_columns'], data['country_names'],
+                                 data['ranking_notes'])
+    create_table_original_style(doc, ranking_data)
+
+    doc.add_page_break()
+
+    # =============================================================================
+    # DETAILMATRIX - Original style with colored cells
+    # =============================================================================
+    on_section(doc, 'DETAILMATRIX - Original style with colored cells')
+    h = doc.add_paragraph()
+    run = h.add_run('DETAILMATRIX')
+    run.bold = True
+    run.font.size = Pt(16)
+    run.font.color.rgb = RGBColor(47, 84, 150)
+
+    doc.add_paragraph()
+
+    legend = doc.add_paragraph()
+    legend.add_run('Symbole: ').bold = True
+    legend.add_run('++ = Sehr gut (2 Pkt) | o = Mittel (1 Pkt) | -- = Schlecht (0 Pkt)')
+
+    doc.add_paragraph()
+
+    abbrev = doc.add_paragraph()
+    run = abbrev.add_run('Länder: UY=Uruguay, NZ=Neuseeland, ES-S=Spanien Süd, AU=Australien, KAN=Kanaren, CR=Costa Rica, CL=Chile, DE=Deutschland, SE=Schweden, NI=Nicaragua, NG=Nigeria')
+    run.font.size = Pt(8)
+
+    doc.add_paragraph()
+
+    # Matrix data: [Kriterium, Gewicht, UY, NZ, ES-S, AU, KAN, CR, CL, DE, SE, NI, NG]
+    # Each cell: (symbol, points, explanation)
+    matrix_rows = data['matrix_rows']
+
+    # Create the matrix table
+    add_matrix_table(doc, matrix_rows)
+
+    doc.add_page_break()
+
+    # =============================================================================
+    # DETAILANALYSEN
+    # =============================================================================
+    on_section(doc, 'DETAILANALYSEN')
+    h = doc.add_paragraph()
+    run = h.add_run('DETAILANALYSEN - ANGEPASST AN EUER PROFIL')
+    run.bold = True
+    run.font.size = Pt(14)
+    run.font.color.rgb = RGBColor(47, 84, 150)
+
+    doc.add_paragraph()
+
+    places, _ = placements(data['matrix_rows'])
+    recommended = ('ES-S', 'KAN', 'NZ', 'AU', 'CR', 'UY', 'CL')
+    rejected = ('SE', 'NI', 'NG')
+    check_order('Detailanalysen', places, recommended)
+    check_order('Nicht empfohlen', places, rejected)
+    check_recommendations(places, recommended, rejected)
+
+    # SPANIEN
+    h2 = doc.add_paragraph()
+    run = h2.add_run(f"Platz {places['ES-S'].rank}: Spanien Süden ({score_text(places['ES-S'])})")
+    run.bold = True
+    run.font.size = Pt(12)
+    run.font.color.rgb = RGBColor(0, 112, 192)
+
+    p = doc.add_paragraph()
+    p.add_run('Beste Regionen: ').bold = True
+    p.add_run('Costa de la Luz (Huelva), Almería Hinterland, Murcia')
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('EU-Vorteil + Nähe: ').bold = True
+    p.add_run('Im EU-System. 2-3h Flug nach DE. Krankenversicherung, Rente einfach.')
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('ZJ - DEUTSCHSPRACHIGE VERSAMMLUNGEN: ').bold = True
+    p.add_run('~113.000 Verkündiger. An Costa del Sol gibt es DEUTSCHSPRACHIGE Versammlungen! Perfekter Übergang.')
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('Remote-Work: ').bold = True
+    p.add_run('Gleiche Zeitzone! Glasfaser gut ausgebaut.')
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('Familie 2: ').bold = True
+    p.add_run('Schwieriger als NZ wegen hoher Arbeitslosigkeit. ABER: Expat-Gebiete = Vorteile durch Deutsch+Englisch. Mit Eigenkapital: Eigenes Business möglich.')
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('Zahlen: ').bold = True
+    p.add_run('Finca 10 ha: 150-300k EUR. Renovierung: 80-120k. GESAMT: 315-515k EUR.')
+
+    doc.add_paragraph()
+
+    # KANAREN
+    h2 = doc.add_paragraph()
+    run = h2.add_run(f"Platz {places['KAN'].rank}: Kanarische Inseln ({score_text(places['KAN'])})")
+    run.bold = True
+    run.font.size = Pt(12)
+    run.font.color.rgb = RGBColor(0, 112, 192)
+
+    p = doc.add_paragraph()
+    p.add_run('Beste Inseln: ').bold = True
+    p.add_run('Teneriffa, Gran Canaria, La Palma')
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('Bestes Klima Europas + DEUTSCHE VERSAMMLUNGEN: ').bold = True
+    p.add_run('Ganzjährig 18-28°. ~8.000 ZJ mit deutschsprachigen Versammlungen auf Teneriffa und Gran Canaria!')
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('STRATEGIE: ').bold = True
+    p.add_run('Kanaren als Einstieg (1-2 Jahre), dt. Versammlung, dann Festland oder NZ.')
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('Problem: ').bold = True
+    p.add_run('Große Grundstücke begrenzt und teuer. 10+ ha kaum verfügbar.')
+
+    doc.add_paragraph()
+
+    # NEUSEELAND
+    h2 = doc.add_paragraph()
+    run = h2.add_run(f"Platz {places['NZ'].rank}: Neuseeland ({score_text(places['NZ'])})")
+    run.bold = True
+    run.font.size = Pt(12)
+    run.font.color.rgb = RGBColor(0, 112, 192)
+
+    p = doc.add_paragraph()
+    p.add_run('Beste Regionen: ').bold = True
+    p.add_run("Hawke's Bay, Nelson/Tasman, Bay of Plenty, Waikato")
+
+    doc.add_paragraph()
+
+    h3 = doc.add_paragraph()
+    h3.add_run('WARUM NEUSEELAND FÜR EUER PROFIL JETZT PERFEKT IST:').bold = True
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('Euer Englisch ändert alles: ').bold = True
+    p.add_run('Mit fließendem Englisch entfällt die größte Hürde! Ihr könnt ab Tag 1 kommunizieren, arbeiten, Kinder in die Schule schicken. Die Versammlungen der Zeugen Jehovas sind sofort auf Englisch besuchbar.')
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('Familie 1 - IT-Skills öffnen Türen: ').bold = True
+    p.add_run('Data Architect ist auf der New Zealand Skilled Occupation List! Mit nachgewiesenem Remote-Einkommen habt ihr sehr gute Chancen auf ein Skilled Migrant Visa.')
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('Familie 2 - Arbeitsmarkt perfekt: ').bold = True
+    p.add_run('Neuseeland hat ARBEITSKRÄFTEMANGEL: Handwerk, Landwirtschaft, Tourismus, Gesundheit. Mit fließendem Englisch sofortiger Zugang. Mit Eigenkapital auch eigenes Business möglich.')
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('Zeugen Jehovas: ').bold = True
+    p.add_run('~14.000 Verkündiger in ~175 Versammlungen. Gut verteilt, auch ländlich. Kiwi-Mentalität offen und freundlich.')
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('Zeitzone-Lösung: ').bold = True
+    p.add_run('+11-12h vor DE. Familie 1: Async-Arbeit oder NZ/AU-Kunden. Familie 2: Vor Ort = Zeitzone irrelevant!')
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('Konkrete Zahlen:').bold = True
+    doc.add_paragraph("• 10-15 ha Hawke's Bay/Nelson: 300.000-600.000 NZD")
+    doc.add_paragraph('• 2 Häuser bauen: 300.000-500.000 NZD')
+    doc.add_paragraph('• Infrastruktur + Reserve: 210.000 NZD')
+    doc.add_paragraph('• GESAMT: ~810.000-1.310.000 NZD (~460.000-745.000 EUR)')
+    doc.add_paragraph('• MIT EIGENKAPITAL FAMILIE 2: Machbar!')
+
+    doc.add_paragraph()
+
+    # AUSTRALIEN
+    h2 = doc.add_paragraph()
+    run = h2.add_run(f"Platz {places['AU'].rank}: Australien ({score_text(places['AU'])})")
+    run.bold = True
+    run.font.size = Pt(12)
+    run.font.color.rgb = RGBColor(0, 112, 192)
+
+    p = doc.add_paragraph()
+    p.add_run('Regionen: ').bold = True
+    p.add_run('Tasmanien (beste Wahl!), Sunshine Coast, Victoria')
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('Englisch + Jobs: ').bold = True
+    p.add_run('IT auf Skilled List. Arbeitskräftemangel für Familie 2. ~68.000 ZJ.')
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('Nachteile: ').bold = True
+    p.add_run('Klima extremer (Buschbrände, Dürren). Wasserknappheit. Tasmanien = beste Option.')
+
+    doc.add_paragraph()
+
+    # KURZÜBERSICHT
+    h2 = doc.add_paragraph()
+    run = h2.add_run(f"Platz {rank_range(places, ('CR', 'UY', 'CL'))}: Costa Rica, Uruguay, Chile "
+                     f"(Kurzübersicht)")
+    run.bold = True
+    run.font.size = Pt(12)
+    run.font.color.rgb = RGBColor(0, 112, 192)
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run(f"Costa Rica ({placement_text(places['CR'])}): ").bold = True
+    p.add_run('Höchster ZJ-Anteil (0,54%!), kein Militär. ABER: Spanisch nötig, -7h Zeitzone, Jobs begrenzt.')
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run(f"Uruguay ({placement_text(places['UY'])}): ").bold = True
+    p.add_run('War ursprünglich #1! Beste Rechtssicherheit, -4h Zeitzone, günstigste Grundstücke. ABER: Kleinere ZJ (13k), Jobs sehr begrenzt.')
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run(f"Chile ({placement_text(places['CL'])}): ").bold = True
+    p.add_run('Große ZJ (79k), sehr günstig. ABER: Spanisch sehr schwer (Dialekt), Erdbeben.')
+
+    doc.add_paragraph()
+
+    # DEUTSCHLAND
+    h2 = doc.add_paragraph()
+    run = h2.add_run('Zum Vergleich: Deutschland (Ausgangspunkt)')
+    run.bold = True
+    run.font.size = Pt(12)
+    run.font.color.rgb = RGBColor(0, 112, 192)
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run(f"DEUTSCHLAND ({placement_text(places['DE'])}): ").bold = True
+    p.add_run('Kein Auswanderungsziel, sondern eure Basis und euer Backup. Punktet bei ZJ, Jobs und '
+              'Rechtssicherheit, aber: NATO-Front, Bürokratie, teuer, wenig Sonne.')
+
+    doc.add_paragraph()
+
+    # NICHT EMPFOHLEN
+    h2 = doc.add_paragraph()
+    run = h2.add_run('Nicht empfohlen')
+    run.bold = True
+    run.font.size = Pt(12)
+    run.font.color.rgb = RGBColor(192, 0, 0)
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run(f"SCHWEDEN ({placement_text(places['SE'])}): ").bold = True
+    p.add_run('Kalt, dunkel, NATO nahe Russland.')
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run(f"NICARAGUA ({placement_text(places['NI'])}): ").bold = True
+    p.add_run('Ortega-Regime, Rechtsunsicherheit, willkürliche Enteignungen.')
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run(f"NIGERIA ({placement_text(places['NG'])}): ").bold = True
+    p.add_run('NICHT empfohlen! Massive Sicherheitsprobleme, Entführungen, Korruption. Große ZJ (407k) wiegt das nicht auf.')
+
+    doc.add_page_break()
+
+    # =============================================================================
+    # AKTIONSPLAN
+    # =============================================================================
+    on_section(doc, 'AKTIONSPLAN')
+    h = doc.add_paragraph()
+    run = h.add_run('AKTIONSPLAN - 24 MONATE BIS ZUM HOMESTEAD')
+    run.bold = True
+    run.font.size = Pt(14)
+    run.font.color.rgb = RGBColor(47, 84, 150)
+
+    doc.add_paragraph()
+
+    h3 = doc.add_paragraph()
+    h3.add_run('Phase 1: Vorbereitung in Deutschland (Monat 1-6)').bold = True
+    doc.add_paragraph('• Familientreffen: Finale Entscheidung NZ vs. Spanien')
+    doc.add_paragraph('• immigration.govt.nz studieren, Skills Assessment beantragen')
+    doc.add_paragraph('• Kontakt zu ZJ-Versammlungen im Zielland (jw.org)')
+    doc.add_paragraph('• Falls Spanien: Spanischkurs beginnen')
+    doc.add_paragraph('• Steuerberater: Wegzugsbesteuerung klären')
+    doc.add_paragraph('• Scouting-Reise buchen (4-6 Wochen)')
+
+    h3 = doc.add_paragraph()
+    h3.add_run('Phase 2: Scouting-Reise (Monat 6-9)').bold = True
+    doc.add_paragraph("• 4-6 Wochen im Zielland erkunden")
+    doc.add_paragraph('• Versammlungen besuchen (vorab Kontakt!)')
+    doc.add_paragraph('• Grundstücke besichtigen, Makler treffen')
+    doc.add_paragraph('• Familie 2: Mit Arbeitgebern sprechen')
+    doc.add_paragraph('• Internet testen, Schulen anschauen')
+
+    h3 = doc.add_paragraph()
+    h3.add_run('Phase 3: Entscheidung und Visa (Monat 9-15)').bold = True
+    doc.add_paragraph('• Finale Länder-/Regionswahl')
+    doc.add_paragraph('• Visa-Anträge einreichen')
+    doc.add_paragraph('• Immobilie identifizieren, Kaufverhandlung')
+
+    h3 = doc.add_paragraph()
+    h3.add_run('Phase 4: Soft Landing (Monat 15-21)').bold = True
+    doc.add_paragraph('• Familie 2 ggf. vorausreisen')
+    doc.add_paragraph('• Grundstückskauf abschließen')
+    doc.add_paragraph('• Familie 1: Umzug zum Schuljahresbeginn (NZ=Feb, ES=Sep)')
+
+    h3 = doc.add_paragraph()
+    h3.add_run('Phase 5: Aufbau (Monat 21-36)').bold = True
+    doc.add_paragraph('• Hausbau/Renovierung')
+    doc.add_paragraph('• Selbstversorgung starten')
+    doc.add_paragraph('• Aktiv in Versammlung integrieren')
+
+    doc.add_paragraph()
+
+    # =============================================================================
+    # EMPFEHLUNG
+    # =============================================================================
+    on_section(doc, 'EMPFEHLUNG')
+    h = doc.add_paragraph()
+    run = h.add_run('UNSERE EMPFEHLUNG FÜR EUCH')
+    run.bold = True
+    run.font.size = Pt(14)
+    run.font.color.rgb = RGBColor(47, 84, 150)
+
+    doc.add_paragraph()
+
+    for heading, lines in recommendations(places, data['recommendations']):
+        p = doc.add_paragraph()
+        run = p.add_run(heading)
+        run.bold = True
+        run.font.size = Pt(14)
+        run.font.color.rgb = RGBColor(0, 112, 192)
+
+        for line in lines:
+            doc.add_paragraph(line)
+
+        doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    run = p.add_run('NÄCHSTER SCHRITT: ')
+    run.bold = True
+    p.add_run('4-6 Wochen Scouting-Reise Sommer/Herbst 2025 planen!')
+
+    doc.add_paragraph()
+    doc.add_paragraph('─' * 70)
+
+    p = doc.add_paragraph()
+    p.add_run('Erstellt: Januar 2025 | Basierend auf Auswanderungsanalyse 2025').font.size = Pt(9)
+    p = doc.add_paragraph()
+    p.add_run('Erweitert: ZJ | Englisch | Eigenkapital F2 | Vor-Ort-Jobs | Familie 1 (40J, 2 Kinder) | Familie 2 (50J)').font.size = Pt(9)
+
+    return doc
@@ -0,0 +1,849 @@
+"""FINAL MIT CORONA (v6): adds the Corona restrictiveness criterion and modifier"""
+
+OUTPUT_FILE = 'Auswanderungsanalyse_2025_FINAL_MIT_CORONA.docx'
+
+PROFILE = {
+    'tagline': '500k+ EUR Kapital | Remote IT (Data Architect) | Zwei-Familien-Projekt | Handwerklich kompetent',
+    'extended': 'ERWEITERT: Englisch | ZJ | Eigenkapital F2 | Krise | Corona-Restriktivität | Zypern',
+    'families': 'Familie 1: 40J, 2 Kinder (12+14) | Familie 2: 50J, keine Kinder',
+}
+
+CORONA_DATA = [
+    ['Land', 'Restriktivität', 'Maßnahmen während Corona', 'Bewertung für Freiheit'],
+    ['Neuseeland', 'EXTREM', 'Zero-COVID, Grenzen 2 Jahre zu, MIQ-Hotels, strenge Lockdowns', '-4 Pkt'],
+    ['Australien', 'EXTREM', 'Melbourne: 262 Tage Lockdown (Weltrekord!), Grenzen zu, Polizei hart', '-4 Pkt'],
+    ['Deutschland', 'HOCH', '2G/3G-Regeln, Lockdowns, Maskenpflicht, Impfdruck', '-4 Pkt'],
+    ['Spanien', 'HOCH', 'Strengste Ausgangssperren Europas, Polizei auf Straßen', '-2 Pkt'],
+    ['Kanaren', 'HOCH', 'Wie Spanien Festland', '-2 Pkt'],
+    ['Zypern', 'HOCH', 'Lockdowns, SafePass, Testpflichten', '-2 Pkt'],
+    ['Chile', 'HOCH', 'Strenge Lockdowns, Ausgangssperren', '-2 Pkt'],
+    ['Costa Rica', 'MODERAT', 'Moderate Maßnahmen, Grenzen zeitweise zu', '0 Pkt'],
+    ['Uruguay', 'NIEDRIG', '"Libertad Responsable" - Keine harten Lockdowns!', '+2 Pkt'],
+    ['Schweden', 'NIEDRIG', 'SONDERWEG: Keine Lockdowns, freiwillige Maßnahmen', '+2 Pkt'],
+    ['Namibia', 'MODERAT', 'Maßnahmen vorhanden, aber wenig durchgesetzt', '0 Pkt'],
+    ['Nicaragua', 'SEHR NIEDRIG', 'Ortega ignorierte Corona weitgehend', '+2 Pkt'],
+    ['Nigeria', 'NIEDRIG', 'Wenig Kapazität für Durchsetzung', '+2 Pkt'],
+]
+
+RANKING_COLUMNS = [
+    ('#', 'rank'),
+    ('Land', 'name'),
+    ('Basis', 'basis'),
+    ('Corona', 'modifier'),
+    ('Final', 'total'),
+    ('%', 'percent'),
+    ('Kurzbewertung', 'note'),
+]
+
+COUNTRY_NAMES = {
+    'UY': 'Uruguay',
+    'NZ': 'Neuseeland',
+    'ES-S': 'Spanien Süd',
+    'AU': 'Australien',
+    'CY': 'Zypern',
+    'KAN': 'Kanaren',
+    'CR': 'Costa Rica',
+    'CL': 'Chile',
+    'NAM': 'Namibia',
+    'DE': 'Deutschland',
+    'SE': 'Schweden',
+    'NI': 'Nicaragua',
+    'NG': 'Nigeria',
+}
+
+RANKING_NOTES = {
+    'UY': ['KRISE + FREIHEIT! Neutral, selbstversorgend, liberal!'],
+    'NZ': ['🏆 Top für alles AUSSER Freiheit bei Krisen'],
+    'ES-S': ['EU-Rechte, Sonne, aber strenge Lockdowns'],
+    'AU': ['ACHTUNG: Extremste Lockdowns der Welt!'],
+    'CY': ['EU + Englisch, aber strenge Maßnahmen'],
+    'KAN': ['Bestes Klima, aber wie Spanien restriktiv'],
+    'CR': ['Kein Militär, krisensicher, moderate Corona-Politik'],
+    'CL': ['Isoliert, selbstvers., aber strenge Maßnahmen'],
+    'NAM': ['Günstig, Englisch, moderate Corona-Politik'],
+    'DE': ['NATO-Front + Extremer Corona-Kurs'],
+    'SE': ['Liberalste Corona-Politik, aber NATO-Front + kalt'],
+    'NI': ['Liberal bei Corona, aber instabil + Diktatur'],
+    'NG': ['Nicht empfohlen trotz liberaler Corona-Politik'],
+}
+
+# Corona modifier per country on the four-level scale of CORONA_POLICIES. In
+# the rankings it replaces CORONA_CRITERION, so Corona counts once.
+CORONA_MODIFIERS = {
+    'UY': 2,
+    'NZ': -4,
+    'ES-S': -2,
+    'AU': -4,
+    'CY': -2,
+    'KAN': -2,
+    'CR': 0,
+    'CL': -2,
+    'NAM': 0,
+    'DE': -4,
+    'SE': 2,
+    'NI': 2,
+    'NG': 2,
+}
+
+# Matrix criterion the Corona modifiers replace in the rankings
+CORONA_CRITERION = 'CORONA-Restriktivität (Freiheit)'
+
+# Corona policy per modifier
+CORONA_POLICIES = {
+    2: 'Liberale Politik',
+    0: 'Moderate Politik',
+    -2: 'Strenge Politik',
+    -4: 'EXTREME Politik',
+}
+
+MATRIX_ROWS = [
+    ["Kriterium (Gewicht)", "UY", "NZ", "ES-S", "AU", "CY", "KAN", "CR", "CL", "NAM", "DE", "SE", "NI", "NG"],
+    
+    ["Geopolitische Sicherheit\nx2",
+     ("++", "2", "Neutral"),
+     ("++", "2", "Isoliert"),
+     ("o", "1", "EU-Rand"),
+     ("o", "1", "AUKUS"),
+     ("o", "1", "Geteilt"),
+     ("++", "2", "Weit weg"),
+     ("++", "2", "Kein Militär"),
+     ("++", "2", "Isoliert"),
+     ("o", "1", "Stabil"),
+     ("--", "0", "NATO-Front"),
+     ("--", "0", "NATO-Ostsee"),
+     ("o", "1", "Instabil"),
+     ("--", "0", "Unsicher")],
+    
+    ["Einwanderung (500k + IT)\nx1.5",
+     ("++", "2", "Sehr einfach"),
+     ("++", "2", "IT auf Liste"),
+     ("++", "2", "EU-Recht"),
+     ("++", "2", "IT auf Liste"),
+     ("++", "2", "EU-Recht"),
+     ("++", "2", "EU-Recht"),
+     ("++", "2", "Investor OK"),
+     ("++", "2", "Einfach"),
+     ("++", "2", "Einfach"),
+     ("++", "2", "EU"),
+     ("++", "2", "EU"),
+     ("o", "1", "Einfach"),
+     ("o", "1", "Kompliziert")],
+    
+    ["Arbeiten mit Englisch\nx1.5",
+     ("o", "1", "Spanisch"),
+     ("++", "2", "Mutter-\nsprache"),
+     ("o", "1", "Spanisch"),
+     ("++", "2", "Mutter-\nsprache"),
+     ("++", "2", "Weit\nverbreitet!"),
+     ("o", "1", "Spanisch"),
+     ("o", "1", "Englisch OK"),
+     ("--", "0", "Nur Spanisch"),
+     ("++", "2", "Amts-\nsprache!"),
+     ("o", "1", "Deutsch"),
+     ("o", "1", "Schwedisch"),
+     ("o", "1", "Spanisch"),
+     ("o", "1", "Amtssprache")],
+    
+    ["Grundstück 10+ ha\nx1.5",
+     ("++", "2", "50-150k USD"),
+     ("o", "1", "Teuer 500k+"),
+     ("++", "2", "Hinterland"),
+     ("o", "1", "Teuer"),
+     ("o", "1", "Begrenzt"),
+     ("o", "1", "Begrenzt"),
+     ("o", "1", "Gestiegen"),
+     ("++", "2", "Günstig"),
+     ("++", "2", "Sehr günstig"),
+     ("--", "0", "Sehr teuer"),
+     ("--", "0", "OK"),
+     ("++", "2", "Billig"),
+     ("++", "2", "Risiko")],
+    
+    ["Remote-Work Zeitzone\nx1",
+     ("++", "2", "-4h ideal"),
+     ("--", "0", "+11h schwer"),
+     ("++", "2", "Gleich"),
+     ("--", "0", "+9h schwer"),
+     ("++", "2", "+1h gut"),
+     ("++", "2", "Gleich"),
+     ("o", "1", "-7h OK"),
+     ("o", "1", "-5h OK"),
+     ("++", "2", "+1h gut"),
+     ("++", "2", "Basis"),
+     ("++", "2", "Gleich"),
+     ("o", "1", "-7h OK"),
+     ("o", "1", "+1h gut")],
+    
+    ["Selbstversorgung\nx1",
+     ("++", "2", "Ideal"),
+     ("++", "2", "Nordinsel"),
+     ("++", "2", "Sehr gut"),
+     ("o", "1", "Wasser"),
+     ("o", "1", "Wasser"),
+     ("o", "1", "Wasser"),
+     ("o", "1", "Tropisch"),
+     ("o", "1", "Feucht"),
+     ("o", "1", "Trocken"),
+     ("o", "1", "Bürokratie"),
+     ("--", "0", "Kurz"),
+     ("o", "1", "Tropisch"),
+     ("--", "0", "Unsicher")],
+    
+    ["Klima (Sonne, mild)\nx1",
+     ("++", "2", "2400h mild"),
+     ("++", "2", "2200h mild"),
+     ("++", "2", "3000h"),
+     ("o", "1", "Extreme"),
+     ("++", "2", "3300h!"),
+     ("++", "2", "2800h"),
+     ("o", "1", "Tropisch"),
+     ("o", "1", "1700h"),
+     ("++", "2", "3000h"),
+     ("o", "1", "1600h"),
+     ("--", "0", "Kalt"),
+     ("--", "0", "Heiss"),
+     ("--", "0", "Heiss")],
+    
+    ["Rechtssicherheit\nx1.5",
+     ("++", "2", "Stabil"),
+     ("++", "2", "Exzellent"),
+     ("++", "2", "EU"),
+     ("++", "2", "Stark"),
+     ("++", "2", "EU"),
+     ("++", "2", "EU"),
+     ("++", "2", "Gut"),
+     ("o", "1", "OK"),
+     ("o", "1", "OK"),
+     ("++", "2", "Stark"),
+     ("++", "2", "Stark"),
+     ("--", "0", "Schwach"),
+     ("--", "0", "Korrupt")],
+    
+    ["Gesundheitsversorgung\nx1",
+     ("o", "1", "Gut"),
+     ("++", "2", "Sehr gut"),
+     ("++", "2", "Sehr gut"),
+     ("++", "2", "Exzellent"),
+     ("++", "2", "Gut"),
+     ("++", "2", "Sehr gut"),
+     ("++", "2", "Gut"),
+     ("o", "1", "OK"),
+     ("o", "1", "Begrenzt"),
+     ("++", "2", "Exzellent"),
+     ("++", "2", "Sehr gut"),
+     ("--", "0", "Schwach"),
+     ("--", "0", "Schwach")],
+    
+    ["Lebenserwartung\nx1",
+     ("++", "2", "78 Jahre"),
+     ("++", "2", "83 Jahre"),
+     ("++", "2", "84 Jahre"),
+     ("++", "2", "84 Jahre"),
+     ("++", "2", "81 Jahre"),
+     ("++", "2", "84 Jahre"),
+     ("++", "2", "80 Jahre"),
+     ("++", "2", "80 Jahre"),
+     ("o", "1", "66 Jahre"),
+     ("++", "2", "81 Jahre"),
+     ("++", "2", "83 Jahre"),
+     ("o", "1", "75 Jahre"),
+     ("--", "0", "55 Jahre")],
+    
+    ["Westlicher Lebensstil\nx0.5",
+     ("++", "2", "Voll"),
+     ("++", "2", "Voll"),
+     ("++", "2", "Voll"),
+     ("++", "2", "Voll"),
+     ("++", "2", "Voll"),
+     ("++", "2", "Voll"),
+     ("++", "2", "Gut"),
+     ("o", "1", "Meist"),
+     ("o", "1", "Teilweise"),
+     ("++", "2", "Voll"),
+     ("++", "2", "Voll"),
+     ("o", "1", "Begrenzt"),
+     ("o", "1", "Begrenzt")],
+    
+    ["ZJ-Gemeinschaft\nx2",
+     ("o", "1", "13k klein"),
+     ("++", "2", "14k aktiv"),
+     ("++", "2", "113k groß"),
+     ("++", "2", "68k aktiv"),
+     ("o", "1", "1-2k klein"),
+     ("++", "2", "8k + dt."),
+     ("++", "2", "28k 0,54%!"),
+     ("++", "2", "79k groß"),
+     ("o", "1", "3k klein"),
+     ("++", "2", "176k"),
+     ("o", "1", "Klein"),
+     ("o", "1", "Klein"),
+     ("++", "2", "407k!")],
+    
+    ["ZJ in Eurer Sprache\n(EN/DE) x1",
+     ("o", "1", "Spanisch"),
+     ("++", "2", "ENGLISCH!"),
+     ("++", "2", "Dt. Vers."),
+     ("++", "2", "ENGLISCH!"),
+     ("++", "2", "ENGLISCH!"),
+     ("++", "2", "Dt. Vers."),
+     ("o", "1", "Spanisch"),
+     ("o", "1", "Spanisch"),
+     ("++", "2", "ENGLISCH!"),
+     ("++", "2", "DEUTSCH!"),
+     ("o", "1", "Schwedisch"),
+     ("o", "1", "Spanisch"),
+     ("++", "2", "ENGLISCH!")],
+    
+    ["Jobs für Familie 2\nx2",
+     ("--", "0", "Begrenzt"),
+     ("++", "2", "Mangel!"),
+     ("o", "1", "Arbeitslos."),
+     ("++", "2", "Mangel!"),
+     ("o", "1", "Tourismus"),
+     ("o", "1", "Tourismus"),
+     ("o", "1", "Begrenzt"),
+     ("o", "1", "Moderat"),
+     ("o", "1", "Begrenzt"),
+     ("++", "2", "Gut"),
+     ("++", "2", "Gut"),
+     ("--", "0", "Riskant"),
+     ("--", "0", "Gefährlich")],
+    
+    ["Nähe Europa (Flug)\nx0.5",
+     ("o", "1", "12-14h"),
+     ("--", "0", "24h"),
+     ("++", "2", "2-3h"),
+     ("--", "0", "22h"),
+     ("++", "2", "3-4h"),
+     ("++", "2", "4h"),
+     ("o", "1", "12h"),
+     ("o", "1", "14h"),
+     ("o", "1", "10h"),
+     ("++", "2", "Basis"),
+     ("++", "2", "1-2h"),
+     ("o", "1", "12h"),
+     ("o", "1", "6h")],
+    
+    ["KRISE: Russland-NATO\nx2",
+     ("++", "2", "Neutral"),
+     ("++", "2", "Isoliert"),
+     ("o", "1", "NATO Rand"),
+     ("o", "1", "AUKUS"),
+     ("o", "1", "Nahost"),
+     ("o", "1", "NATO weit"),
+     ("++", "2", "Neutral!"),
+     ("++", "2", "Isoliert"),
+     ("o", "1", "Import"),
+     ("--", "0", "FRONT!"),
+     ("--", "0", "FRONT!"),
+     ("o", "1", "RU-freund."),
+     ("--", "0", "Unruhen")],
+    
+    ["Pflege im Alter\nx1",
+     ("o", "1", "Gut"),
+     ("++", "2", "Sehr gut"),
+     ("++", "2", "EU"),
+     ("++", "2", "Exzellent"),
+     ("++", "2", "EU"),
+     ("++", "2", "EU"),
+     ("o", "1", "OK"),
+     ("o", "1", "Moderat"),
+     ("--", "0", "Begrenzt"),
+     ("++", "2", "Exzellent"),
+     ("++", "2", "Exzellent"),
+     ("--", "0", "Schwach"),
+     ("--", "0", "Schwach")],
+    
+    # NEU: Corona-Restriktivität
+    ["CORONA-Restriktivität\n(Freiheit) x2",
+     ("++", "2", "Liberal!\nKein Lockdown"),
+     ("--", "0", "EXTREM!\nZero-COVID"),
+     ("o", "1", "Streng,\nAusgangsp."),
+     ("--", "0", "EXTREM!\n262 Tage LD"),
+     ("o", "1", "Streng,\nSafePass"),
+     ("o", "1", "Streng,\nwie Spanien"),
+     ("o", "1", "Moderat"),
+     ("o", "1", "Streng"),
+     ("o", "1", "Moderat"),
+     ("--", "0", "EXTREM!\n2G/3G"),
+     ("++", "2", "LIBERAL!\nSonderweg"),
+     ("++", "2", "Sehr\nliberal"),
+     ("++", "2", "Kaum\nMaßnahmen")],
+]
+
+FINAL_RANKING_COLUMNS = [
+    ('#', 'rank'),
+    ('Land', 'name'),
+    ('Score', 'percent'),
+    ('Für euch wenn...', 'note'),
+]
+
+FINAL_RANKING_NAMES = {
+    'UY': '🇺🇾 Uruguay',
+    'NZ': '🇳🇿 Neuseeland',
+    'ES-S': '🇪🇸 Spanien Süd',
+    'AU': '🇦🇺 Australien',
+    'CY': '🇨🇾 Zypern',
+    'KAN': '🇮🇨 Kanaren',
+    'CR': '🇨🇷 Costa Rica',
+    'CL': '🇨🇱 Chile',
+    'NAM': '🇳🇦 Namibia',
+    'DE': '🇩🇪 Deutschland',
+    'SE': '🇸🇪 Schweden',
+    'NI': '🇳🇮 Nicaragua',
+    'NG': '🇳🇬 Nigeria',
+}
+
+FINAL_RANKING_NOTES = {
+    'UY': ['Freiheit + Krisensicherheit > alles'],
+    'NZ': ['Englisch + Jobs > Freiheit'],
+    'ES-S': ['EU-Rechte + Sonne + Selbstversorgung'],
+    'AU': ['⚠️ ACHTUNG: Extremste Lockdowns!'],
+    'CY': ['EU + Englisch + Nähe zu DE wichtig'],
+    'KAN': ['Bestes Klima, aber restriktiv wie ES'],
+    'CR': ['Neutralität + kein Militär wichtig'],
+    'CL': ['Isoliert + günstig, aber Spanisch'],
+    'NAM': ['Abenteuer + günstig + Englisch'],
+    'DE': ['❌ NATO-Front + Corona extrem'],
+    'SE': ['Liberal aber kalt + NATO-Front'],
+    'NI': ['❌ Diktatur, nicht empfohlen'],
+    'NG': ['❌ Nicht empfohlen'],
+}
+
+# Closing options (countries, theme, (country blocks, condition, choice)); the report
+# orders them by derived rank. A block is (country, label, heading suffix, lines).
+FINAL_OPTIONS = [
+    (('UY', 'CR'), 'FREIHEIT + KRISENSICHERHEIT PRIORISIERT', ([
+        ('UY', '🇺🇾 URUGUAY', '', [
+            '• Liberale Corona-Politik ("Libertad Responsable")',
+            '• NEUTRAL - Keine Militärbündnisse',
+            '• SELBSTVERSORGEND - Agrar-Exporter',
+            '• Stabile Demokratie ("Schweiz Südamerikas")',
+            '• Perfekte Zeitzone für Remote-Work',
+            '• Günstige Grundstücke',
+            '• NACHTEILE: Spanisch nötig, begrenzte Jobs für F2, kleine ZJ-Gemeinschaft',
+        ]),
+        ('CR', '🇨🇷 COSTA RICA', '', [
+            '• KEIN MILITÄR seit 1948!',
+            '• Moderate Corona-Politik',
+            '• Höchster ZJ-Bevölkerungsanteil (0,54%)',
+            '• Neutral, kann sich nicht an Kriegen beteiligen',
+            '• NACHTEILE: Tropisch, Spanisch nötig, Zeitzone grenzwertig',
+        ]),
+    ], 'Wenn ihr aus der COVID-Erfahrung gelernt habt und Freiheit auch in Krisenzeiten wichtig ist:',
+        '→ URUGUAY oder COSTA RICA')),
+    (('NZ',), 'STABILITÄT + ENGLISCH PRIORISIERT (aber Restriktionsrisiko!)', ([
+        ('NZ', '🇳🇿 NEUSEELAND', ' - Top für alles AUSSER Freiheit', [
+            '• Englisch, Jobs für F2, ZJ auf Englisch',
+            '• Maximal isoliert und sicher bei NATO-Krise',
+            '• Beste Infrastruktur und Lebensqualität',
+            '• ⚠️ WARNUNG: Bei nächster Pandemie/Krise wahrscheinlich wieder EXTREME Maßnahmen!',
+            '• Entscheidung: Könnt ihr mit Lockdowns leben wenn sie kommen?',
+        ]),
+    ], 'Wenn ihr Englisch und westliche Infrastruktur braucht und Lockdowns akzeptieren könnt:',
+        '→ NEUSEELAND (mit dem Bewusstsein, dass es bei der nächsten Krise wieder passieren kann)')),
+    (('CY',), 'EU + ENGLISCH + BALANCE', ([
+        ('CY', '🇨🇾 ZYPERN', '', [
+            '• Englisch weit verbreitet',
+            '• EU-Rechte + Steuervorteil',
+            '• Nähe zu Europa',
+            '• Kein NATO-Mitglied!',
+            '• ⚠️ Corona: Streng wie EU-Durchschnitt, aber nicht extrem',
+        ]),
+    ], 'Wenn ihr EU-Nähe + Englisch + moderates Risiko wollt:',
+        '→ ZYPERN')),
+]
+
+DATA = {
+    'corona_data': CORONA_DATA,
+    'ranking_columns': RANKING_COLUMNS,
+    'country_names': COUNTRY_NAMES,
+    'ranking_notes': RANKING_NOTES,
+    'corona_modifiers': CORONA_MODIFIERS,
+    'corona_criterion': CORONA_CRITERION,
+    'corona_policies': CORONA_POLICIES,
+    'matrix_rows': MATRIX_ROWS,
+    'final_ranking_columns': FINAL_RANKING_COLUMNS,
+    'final_ranking_names': FINAL_RANKING_NAMES,
+    'final_ranking_notes': FINAL_RANKING_NOTES,
+    'final_options': FINAL_OPTIONS,
+}
+
+
+def build_report(profile=None, data=None, on_section=None):
+    """Build the report; profile and data default to PROFILE and DATA.
+
+    ``on_section(doc, title)`` is called at the start of every section.
+    """
+    from docx import Document
+    from docx.shared import Pt, Cm, RGBColor
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+
+    from auswanderung.ranking import order_options, placement_text, placements, ranking_table
+    from auswanderung.reports import skip_section
+    from auswanderung.styles import register_styles
+    from auswanderung.tables import create_table_original_style
+    from auswanderung.xmltable import add_matrix_table
+
+    profile = PROFILE if profile is None else profile
+    data = DATA if data is None else data
+    on_section = skip_section if on_section is None else on_section
+
+    # Create document
+    doc = Document()
+    register_styles(doc)
+
+    for section in doc.sections:
+        section.top_margin = Cm(1.5)
+        section.bottom_margin = Cm(1.5)
+        section.left_margin = Cm(1.5)
+        section.right_margin = Cm(1.5)
+
+    # =============================================================================
+    # TITLE
+    # =============================================================================
+    on_section(doc, 'TITLE')
+    title = doc.add_paragraph()
+    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    run = title.add_run('AUSWANDERUNGSANALYSE 2025 - FINALE VERSION')
+    run.bold = True
+    run.font.size = Pt(24)
+
+    subtitle = doc.add_paragraph()
+    subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    run = subtitle.add_run('PERSONALISIERT FÜR EUER PROFIL')
+    run.font.size = Pt(14)
+    run.font.color.rgb = RGBColor(47, 84, 150)
+
+    tagline = doc.add_paragraph()
+    tagline.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    run = tagline.add_run(profile['tagline'])
+    run.font.size = Pt(10)
+    run.font.italic = True
+
+    tagline2 = doc.add_paragraph()
+    tagline2.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    run = tagline2.add_run(profile['extended'])
+    run.font.size = Pt(10)
+    run.font.bold = True
+    run.font.color.rgb = RGBColor(192, 0, 0)
+
+    doc.add_paragraph()
+
+    # =============================================================================
+    # NEUE SEKTION: CORONA-RESTRIKTIVITÄT ÜBERSICHT
+    # =============================================================================
+    on_section(doc, 'NEUE SEKTION: CORONA-RESTRIKTIVITÄT ÜBERSICHT')
+    h = doc.add_paragraph()
+    run = h.add_run('NEUES KRITERIUM: CORONA-RESTRIKTIVITÄT')
+    run.bold = True
+    run.font.size = Pt(14)
+    run.font.color.rgb = RGBColor(192, 0, 0)
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('Basierend auf dem tatsächlichen Verhalten während der COVID-19-Pandemie 2020-2022:').italic = True
+
+    doc.add_paragraph()
+
+    corona_data = data['corona_data']
+    create_table_original_style(doc, corona_data)
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('WICHTIG: ').bold = True
+    p.add_run('Wenn euch persönliche Freiheit in Krisenzeiten wichtig ist, sind die "extremen" Länder (NZ, AU, DE) problematisch. Uruguay und Schweden zeigten, dass es auch liberal geht!')
+
+    doc.add_paragraph()
+
+    # =============================================================================
+    # EUER PROFIL - STÄRKEN
+    # =============================================================================
+    on_section(doc, 'EUER PROFIL - STÄRKEN')
+    h = doc.add_paragraph()
+    run = h.add_run('EUER PROFIL - STÄRKEN')
+    run.bold = True
+    run.font.size = Pt(14)
+    run.font.color.rgb = RGBColor(47, 84, 150)
+
+    doc.add_paragraph()
+
+    p1 = doc.add_paragraph()
+    p1.add_run('1. Kapital (500k+ EUR): ').bold = True
+    p1.add_run('Öffnet praktisch alle Türen.')
+
+    p2 = doc.add_paragraph()
+    p2.add_run('2. Remote IT-Job (Familie 1): ').bold = True
+    p2.add_run('Data Architect ist gefragter Beruf, öffnet Visa-Optionen.')
+
+    p3 = doc.add_paragraph()
+    p3.add_run('3. FLIESSEND ENGLISCH: ').bold = True
+    p3.add_run('Öffnet englischsprachige Länder! Keine Sprachbarriere.')
+
+    p4 = doc.add_paragraph()
+    p4.add_run('4. Zwei-Familien-Projekt: ').bold = True
+    p4.add_run('Geteilte Kosten, soziales Netz von Tag 1.')
+
+    p5 = doc.add_paragraph()
+    p5.add_run('5. Familie 2 - Eigenkapital + Vor-Ort-Jobs: ').bold = True
+    p5.add_run('Flexibel für lokalen Arbeitsmarkt.')
+
+    p6 = doc.add_paragraph()
+    p6.add_run('6. Zeugen Jehovas: ').bold = True
+    p6.add_run('Weltweites Netzwerk, sofortige Gemeinschaft.')
+
+    doc.add_paragraph()
+
+    # =============================================================================
+    # GESAMTRANKING - FINALE VERSION MIT CORONA
+    # =============================================================================
+    on_section(doc, 'GESAMTRANKING - FINALE VERSION MIT CORONA')
+    h = doc.add_paragraph()
+    run = h.add_run('FINALE GESAMTRANKING - INKL. CORONA-RESTRIKTIVITÄT')
+    run.bold = True
+    run.font.size = Pt(14)
+    run.font.color.rgb = RGBColor(47, 84, 150)
+
+    doc.add_paragraph()
+
+    ranking_data = ranking_table(data['matrix_rows'], data['ranking_columns'], data['country_names'],
+                                 data['ranking_notes'], data['corona_modifiers'],
+                                 data['corona_criterion'])
+    create_table_original_style(doc, ranking_data)
+
+    doc.add_paragraph()
+
+    # Erklärung
+    p = doc.add_paragraph()
+    p.add_run('Bewertungssystem Corona-Restriktivität:').bold = True
+    for modifier, policy in sorted(data['corona_policies'].items(), reverse=True):
+        names = ', '.join(data['country_names'][country]
+                          for country, value in data['corona_modifiers'].items()
+                          if value == modifier)
+        doc.add_paragraph(f"• {modifier:+d} Punkte: {policy} ({names})")
+    doc.add_paragraph('Die Corona-Zeile der Detailmatrix zeigt nur die Tendenz (++/o/--). '
+                      'Im Ranking ersetzt die vierstufige Skala diese Zeile, damit Corona '
+                      'genau einmal zählt.')
+
+    doc.add_page_break()
+
+    # =============================================================================
+    # DETAILMATRIX - FINAL MIT CORONA
+    # =============================================================================
+    on_section(doc, 'DETAILMATRIX - FINAL MIT CORONA')
+    h = doc.add_paragraph()
+    run = h.add_run('DETAILMATRIX - FINALE VERSION')
+    run.bold = True
+    run.font.size = Pt(16)
+    run.font.color.rgb = RGBColor(47, 84, 150)
+
+    doc.add_paragraph()
+
+    legend = doc.add_paragraph()
+    legend.add_run('Symbole: ').bold = True
+    legend.add_run('++ = Sehr gut (2 Pkt) | o = Mittel (1 Pkt) | -- = Schlecht (0 Pkt)')
+
+    doc.add_paragraph()
+
+    abbrev = doc.add_paragraph()
+    run = abbrev.add_run('Länder: UY=Uruguay, NZ=Neuseeland, ES-S=Spanien Süd, AU=Australien, CY=Zypern, KAN=Kanaren, CR=Costa Rica, CL=Chile, NAM=Namibia, DE=Deutschland, SE=Schweden, NI=Nicaragua, NG=Nigeria')
+    run.font.size = Pt(8)
+
+    doc.add_paragraph()
+
+    # Matrix rows - 18 Kriterien inkl. Corona
+    matrix_rows = data['matrix_rows']
+
+    # Create matrix table
+    add_matrix_table(doc, matrix_rows)
+
+    doc.add_page_break()
+
+    # =============================================================================
+    # CORONA-ANALYSE DETAIL
+    # =============================================================================
+    on_section(doc, 'CORONA-ANALYSE DETAIL')
+    h = doc.add_paragraph()
+    run = h.add_run('CORONA-RESTRIKTIVITÄT - DETAILANALYSE')
+    run.bold = True
+    run.font.size = Pt(14)
+    run.font.color.rgb = RGBColor(192, 0, 0)
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('Warum ist dieses Kriterium wichtig?').bold = True
+
+    doc.add_paragraph()
+
+    doc.add_paragraph('Die COVID-19-Pandemie hat gezeigt, wie unterschiedlich Regierungen auf Krisen reagieren. Für Menschen, denen persönliche Freiheit wichtig ist, war dies ein Augenöffner. Die Maßnahmen eines Landes während Corona sind ein guter Indikator dafür, wie es bei ZUKÜNFTIGEN Krisen reagieren wird.')
+
+    doc.add_paragraph()
+
+    # EXTREM RESTRIKTIV
+    h3 = doc.add_paragraph()
+    h3.add_run('EXTREM RESTRIKTIV (--) - Meiden wenn Freiheit wichtig!').bold = True
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('🇳🇿 NEUSEELAND: ').bold = True
+    p.add_run('Zero-COVID-Strategie. Grenzen für 2+ Jahre komplett geschlossen - selbst für eigene Bürger schwer einzureisen. MIQ (Managed Isolation and Quarantine) Hotels mit Lotterie-System. Strenge Lockdowns bei wenigen Fällen. Polizei kontrollierte Einhaltung.')
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('🇦🇺 AUSTRALIEN: ').bold = True
+    p.add_run('WELTREKORD - Melbourne hatte mit 262 Tagen den LÄNGSTEN LOCKDOWN DER WELT! Grenzen geschlossen. Australier konnten ihr eigenes Land nicht verlassen. Polizei mit Drohnen und Helikoptern. Proteste wurden aufgelöst. Camps für Quarantäne.')
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('🇩🇪 DEUTSCHLAND: ').bold = True
+    p.add_run('2G/3G-Regeln schlossen Ungeimpfte vom öffentlichen Leben aus. Lockdowns, Ausgangssperren, Maskenpflicht überall. Impfdruck auf Arbeitsplätze. Einige der strengsten Regeln Europas.')
+
+    doc.add_paragraph()
+
+    # STRENG
+    h3 = doc.add_paragraph()
+    h3.add_run('STRENG (o) - Restriktiv aber nicht extrem').bold = True
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('🇪🇸 SPANIEN/KANAREN: ').bold = True
+    p.add_run('Einer der härtesten Lockdowns Europas März 2020. Ausgangssperren - man durfte nur zum Einkaufen raus. Polizei auf den Straßen. Bußgelder für Verstöße. Danach moderate Lockerungen.')
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('🇨🇾 ZYPERN: ').bold = True
+    p.add_run('SafePass-System (wie 3G). Lockdowns, Testpflichten. EU-koordinierte Maßnahmen. Ähnlich wie Festland-Europa.')
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('🇨🇱 CHILE: ').bold = True
+    p.add_run('Strenge Lockdowns, Ausgangssperren, Passierscheine zum Verlassen des Hauses nötig.')
+
+    doc.add_paragraph()
+
+    # LIBERAL
+    h3 = doc.add_paragraph()
+    h3.add_run('LIBERAL (++) - Respekt für Freiheit auch in der Krise').bold = True
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('🇺🇾 URUGUAY: ').bold = True
+    p.add_run('"Libertad Responsable" (Verantwortungsvolle Freiheit) - Die Regierung setzte auf FREIWILLIGKEIT. Keine harten Lockdowns, keine Ausgangssperren. Empfehlungen statt Befehle. Dennoch relativ gute Corona-Zahlen. Zeigt: Freiheit und Gesundheit sind vereinbar!')
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('🇸🇪 SCHWEDEN: ').bold = True
+    p.add_run('SONDERWEG - Keine Lockdowns, keine Maskenpflicht (nur Empfehlung), Schulen und Restaurants blieben offen. Vertrauen in die Bevölkerung. Wurde international kritisiert, aber am Ende ähnliche Ergebnisse wie Lockdown-Länder.')
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('🇳🇮 NICARAGUA: ').bold = True
+    p.add_run('Ortega-Regime ignorierte Corona weitgehend. Keine Lockdowns. ABER: Das liegt am autoritären Regime, nicht an Respekt für Freiheit.')
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('🇳🇦 NAMIBIA: ').bold = True
+    p.add_run('Moderate Maßnahmen offiziell, aber wenig Durchsetzung auf dem Land. In der Praxis liberal.')
+
+    doc.add_paragraph()
+
+    # =============================================================================
+    # FAZIT SEKTION
+    # =============================================================================
+    on_section(doc, 'FAZIT SEKTION')
+    places, _ = placements(data['matrix_rows'], data['corona_modifiers'],
+                           data['corona_criterion'])
+    options = order_options(places, data['final_options'])
+    doc.add_page_break()
+
+    h = doc.add_paragraph()
+    run = h.add_run('FINALE EMPFEHLUNG - MIT CORONA-FAKTOR')
+    run.bold = True
+    run.font.size = Pt(16)
+    run.font.color.rgb = RGBColor(47, 84, 150)
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('Die große Frage: ').bold = True
+    p.add_run('Was ist euch wichtiger - maximale Stabilität oder maximale Freiheit?')
+
+    doc.add_paragraph()
+
+    for i, (_, theme, (blocks, _, _)) in enumerate(options):
+        p = doc.add_paragraph()
+        run = p.add_run(f"OPTION {chr(ord('A') + i)}: {theme}")
+        run.bold = True
+        run.font.size = Pt(14)
+        run.font.color.rgb = RGBColor(0, 112, 192)
+
+        doc.add_paragraph()
+
+        blocks = sorted(blocks, key=lambda block: places[block[0]].rank)
+        for country, label, suffix, lines in blocks:
+            p = doc.add_paragraph()
+            run = p.add_run(f"{label} ({placement_text(places[country])}){suffix}")
+            run.bold = True
+
+            for line in lines:
+                doc.add_paragraph(line)
+
+            doc.add_paragraph()
+
+    # =============================================================================
+    # FINALE TABELLE
+    # =============================================================================
+    on_section(doc, 'FINALE TABELLE')
+    h = doc.add_paragraph()
+    run = h.add_run('FINALE RANGLISTE - ALLE KRITERIEN INKL. CORONA')
+    run.bold = True
+    run.font.size = Pt(14)
+    run.font.color.rgb = RGBColor(47, 84, 150)
+
+    doc.add_paragraph()
+
+    final_ranking = ranking_table(data['matrix_rows'], data['final_ranking_columns'],
+                                  data['final_ranking_names'], data['final_ranking_notes'],
+                                  data['corona_modifiers'], data['corona_criterion'])
+    create_table_original_style(doc, final_ranking)
+
+    doc.add_paragraph()
+
+    # =============================================================================
+    # SCHLUSSWORT
+    # =============================================================================
+    on_section(doc, 'SCHLUSSWORT')
+    p = doc.add_paragraph()
+    p.add_run('UNSERE FINALE EMPFEHLUNG:').bold = True
+
+    doc.add_paragraph()
+
+    for _, _, (_, condition, choice) in options:
+        doc.add_paragraph(condition)
+        doc.add_paragraph(choice)
+
+        doc.add_paragraph()
+
+    doc.add_paragraph('─' * 70)
+
+    p = doc.add_paragraph()
+    p.add_run('Erstellt: Januar 2025 | FINALE VERSION').font.size = Pt(9)
+    p = doc.add_paragraph()
+    p.add_run('Inkl.: ZJ | Englisch | Eigenkapital | Krise | Corona-Restriktivität | Zypern').font.size = Pt(9)
+    p = doc.add_paragraph()
+    p.add_run(profile['families']).font.size = Pt(9)
+
+    return doc
@@ -0,0 +1,734 @@
+"""FINALE VERSION (v7): ranking sorted by points, Corona as one x1 criterion"""
+
+OUTPUT_FILE = 'Auswanderungsanalyse_2025_FINALE_VERSION.docx'
+
+# Shown in front of the detail headings of the first three places
+MEDALS = {1: '🥇 ', 2: '🥈 ', 3: '🥉 '}
+
+PROFILE = {
+    'tagline': '500k+ EUR Kapital | Remote IT | Zwei-Familien-Projekt | Fließend Englisch | Zeugen Jehovas',
+    'families': 'Familie 1: 40J, 2 Kinder (12+14) | Familie 2: 50J, keine Kinder',
+}
+
+RANKING_COLUMNS = [
+    ('#', 'rank'),
+    ('Land', 'name'),
+    ('Punkte', 'points'),
+    ('%', 'percent'),
+    ('Für euer Profil', 'note'),
+    ('Corona-Hinweis', 'note'),
+]
+
+COUNTRY_NAMES = {
+    'UY': 'Uruguay',
+    'NZ': 'Neuseeland',
+    'ES': 'Spanien (Süden)',
+    'AU': 'Australien',
+    'CY': 'Zypern',
+    'KAN': 'Kanarische Inseln',
+    'CR': 'Costa Rica',
+    'CL': 'Chile (Mitte)',
+    'NAM': 'Namibia',
+    'DE': 'Deutschland',
+    'SE': 'Schweden',
+    'NI': 'Nicaragua',
+    'NG': 'Nigeria',
+}
+
+RANKING_NOTES = {
+    'UY': ['Neutral + Krisensicher + Liberal!', '✅ Liberal'],
+    'NZ': ['TOP - Englisch + Jobs + Krise + Pflege', '⚠️ Sehr restriktiv'],
+    'ES': ['EU-Rechte + Sonne + Pflege', '⚠️ Streng'],
+    'AU': ['Englisch + Jobs + Pflege', '⚠️ Extrem restriktiv!'],
+    'CY': ['EU + Englisch + Sonne', '⚠️ Streng (EU-Niveau)'],
+    'KAN': ['EU + bestes Klima', '⚠️ Streng (wie ES)'],
+    'CR': ['Kein Militär + krisensicher', '✅ Moderat'],
+    'CL': ['Isoliert + selbstversorgend', '⚠️ Streng'],
+    'NAM': ['Englisch + günstig', 'o Moderat'],
+    'DE': ['NATO-Front + restriktiv', '⚠️ Sehr restriktiv'],
+    'SE': ['Liberal bei Corona, aber NATO + kalt', '✅ Sehr liberal'],
+    'NI': ['Instabil, Diktatur', '✅ Liberal (Diktatur)'],
+    'NG': ['Nicht empfohlen', 'o Kaum durchgesetzt'],
+}
+
+MATRIX_ROWS = [
+    ["Kriterium", "UY", "NZ", "ES", "AU", "CY", "KAN", "CR", "CL", "NAM", "DE", "SE", "NI", "NG"],
+    
+    ["Geopolitik x2",
+     ("++", "2", "Neutral"),
+     ("++", "2", "Isoliert"),
+     ("o", "1", "NATO"),
+     ("o", "1", "AUKUS"),
+     ("o", "1", "Geteilt"),
+     ("++", "2", "Weit"),
+     ("++", "2", "Neutral"),
+     ("++", "2", "Isoliert"),
+     ("o", "1", "Stabil"),
+     ("--", "0", "Front!"),
+     ("--", "0", "Front!"),
+     ("o", "1", "Instabil"),
+     ("--", "0", "Unsicher")],
+    
+    ["Einwanderung x1.5",
+     ("++", "2", "Einfach"),
+     ("++", "2", "IT-Liste"),
+     ("++", "2", "EU"),
+     ("++", "2", "IT-Liste"),
+     ("++", "2", "EU"),
+     ("++", "2", "EU"),
+     ("++", "2", "Investor"),
+     ("++", "2", "Einfach"),
+     ("++", "2", "Einfach"),
+     ("++", "2", "EU"),
+     ("++", "2", "EU"),
+     ("o", "1", "OK"),
+     ("o", "1", "Schwer")],
+    
+    ["Englisch x1.5",
+     ("o", "1", "Spanisch"),
+     ("++", "2", "Mutter!"),
+     ("o", "1", "Spanisch"),
+     ("++", "2", "Mutter!"),
+     ("++", "2", "Weit verb."),
+     ("o", "1", "Spanisch"),
+     ("o", "1", "OK"),
+     ("--", "0", "Spanisch"),
+     ("++", "2", "Amtsspr."),
+     ("o", "1", "Deutsch"),
+     ("o", "1", "Schwed."),
+     ("o", "1", "Spanisch"),
+     ("o", "1", "Amtsspr.")],
+    
+    ["Grundstück x1.5",
+     ("++", "2", "Günstig"),
+     ("o", "1", "Teuer"),
+     ("++", "2", "OK"),
+     ("o", "1", "Teuer"),
+     ("o", "1", "Begrenzt"),
+     ("o", "1", "Begrenzt"),
+     ("o", "1", "OK"),
+     ("++", "2", "Günstig"),
+     ("++", "2", "Sehr günstig"),
+     ("--", "0", "Teuer"),
+     ("--", "0", "OK"),
+     ("++", "2", "Billig"),
+     ("++", "2", "Risiko")],
+    
+    ["Zeitzone x1",
+     ("++", "2", "-4h"),
+     ("--", "0", "+11h"),
+     ("++", "2", "Gleich"),
+     ("--", "0", "+9h"),
+     ("++", "2", "+1h"),
+     ("++", "2", "Gleich"),
+     ("o", "1", "-7h"),
+     ("o", "1", "-5h"),
+     ("++", "2", "+1h"),
+     ("++", "2", "Basis"),
+     ("++", "2", "Gleich"),
+     ("o", "1", "-7h"),
+     ("o", "1", "+1h")],
+    
+    ["Selbstversorg. x1",
+     ("++", "2", "Ideal"),
+     ("++", "2", "Gut"),
+     ("++", "2", "Gut"),
+     ("o", "1", "Wasser"),
+     ("o", "1", "Wasser"),
+     ("o", "1", "Wasser"),
+     ("o", "1", "Tropisch"),
+     ("o", "1", "OK"),
+     ("o", "1", "Trocken"),
+     ("o", "1", "Bürokratie"),
+     ("--", "0", "Kurz"),
+     ("o", "1", "OK"),
+     ("--", "0", "Unsicher")],
+    
+    ["Klima x1",
+     ("++", "2", "2400h"),
+     ("++", "2", "2200h"),
+     ("++", "2", "3000h"),
+     ("o", "1", "Extreme"),
+     ("++", "2", "3300h!"),
+     ("++", "2", "2800h"),
+     ("o", "1", "Tropisch"),
+     ("o", "1", "1700h"),
+     ("++", "2", "3000h"),
+     ("o", "1", "1600h"),
+     ("--", "0", "Kalt"),
+     ("--", "0", "Heiss"),
+     ("--", "0", "Heiss")],
+    
+    ["Rechtssich. x1.5",
+     ("++", "2", "Stabil"),
+     ("++", "2", "Top"),
+     ("++", "2", "EU"),
+     ("++", "2", "Stark"),
+     ("++", "2", "EU"),
+     ("++", "2", "EU"),
+     ("++", "2", "Gut"),
+     ("o", "1", "OK"),
+     ("o", "1", "OK"),
+     ("++", "2", "Stark"),
+     ("++", "2", "Stark"),
+     ("--", "0", "Schwach"),
+     ("--", "0", "Korrupt")],
+    
+    ["Gesundheit x1",
+     ("o", "1", "Gut"),
+     ("++", "2", "Sehr gut"),
+     ("++", "2", "Gut"),
+     ("++", "2", "Top"),
+     ("++", "2", "Gut"),
+     ("++", "2", "Gut"),
+     ("++", "2", "Gut"),
+     ("o", "1", "OK"),
+     ("o", "1", "Begrenzt"),
+     ("++", "2", "Top"),
+     ("++", "2", "Gut"),
+     ("--", "0", "Schwach"),
+     ("--", "0", "Schwach")],
+    
+    ["Lebenserwart. x1",
+     ("++", "2", "78J"),
+     ("++", "2", "83J"),
+     ("++", "2", "84J"),
+     ("++", "2", "84J"),
+     ("++", "2", "81J"),
+     ("++", "2", "84J"),
+     ("++", "2", "80J"),
+     ("++", "2", "80J"),
+     ("o", "1", "66J"),
+     ("++", "2", "81J"),
+     ("++", "2", "83J"),
+     ("o", "1", "75J"),
+     ("--", "0", "55J")],
+    
+    ["Westl. Leben x0.5",
+     ("++", "2", "Voll"),
+     ("++", "2", "Voll"),
+     ("++", "2", "Voll"),
+     ("++", "2", "Voll"),
+     ("++", "2", "Voll"),
+     ("++", "2", "Voll"),
+     ("++", "2", "Gut"),
+     ("o", "1", "Meist"),
+     ("o", "1", "Teils"),
+     ("++", "2", "Voll"),
+     ("++", "2", "Voll"),
+     ("o", "1", "Begrenzt"),
+     ("o", "1", "Begrenzt")],
+    
+    ["ZJ-Gemeinde x2",
+     ("o", "1", "13k"),
+     ("++", "2", "14k"),
+     ("++", "2", "113k"),
+     ("++", "2", "68k"),
+     ("o", "1", "2k"),
+     ("++", "2", "8k+dt"),
+     ("++", "2", "28k!"),
+     ("++", "2", "79k"),
+     ("o", "1", "3k"),
+     ("++", "2", "176k"),
+     ("o", "1", "Klein"),
+     ("o", "1", "Klein"),
+     ("++", "2", "407k!")],
+    
+    ["ZJ Sprache x1",
+     ("o", "1", "Spanisch"),
+     ("++", "2", "Englisch!"),
+     ("++", "2", "Dt. Vers."),
+     ("++", "2", "Englisch!"),
+     ("++", "2", "Englisch!"),
+     ("++", "2", "Dt. Vers."),
+     ("o", "1", "Spanisch"),
+     ("o", "1", "Spanisch"),
+     ("++", "2", "Englisch!"),
+     ("++", "2", "Deutsch!"),
+     ("o", "1", "Schwed."),
+     ("o", "1", "Spanisch"),
+     ("++", "2", "Englisch!")],
+    
+    ["Jobs F2 x2",
+     ("--", "0", "Wenig"),
+     ("++", "2", "Mangel!"),
+     ("o", "1", "Schwer"),
+     ("++", "2", "Mangel!"),
+     ("o", "1", "Tourism."),
+     ("o", "1", "Tourism."),
+     ("o", "1", "Begrenzt"),
+     ("o", "1", "OK"),
+     ("o", "1", "Begrenzt"),
+     ("++", "2", "Gut"),
+     ("++", "2", "Gut"),
+     ("--", "0", "Riskant"),
+     ("--", "0", "Gefährl.")],
+    
+    ["Nähe EU x0.5",
+     ("o", "1", "12-14h"),
+     ("--", "0", "24h"),
+     ("++", "2", "2-3h"),
+     ("--", "0", "22h"),
+     ("++", "2", "3-4h"),
+     ("++", "2", "4h"),
+     ("o", "1", "12h"),
+     ("o", "1", "14h"),
+     ("o", "1", "10h"),
+     ("++", "2", "Basis"),
+     ("++", "2", "1-2h"),
+     ("o", "1", "12h"),
+     ("o", "1", "6h")],
+    
+    ["Krise NATO x2",
+     ("++", "2", "Neutral"),
+     ("++", "2", "Isoliert"),
+     ("o", "1", "NATO"),
+     ("o", "1", "AUKUS"),
+     ("o", "1", "Nahost"),
+     ("o", "1", "NATO"),
+     ("++", "2", "Neutral!"),
+     ("++", "2", "Isoliert"),
+     ("o", "1", "Import"),
+     ("--", "0", "Front!"),
+     ("--", "0", "Front!"),
+     ("o", "1", "RU-nah"),
+     ("--", "0", "Unruhen")],
+    
+    ["Pflege x1",
+     ("o", "1", "Gut"),
+     ("++", "2", "Gut"),
+     ("++", "2", "EU"),
+     ("++", "2", "Top"),
+     ("++", "2", "EU"),
+     ("++", "2", "EU"),
+     ("o", "1", "OK"),
+     ("o", "1", "OK"),
+     ("--", "0", "Begrenzt"),
+     ("++", "2", "Top"),
+     ("++", "2", "Top"),
+     ("--", "0", "Schwach"),
+     ("--", "0", "Schwach")],
+    
+    # Corona-Restriktivität (Gewicht x1)
+    ["Corona-Restr. x1",
+     ("++", "2", "Liberal"),
+     ("--", "0", "Extrem"),
+     ("o", "1", "Streng"),
+     ("--", "0", "Extrem!"),
+     ("o", "1", "Streng"),
+     ("o", "1", "Streng"),
+     ("o", "1", "Moderat"),
+     ("o", "1", "Streng"),
+     ("o", "1", "Moderat"),
+     ("--", "0", "Extrem"),
+     ("++", "2", "Liberal!"),
+     ("++", "2", "Liberal"),
+     ("++", "2", "Liberal")],
+]
+
+CORONA_SUMMARY = [
+    ['Kategorie', 'Länder', 'Was bedeutet das?'],
+    ['EXTREM restriktiv', 'Neuseeland, Australien, Deutschland', 'Grenzen zu, harte Lockdowns, Impfdruck. Bei nächster Krise wahrscheinlich wieder so.'],
+    ['STRENG', 'Spanien, Kanaren, Zypern, Chile', 'Ausgangssperren, Kontrollen. EU-typisches Niveau.'],
+    ['MODERAT', 'Costa Rica, Namibia', 'Maßnahmen vorhanden, aber weniger hart durchgesetzt.'],
+    ['LIBERAL', 'Uruguay, Schweden, Nicaragua', 'Keine harten Lockdowns, Freiwilligkeit, Vertrauen in Bürger.'],
+]
+
+DATA = {
+    'ranking_columns': RANKING_COLUMNS,
+    'country_names': COUNTRY_NAMES,
+    'ranking_notes': RANKING_NOTES,
+    'matrix_rows': MATRIX_ROWS,
+    'corona_summary': CORONA_SUMMARY,
+}
+
+
+def build_report(profile=None, data=None, on_section=None):
+    """Build the report; profile and data default to PROFILE and DATA.
+
+    ``on_section(doc, title)`` is called at the start of every section.
+    """
+    from docx import Document
+    from docx.shared import Pt, Cm, RGBColor
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+
+    from auswanderung.ranking import (check_order, placement_text, placements, rank_range,
+                                      ranking_table)
+    from auswanderung.reports import skip_section
+    from auswanderung.styles import register_styles
+    from auswanderung.tables import create_table_original_style
+    from auswanderung.xmltable import add_matrix_table
+
+    profile = PROFILE if profile is None else profile
+    data = DATA if data is None else data
+    on_section = skip_section if on_section is None else on_section
+
+    # Create document
+    doc = Document()
+    register_styles(doc)
+
+    for section in doc.sections:
+        section.top_margin = Cm(1.5)
+        section.bottom_margin = Cm(1.5)
+        section.left_margin = Cm(1.5)
+        section.right_margin = Cm(1.5)
+
+    # =============================================================================
+    # TITLE
+    # =============================================================================
+    on_section(doc, 'TITLE')
+    title = doc.add_paragraph()
+    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    run = title.add_run('AUSWANDERUNGSANALYSE 2025 - FINALE VERSION')
+    run.bold = True
+    run.font.size = Pt(24)
+
+    subtitle = doc.add_paragraph()
+    subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    run = subtitle.add_run('PERSONALISIERT FÜR EUER PROFIL')
+    run.font.size = Pt(14)
+    run.font.color.rgb = RGBColor(47, 84, 150)
+
+    tagline = doc.add_paragraph()
+    tagline.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    run = tagline.add_run(profile['tagline'])
+    run.font.size = Pt(10)
+    run.font.italic = True
+
+    doc.add_paragraph()
+
+    # =============================================================================
+    # EUER PROFIL - STÄRKEN
+    # =============================================================================
+    on_section(doc, 'EUER PROFIL - STÄRKEN')
+    h = doc.add_paragraph()
+    run = h.add_run('EUER PROFIL - STÄRKEN')
+    run.bold = True
+    run.font.size = Pt(14)
+    run.font.color.rgb = RGBColor(47, 84, 150)
+
+    doc.add_paragraph()
+
+    p1 = doc.add_paragraph()
+    p1.add_run('1. Kapital (500k+ EUR): ').bold = True
+    p1.add_run('Öffnet praktisch alle Türen.')
+
+    p2 = doc.add_paragraph()
+    p2.add_run('2. Remote IT-Job (Familie 1): ').bold = True
+    p2.add_run('Data Architect - gefragter Beruf, öffnet Visa-Optionen.')
+
+    p3 = doc.add_paragraph()
+    p3.add_run('3. FLIESSEND ENGLISCH: ').bold = True
+    p3.add_run('Öffnet englischsprachige Länder! Keine Sprachbarriere.')
+
+    p4 = doc.add_paragraph()
+    p4.add_run('4. Zwei-Familien-Projekt: ').bold = True
+    p4.add_run('Geteilte Kosten, soziales Netz von Tag 1.')
+
+    p5 = doc.add_paragraph()
+    p5.add_run('5. Familie 2 - Eigenkapital + Vor-Ort-Jobs: ').bold = True
+    p5.add_run('Flexibel für lokalen Arbeitsmarkt.')
+
+    p6 = doc.add_paragraph()
+    p6.add_run('6. Zeugen Jehovas: ').bold = True
+    p6.add_run('Weltweites Netzwerk, sofortige Gemeinschaft.')
+
+    doc.add_paragraph()
+
+    # =============================================================================
+    # GESAMTRANKING - KORREKT SORTIERT NACH PUNKTEN
+    # =============================================================================
+    on_section(doc, 'GESAMTRANKING - KORREKT SORTIERT NACH PUNKTEN')
+    h = doc.add_paragraph()
+    run = h.add_run('GESAMTRANKING - ANGEPASST AN EUER PROFIL')
+    run.bold = True
+    run.font.size = Pt(14)
+    run.font.color.rgb = RGBColor(47, 84, 150)
+
+    doc.add_paragraph()
+
+    # Ranking nach Gesamtpunkten sortiert (Corona ist EIN Kriterium mit x1)
+    ranking_data = ranking_table(data['matrix_rows'], data['ranking_columns'], data['country_names'],
+                                 data['ranking_notes'])
+    create_table_original_style(doc, ranking_data)
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('Hinweis: ').bold = True
+    p.add_run('Corona-Restriktivität ist EIN Kriterium unter 18 (Gewicht x1). Die Spalte zeigt, wie das Land bei COVID reagiert hat - ein Indikator für zukünftige Krisen.')
+
+    doc.add_page_break()
+
+    # =============================================================================
+    # DETAILMATRIX
+    # =============================================================================
+    on_section(doc, 'DETAILMATRIX')
+    h = doc.add_paragraph()
+    run = h.add_run('DETAILMATRIX - 18 KRITERIEN')
+    run.bold = True
+    run.font.size = Pt(16)
+    run.font.color.rgb = RGBColor(47, 84, 150)
+
+    doc.add_paragraph()
+
+    legend = doc.add_paragraph()
+    legend.add_run('Symbole: ').bold = True
+    legend.add_run('++ = Sehr gut (2 Pkt) | o = Mittel (1 Pkt) | -- = Schlecht (0 Pkt)')
+
+    doc.add_paragraph()
+
+    abbrev = doc.add_paragraph()
+    run = abbrev.add_run('UY=Uruguay, NZ=Neuseeland, ES=Spanien, AU=Australien, CY=Zypern, KAN=Kanaren, CR=Costa Rica, CL=Chile, NAM=Namibia, DE=Deutschland, SE=Schweden, NI=Nicaragua, NG=Nigeria')
+    run.font.size = Pt(8)
+
+    doc.add_paragraph()
+
+    # Matrix mit allen 18 Kriterien inkl. Corona (Gewicht x1)
+    matrix_rows = data['matrix_rows']
+
+    # Create matrix table
+    add_matrix_table(doc, matrix_rows)
+
+    doc.add_page_break()
+
+    # =============================================================================
+    # CORONA HINWEIS SEKTION (nicht zentral, aber informativ)
+    # =============================================================================
+    on_section(doc, 'CORONA HINWEIS SEKTION (nicht zentral, aber informativ)')
+    places, _ = placements(data['matrix_rows'])
+    h = doc.add_paragraph()
+    run = h.add_run('HINWEIS: CORONA-RESTRIKTIVITÄT ALS INDIKATOR')
+    run.bold = True
+    run.font.size = Pt(12)
+    run.font.color.rgb = RGBColor(47, 84, 150)
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('Warum ist dieses Kriterium relevant?').bold = True
+
+    doc.add_paragraph()
+
+    doc.add_paragraph('Die COVID-19-Pandemie zeigte, wie unterschiedlich Regierungen auf Krisen reagieren. Das Verhalten während Corona ist ein Indikator für zukünftige Krisen.')
+
+    doc.add_paragraph()
+
+    corona_summary = data['corona_summary']
+    create_table_original_style(doc, corona_summary)
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('Wichtig: ').bold = True
+    p.add_run(f"Corona ist EIN Faktor unter 18. Neuseeland steht trotzdem auf Platz "
+              f"{places['NZ'].rank}, weil es in ALLEN anderen Kriterien hervorragend abschneidet. "
+              f"Aber ihr solltet wissen, dass bei einer neuen Krise dort wahrscheinlich wieder "
+              f"strikte Maßnahmen kommen.")
+
+    doc.add_paragraph()
+
+    # =============================================================================
+    # DETAILANALYSEN TOP 5
+    # =============================================================================
+    on_section(doc, 'DETAILANALYSEN')
+    check_order('Detailanalysen', places, ('NZ', 'ES', 'UY', 'CR', 'CY', 'AU'))
+    h = doc.add_paragraph()
+    run = h.add_run('DETAILANALYSEN')
+    run.bold = True
+    run.font.size = Pt(14)
+    run.font.color.rgb = RGBColor(47, 84, 150)
+
+    doc.add_paragraph()
+
+    # NEUSEELAND
+    h2 = doc.add_paragraph()
+    run = h2.add_run(f"{MEDALS.get(places['NZ'].rank, '')}PLATZ {places['NZ'].rank}: NEUSEELAND "
+                     f"({places['NZ'].percent:.0f}%)")
+    run.bold = True
+    run.font.size = Pt(12)
+    run.font.color.rgb = RGBColor(0, 112, 192)
+
+    doc.add_paragraph()
+
+    doc.add_paragraph('✅ Englisch als Muttersprache - sofortige Integration')
+    doc.add_paragraph('✅ IT auf Skilled Occupation List - Visa realistisch')
+    doc.add_paragraph('✅ Arbeitskräftemangel - Jobs für Familie 2')
+    doc.add_paragraph('✅ ZJ auf Englisch (~14.000 Verkündiger)')
+    doc.add_paragraph('✅ Maximal isoliert bei NATO-Krise')
+    doc.add_paragraph('✅ Exzellente Pflege im Alter')
+    doc.add_paragraph('✅ 2.200 Sonnenstunden, mildes Klima')
+    doc.add_paragraph('❌ Entfernung zu Europa (24h Flug)')
+    doc.add_paragraph('❌ Zeitzone +11h schwierig für Remote-Work DE')
+    doc.add_paragraph('⚠️ Corona: EXTREM restriktiv (Zero-COVID, Grenzen 2 Jahre zu)')
+
+    doc.add_paragraph()
+
+    # SPANIEN
+    h2 = doc.add_paragraph()
+    run = h2.add_run(f"{MEDALS.get(places['ES'].rank, '')}PLATZ {places['ES'].rank}: "
+                     f"SPANIEN SÜDEN ({places['ES'].percent:.0f}%)")
+    run.bold = True
+    run.font.size = Pt(12)
+    run.font.color.rgb = RGBColor(0, 112, 192)
+
+    doc.add_paragraph()
+
+    doc.add_paragraph('✅ EU-Rechte - einfache Auswanderung')
+    doc.add_paragraph('✅ 2-3h Flug nach Deutschland')
+    doc.add_paragraph('✅ Gleiche Zeitzone - perfekt für Remote-Work')
+    doc.add_paragraph('✅ ZJ: 113k mit deutschsprachigen Versammlungen')
+    doc.add_paragraph('✅ 3.000+ Sonnenstunden')
+    doc.add_paragraph('✅ Große Grundstücke möglich')
+    doc.add_paragraph('❌ Spanisch lernen nötig (12-18 Monate)')
+    doc.add_paragraph('❌ NATO-Mitglied (wenn auch am Rand)')
+    doc.add_paragraph('⚠️ Corona: Strenge Ausgangssperren')
+
+    doc.add_paragraph()
+
+    # URUGUAY
+    h2 = doc.add_paragraph()
+    run = h2.add_run(f"{MEDALS.get(places['UY'].rank, '')}PLATZ {places['UY'].rank}: URUGUAY "
+                     f"({places['UY'].percent:.0f}%)")
+    run.bold = True
+    run.font.size = Pt(12)
+    run.font.color.rgb = RGBColor(0, 112, 192)
+
+    doc.add_paragraph()
+
+    doc.add_paragraph('✅ NEUTRAL - keine Militärbündnisse')
+    doc.add_paragraph('✅ SELBSTVERSORGEND - Agrar-Exporteur')
+    doc.add_paragraph('✅ "Schweiz Südamerikas" - stabile Demokratie')
+    doc.add_paragraph('✅ Perfekte Zeitzone (-4h) für Remote-Work')
+    doc.add_paragraph('✅ Günstige Grundstücke (10ha: 80-150k USD)')
+    doc.add_paragraph('✅ Corona: LIBERAL ("Libertad Responsable")')
+    doc.add_paragraph('❌ Spanisch nötig')
+    doc.add_paragraph('❌ Jobs für Familie 2 begrenzt')
+    doc.add_paragraph('❌ ZJ-Gemeinschaft kleiner (13k)')
+
+    doc.add_paragraph()
+
+    # COSTA RICA
+    h2 = doc.add_paragraph()
+    run = h2.add_run(f"{MEDALS.get(places['CR'].rank, '')}PLATZ {places['CR'].rank}: COSTA RICA "
+                     f"({places['CR'].percent:.0f}%)")
+    run.bold = True
+    run.font.size = Pt(12)
+    run.font.color.rgb = RGBColor(0, 112, 192)
+
+    doc.add_paragraph()
+
+    doc.add_paragraph('✅ KEIN MILITÄR seit 1948!')
+    doc.add_paragraph('✅ Kann sich nicht an Kriegen beteiligen')
+    doc.add_paragraph('✅ Höchster ZJ-Bevölkerungsanteil (0,54%)')
+    doc.add_paragraph('✅ Corona: Moderate Maßnahmen')
+    doc.add_paragraph('❌ Tropisches Klima')
+    doc.add_paragraph('❌ Spanisch nötig')
+    doc.add_paragraph('❌ Zeitzone -7h grenzwertig für Remote-Work')
+
+    doc.add_paragraph()
+
+    # ZYPERN & AUSTRALIEN
+    h2 = doc.add_paragraph()
+    run = h2.add_run(f"PLATZ {rank_range(places, ('CY', 'AU'))}: ZYPERN & AUSTRALIEN")
+    run.bold = True
+    run.font.size = Pt(12)
+    run.font.color.rgb = RGBColor(0, 112, 192)
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run(f"ZYPERN ({placement_text(places['CY'])}): ").bold = True
+    p.add_run('EU + Englisch weit verbreitet + Sonne + Steuervorteil (Non-Dom). Kein NATO-Mitglied! ⚠️ Corona: Streng (EU-Niveau).')
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run(f"AUSTRALIEN ({placement_text(places['AU'])}): ").bold = True
+    p.add_run('Englisch, Jobs für F2, exzellente Pflege. ABER: AUKUS-Mitglied bei China-Konflikt exponiert. ⚠️ Corona: EXTREM (Melbourne 262 Tage Lockdown - Weltrekord!).')
+
+    doc.add_paragraph()
+
+    # =============================================================================
+    # FINALE EMPFEHLUNG
+    # =============================================================================
+    on_section(doc, 'FINALE EMPFEHLUNG')
+    doc.add_page_break()
+
+    h = doc.add_paragraph()
+    run = h.add_run('FINALE EMPFEHLUNG')
+    run.bold = True
+    run.font.size = Pt(16)
+    run.font.color.rgb = RGBColor(47, 84, 150)
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    run = p.add_run('ERSTE WAHL: NEUSEELAND')
+    run.bold = True
+    run.font.size = Pt(14)
+    run.font.color.rgb = RGBColor(0, 112, 192)
+
+    doc.add_paragraph('Mit eurem Profil (Englisch, IT, Kapital) ist Neuseeland ideal:')
+    doc.add_paragraph('• Sofortige Integration ohne Sprachbarriere')
+    doc.add_paragraph('• Jobs für beide Familien')
+    doc.add_paragraph('• ZJ-Gemeinschaft auf Englisch')
+    doc.add_paragraph('• Maximal sicher bei NATO-Krise')
+    doc.add_paragraph('• Exzellente Infrastruktur und Pflege')
+    doc.add_paragraph()
+    doc.add_paragraph('⚠️ Seid euch bewusst: Bei der nächsten Pandemie/Krise werden sie wahrscheinlich wieder sehr restriktiv reagieren. Wenn euch das stört, überlegt Alternative.')
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    run = p.add_run('ALTERNATIVE A: URUGUAY (Freiheit + Krise)')
+    run.bold = True
+    run.font.size = Pt(14)
+    run.font.color.rgb = RGBColor(0, 112, 192)
+
+    doc.add_paragraph('Wenn Freiheit bei Krisen + maximale Neutralität wichtig sind:')
+    doc.add_paragraph('• Liberale Corona-Politik bewiesen')
+    doc.add_paragraph('• Neutral, selbstversorgend')
+    doc.add_paragraph('• Perfekte Zeitzone')
+    doc.add_paragraph('• Spanisch lernen nötig')
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    run = p.add_run('ALTERNATIVE B: ZYPERN (EU + Englisch)')
+    run.bold = True
+    run.font.size = Pt(14)
+    run.font.color.rgb = RGBColor(0, 112, 192)
+
+    doc.add_paragraph('Wenn EU-Nähe + Englisch wichtig sind:')
+    doc.add_paragraph('• Englisch weit verbreitet')
+    doc.add_paragraph('• EU-Rechte + Steuervorteil')
+    doc.add_paragraph('• Kein NATO-Mitglied!')
+    doc.add_paragraph('• 3-4h Flug nach DE')
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    run = p.add_run('ALTERNATIVE C: SPANIEN SÜDEN (EU + Nähe)')
+    run.bold = True
+    run.font.size = Pt(14)
+    run.font.color.rgb = RGBColor(0, 112, 192)
+
+    doc.add_paragraph('Wenn maximale Nähe zu Deutschland + EU wichtig sind:')
+    doc.add_paragraph('• 2-3h Flug')
+    doc.add_paragraph('• Gleiche Zeitzone')
+    doc.add_paragraph('• Große Grundstücke möglich')
+    doc.add_paragraph('• Spanisch lernen nötig')
+
+    doc.add_paragraph()
+
+    doc.add_paragraph('─' * 70)
+
+    p = doc.add_paragraph()
+    p.add_run('Erstellt: Januar 2025 | FINALE VERSION').font.size = Pt(9)
+    p = doc.add_paragraph()
+    p.add_run('18 Kriterien inkl.: ZJ | Englisch | Krise | Pflege | Corona-Restriktivität | Zypern').font.size = Pt(9)
+    p = doc.add_paragraph()
+    p.add_run(profile['families']).font.size = Pt(9)
+
+    return doc
@@ -0,0 +1,620 @@
+"""FINAL TENNIS WIND (v8): 20 criteria including tennis weather and wind"""
+
+OUTPUT_FILE = 'Auswanderungsanalyse_2025_FINAL_TENNIS_WIND.docx'
+
+PROFILE = {
+    'tagline': '500k+ EUR Kapital | Remote IT | Zwei-Familien | Englisch | ZJ | Tennis',
+    'families': 'Familie 1: 40J, 2 Kinder | Familie 2: 50J, keine Kinder',
+}
+
+RANKING_COLUMNS = [
+    ('#', 'rank'),
+    ('Land', 'name'),
+    ('Punkte', 'points'),
+    ('%', 'percent'),
+    ('Kommentar', 'note'),
+    ('Tennis', 'Tennis-Wetter'),
+    ('Wind', 'Wind (wenig=gut)'),
+]
+
+COUNTRY_NAMES = {
+    'UY': 'Uruguay',
+    'NZ': 'Neuseeland',
+    'ES': 'Spanien Süd',
+    'AU': 'Australien',
+    'CY': 'Zypern',
+    'KAN': 'Kanaren',
+    'CR': 'Costa Rica',
+    'CL': 'Chile',
+    'NAM': 'Namibia',
+    'DE': 'Deutschland',
+    'SE': 'Schweden',
+    'NI': 'Nicaragua',
+    'NG': 'Nigeria',
+}
+
+RANKING_NOTES = {
+    'UY': ['Neutral + liberal, windig'],
+    'NZ': ['TOP - aber windig!'],
+    'ES': ['Tennis + EU + Sonne'],
+    'AU': ['Englisch + Tennis'],
+    'CY': ['EU + Englisch + Tennis!'],
+    'KAN': ['Klima top, ABER windig!'],
+    'CR': ['Neutral + wenig Wind!'],
+    'CL': ['Isoliert, sehr windig'],
+    'NAM': ['Günstig + Tennis OK'],
+    'DE': ['Kein Tennis Winter'],
+    'SE': ['Liberal, aber kein Tennis'],
+    'NI': ['Instabil'],
+    'NG': ['Nicht empfohlen'],
+}
+
+MATRIX_ROWS = [
+    ["Kriterium", "UY", "NZ", "ES", "AU", "CY", "KAN", "CR", "CL", "NAM", "DE", "SE", "NI", "NG"],
+    
+    ["Geopolitik x2",
+     ("++", "2", "Neutral"),
+     ("++", "2", "Isoliert"),
+     ("o", "1", "NATO"),
+     ("o", "1", "AUKUS"),
+     ("o", "1", "Geteilt"),
+     ("++", "2", "Weit"),
+     ("++", "2", "Neutral"),
+     ("++", "2", "Isoliert"),
+     ("o", "1", "Stabil"),
+     ("--", "0", "Front!"),
+     ("--", "0", "Front!"),
+     ("o", "1", "Instabil"),
+     ("--", "0", "Unsicher")],
+    
+    ["Einwanderung x1.5",
+     ("++", "2", "Einfach"),
+     ("++", "2", "IT-Liste"),
+     ("++", "2", "EU"),
+     ("++", "2", "IT-Liste"),
+     ("++", "2", "EU"),
+     ("++", "2", "EU"),
+     ("++", "2", "Investor"),
+     ("++", "2", "Einfach"),
+     ("++", "2", "Einfach"),
+     ("++", "2", "EU"),
+     ("++", "2", "EU"),
+     ("o", "1", "OK"),
+     ("o", "1", "Schwer")],
+    
+    ["Englisch x1.5",
+     ("o", "1", "Spanisch"),
+     ("++", "2", "Mutter!"),
+     ("o", "1", "Spanisch"),
+     ("++", "2", "Mutter!"),
+     ("++", "2", "Weit verb."),
+     ("o", "1", "Spanisch"),
+     ("o", "1", "OK"),
+     ("--", "0", "Spanisch"),
+     ("++", "2", "Amtsspr."),
+     ("o", "1", "Deutsch"),
+     ("o", "1", "Schwed."),
+     ("o", "1", "Spanisch"),
+     ("o", "1", "Amtsspr.")],
+    
+    ["Grundstück x1.5",
+     ("++", "2", "Günstig"),
+     ("o", "1", "Teuer"),
+     ("++", "2", "OK"),
+     ("o", "1", "Teuer"),
+     ("o", "1", "Begrenzt"),
+     ("o", "1", "Begrenzt"),
+     ("o", "1", "OK"),
+     ("++", "2", "Günstig"),
+     ("++", "2", "Günstig"),
+     ("--", "0", "Teuer"),
+     ("--", "0", "OK"),
+     ("++", "2", "Billig"),
+     ("++", "2", "Risiko")],
+    
+    ["Zeitzone x1",
+     ("++", "2", "-4h"),
+     ("--", "0", "+11h"),
+     ("++", "2", "Gleich"),
+     ("--", "0", "+9h"),
+     ("++", "2", "+1h"),
+     ("++", "2", "Gleich"),
+     ("o", "1", "-7h"),
+     ("o", "1", "-5h"),
+     ("++", "2", "+1h"),
+     ("++", "2", "Basis"),
+     ("++", "2", "Gleich"),
+     ("o", "1", "-7h"),
+     ("o", "1", "+1h")],
+    
+    ["Selbstversorg. x1",
+     ("++", "2", "Ideal"),
+     ("++", "2", "Gut"),
+     ("++", "2", "Gut"),
+     ("o", "1", "Wasser"),
+     ("o", "1", "Wasser"),
+     ("o", "1", "Wasser"),
+     ("o", "1", "Tropisch"),
+     ("o", "1", "OK"),
+     ("o", "1", "Trocken"),
+     ("o", "1", "Bürokr."),
+     ("--", "0", "Kurz"),
+     ("o", "1", "OK"),
+     ("--", "0", "Unsicher")],
+    
+    ["Klima x1",
+     ("++", "2", "2400h"),
+     ("++", "2", "2200h"),
+     ("++", "2", "3000h"),
+     ("o", "1", "Extreme"),
+     ("++", "2", "3300h!"),
+     ("++", "2", "2800h"),
+     ("o", "1", "Tropisch"),
+     ("o", "1", "1700h"),
+     ("++", "2", "3000h"),
+     ("o", "1", "1600h"),
+     ("--", "0", "Kalt"),
+     ("--", "0", "Heiss"),
+     ("--", "0", "Heiss")],
+    
+    ["Rechtssich. x1.5",
+     ("++", "2", "Stabil"),
+     ("++", "2", "Top"),
+     ("++", "2", "EU"),
+     ("++", "2", "Stark"),
+     ("++", "2", "EU"),
+     ("++", "2", "EU"),
+     ("++", "2", "Gut"),
+     ("o", "1", "OK"),
+     ("o", "1", "OK"),
+     ("++", "2", "Stark"),
+     ("++", "2", "Stark"),
+     ("--", "0", "Schwach"),
+     ("--", "0", "Korrupt")],
+    
+    ["Gesundheit x1",
+     ("o", "1", "Gut"),
+     ("++", "2", "Gut"),
+     ("++", "2", "Gut"),
+     ("++", "2", "Top"),
+     ("++", "2", "Gut"),
+     ("++", "2", "Gut"),
+     ("++", "2", "Gut"),
+     ("o", "1", "OK"),
+     ("o", "1", "Begr."),
+     ("++", "2", "Top"),
+     ("++", "2", "Gut"),
+     ("--", "0", "Schwach"),
+     ("--", "0", "Schwach")],
+    
+    ["Lebenserwart. x1",
+     ("++", "2", "78J"),
+     ("++", "2", "83J"),
+     ("++", "2", "84J"),
+     ("++", "2", "84J"),
+     ("++", "2", "81J"),
+     ("++", "2", "84J"),
+     ("++", "2", "80J"),
+     ("++", "2", "80J"),
+     ("o", "1", "66J"),
+     ("++", "2", "81J"),
+     ("++", "2", "83J"),
+     ("o", "1", "75J"),
+     ("--", "0", "55J")],
+    
+    ["Westl. Leben x0.5",
+     ("++", "2", "Voll"),
+     ("++", "2", "Voll"),
+     ("++", "2", "Voll"),
+     ("++", "2", "Voll"),
+     ("++", "2", "Voll"),
+     ("++", "2", "Voll"),
+     ("++", "2", "Gut"),
+     ("o", "1", "Meist"),
+     ("o", "1", "Teils"),
+     ("++", "2", "Voll"),
+     ("++", "2", "Voll"),
+     ("o", "1", "Begr."),
+     ("o", "1", "Begr.")],
+    
+    ["ZJ-Gemeinde x2",
+     ("o", "1", "13k"),
+     ("++", "2", "14k"),
+     ("++", "2", "113k"),
+     ("++", "2", "68k"),
+     ("o", "1", "2k"),
+     ("++", "2", "8k+dt"),
+     ("++", "2", "28k!"),
+     ("++", "2", "79k"),
+     ("o", "1", "3k"),
+     ("++", "2", "176k"),
+     ("o", "1", "Klein"),
+     ("o", "1", "Klein"),
+     ("++", "2", "407k!")],
+    
+    ["ZJ Sprache x1",
+     ("o", "1", "Span."),
+     ("++", "2", "EN!"),
+     ("++", "2", "Dt."),
+     ("++", "2", "EN!"),
+     ("++", "2", "EN!"),
+     ("++", "2", "Dt."),
+     ("o", "1", "Span."),
+     ("o", "1", "Span."),
+     ("++", "2", "EN!"),
+     ("++", "2", "DE!"),
+     ("o", "1", "Schw."),
+     ("o", "1", "Span."),
+     ("++", "2", "EN!")],
+    
+    ["Jobs F2 x2",
+     ("--", "0", "Wenig"),
+     ("++", "2", "Mangel!"),
+     ("o", "1", "Schwer"),
+     ("++", "2", "Mangel!"),
+     ("o", "1", "Tourism."),
+     ("o", "1", "Tourism."),
+     ("o", "1", "Begr."),
+     ("o", "1", "OK"),
+     ("o", "1", "Begr."),
+     ("++", "2", "Gut"),
+     ("++", "2", "Gut"),
+     ("--", "0", "Riskant"),
+     ("--", "0", "Gefährl.")],
+    
+    ["Nähe EU x0.5",
+     ("o", "1", "12h"),
+     ("--", "0", "24h"),
+     ("++", "2", "2-3h"),
+     ("--", "0", "22h"),
+     ("++", "2", "3-4h"),
+     ("++", "2", "4h"),
+     ("o", "1", "12h"),
+     ("o", "1", "14h"),
+     ("o", "1", "10h"),
+     ("++", "2", "Basis"),
+     ("++", "2", "1-2h"),
+     ("o", "1", "12h"),
+     ("o", "1", "6h")],
+    
+    ["Krise NATO x2",
+     ("++", "2", "Neutral"),
+     ("++", "2", "Isoliert"),
+     ("o", "1", "NATO"),
+     ("o", "1", "AUKUS"),
+     ("o", "1", "Nahost"),
+     ("o", "1", "NATO"),
+     ("++", "2", "Neutral!"),
+     ("++", "2", "Isoliert"),
+     ("o", "1", "Import"),
+     ("--", "0", "Front!"),
+     ("--", "0", "Front!"),
+     ("o", "1", "RU-nah"),
+     ("--", "0", "Unruhen")],
+    
+    ["Pflege x1",
+     ("o", "1", "Gut"),
+     ("++", "2", "Gut"),
+     ("++", "2", "EU"),
+     ("++", "2", "Top"),
+     ("++", "2", "EU"),
+     ("++", "2", "EU"),
+     ("o", "1", "OK"),
+     ("o", "1", "OK"),
+     ("--", "0", "Begr."),
+     ("++", "2", "Top"),
+     ("++", "2", "Top"),
+     ("--", "0", "Schwach"),
+     ("--", "0", "Schwach")],
+    
+    ["Corona x1",
+     ("++", "2", "Liberal"),
+     ("--", "0", "Extrem"),
+     ("o", "1", "Streng"),
+     ("--", "0", "Extrem!"),
+     ("o", "1", "Streng"),
+     ("o", "1", "Streng"),
+     ("o", "1", "Moderat"),
+     ("o", "1", "Streng"),
+     ("o", "1", "Moderat"),
+     ("--", "0", "Extrem"),
+     ("++", "2", "Liberal!"),
+     ("++", "2", "Liberal"),
+     ("++", "2", "Liberal")],
+    
+    # NEU: Tennis-Wetter
+    ["Tennis-Wetter x0.5",
+     ("++", "2", "2400h\nmild"),
+     ("o", "1", "Regen\nmöglich"),
+     ("++", "2", "3000h\nganzjährig"),
+     ("++", "2", "Ganzjährig"),
+     ("++", "2", "3300h!\nTop"),
+     ("++", "2", "2800h\nperfekt"),
+     ("o", "1", "Regen\nnachmittags"),
+     ("o", "1", "Süden\nfeucht"),
+     ("++", "2", "3000h\ntrocken"),
+     ("--", "0", "Winter\nzu kalt"),
+     ("--", "0", "6 Monate\nnicht"),
+     ("o", "1", "Tropisch\nheiss"),
+     ("o", "1", "Tropisch\nheiss")],
+    
+    # NEU: Wind (wenig = gut)
+    ["Wind (wenig=gut) x0.5",
+     ("--", "0", "Atlantik\nwindig"),
+     ("--", "0", "Sehr\nwindig!"),
+     ("o", "1", "Küste\nwindig"),
+     ("o", "1", "Variiert"),
+     ("o", "1", "Moderat"),
+     ("--", "0", "SEHR\nwindig!"),
+     ("++", "2", "Täler\ngeschützt"),
+     ("--", "0", "Patagon.\nextrem"),
+     ("o", "1", "Küste\nwindig"),
+     ("o", "1", "Moderat"),
+     ("o", "1", "Moderat"),
+     ("o", "1", "OK"),
+     ("o", "1", "OK")],
+]
+
+# Criteria the recommendation for tennis players is ranked by
+TENNIS_CRITERIA = ('Tennis-Wetter', 'Wind (wenig=gut)')
+
+# Name and reason of the countries that can lead that recommendation
+TENNIS_PICKS = {
+    'CY': ('ZYPERN', 'Starke Kombination: 3.300h Sonne + moderater Wind + Englisch + EU'),
+    'ES': ('SPANIEN SÜD (Inland)', '3.000h + weniger Wind als Küste + große Grundstücke'),
+    'CR': ('COSTA RICA', 'Geschützte Täler + kein Militär + neutral'),
+}
+
+DATA = {
+    'tennis_criteria': TENNIS_CRITERIA,
+    'tennis_picks': TENNIS_PICKS,
+    'ranking_columns': RANKING_COLUMNS,
+    'country_names': COUNTRY_NAMES,
+    'ranking_notes': RANKING_NOTES,
+    'matrix_rows': MATRIX_ROWS,
+}
+
+
+def build_report(profile=None, data=None, on_section=None):
+    """Build the report; profile and data default to PROFILE and DATA.
+
+    ``on_section(doc, title)`` is called at the start of every section.
+    """
+    from docx import Document
+    from docx.shared import Pt, Cm, RGBColor
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+
+    from auswanderung.ranking import (check_countries, criteria_order, placement_text, placements,
+                                      ranking_table)
+    from auswanderung.reports import skip_section
+    from auswanderung.styles import register_styles
+    from auswanderung.tables import create_table_original_style
+    from auswanderung.xmltable import add_matrix_table
+
+    profile = PROFILE if profile is None else profile
+    data = DATA if data is None else data
+    on_section = skip_section if on_section is None else on_section
+
+    # Create document
+    doc = Document()
+    register_styles(doc)
+
+    for section in doc.sections:
+        section.top_margin = Cm(1.5)
+        section.bottom_margin = Cm(1.5)
+        section.left_margin = Cm(1.5)
+        section.right_margin = Cm(1.5)
+
+    # =============================================================================
+    # TITLE
+    # =============================================================================
+    on_section(doc, 'TITLE')
+    title = doc.add_paragraph()
+    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    run = title.add_run('AUSWANDERUNGSANALYSE 2025 - FINALE VERSION')
+    run.bold = True
+    run.font.size = Pt(24)
+
+    subtitle = doc.add_paragraph()
+    subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    run = subtitle.add_run('PERSONALISIERT FÜR EUER PROFIL')
+    run.font.size = Pt(14)
+    run.font.color.rgb = RGBColor(47, 84, 150)
+
+    tagline = doc.add_paragraph()
+    tagline.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    run = tagline.add_run(profile['tagline'])
+    run.font.size = Pt(10)
+    run.font.italic = True
+
+    doc.add_paragraph()
+
+    # =============================================================================
+    # EUER PROFIL
+    # =============================================================================
+    on_section(doc, 'EUER PROFIL')
+    h = doc.add_paragraph()
+    run = h.add_run('EUER PROFIL - STÄRKEN')
+    run.bold = True
+    run.font.size = Pt(14)
+    run.font.color.rgb = RGBColor(47, 84, 150)
+
+    doc.add_paragraph()
+
+    p1 = doc.add_paragraph()
+    p1.add_run('1. Kapital (500k+ EUR) ').bold = True
+    p1.add_run('| 2. Remote IT-Job | 3. Fließend Englisch | 4. Zwei-Familien-Projekt')
+
+    p2 = doc.add_paragraph()
+    p2.add_run('5. Familie 2: Eigenkapital + Vor-Ort-Jobs ').bold = True
+    p2.add_run('| 6. Zeugen Jehovas | 7. Tennis ganzjährig')
+
+    doc.add_paragraph()
+
+    # =============================================================================
+    # GESAMTRANKING - MIT TENNIS + WIND
+    # =============================================================================
+    on_section(doc, 'GESAMTRANKING - MIT TENNIS + WIND')
+    h = doc.add_paragraph()
+    run = h.add_run('GESAMTRANKING - 20 KRITERIEN')
+    run.bold = True
+    run.font.size = Pt(14)
+    run.font.color.rgb = RGBColor(47, 84, 150)
+
+    doc.add_paragraph()
+
+    # Ranking mit Tennis + Wind eingerechnet
+    # Tennis-Wetter: Zypern++, Kanaren++, Spanien++, Namibia++, AU++, UY++, NZ o, CR o, CL o, DE--, SE--, NI o, NG o
+    # Wind (wenig=gut): CR++, CY o, ES o, AU o, DE o, KAN--, NZ--, UY--, CL--, NAM o
+    ranking_data = ranking_table(data['matrix_rows'], data['ranking_columns'], data['country_names'],
+                                 data['ranking_notes'])
+    create_table_original_style(doc, ranking_data)
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('NEU: ').bold = True
+    p.add_run('Tennis-Wetter (ganzjährig spielbar) und Wind (wenig = gut) als Kriterien mit Gewicht x0.5.')
+
+    doc.add_page_break()
+
+    # =============================================================================
+    # DETAILMATRIX - 20 KRITERIEN
+    # =============================================================================
+    on_section(doc, 'DETAILMATRIX - 20 KRITERIEN')
+    h = doc.add_paragraph()
+    run = h.add_run('DETAILMATRIX - 20 KRITERIEN')
+    run.bold = True
+    run.font.size = Pt(16)
+    run.font.color.rgb = RGBColor(47, 84, 150)
+
+    doc.add_paragraph()
+
+    legend = doc.add_paragraph()
+    legend.add_run('++ = Sehr gut (2) | o = Mittel (1) | -- = Schlecht (0)')
+
+    doc.add_paragraph()
+
+    abbrev = doc.add_paragraph()
+    run = abbrev.add_run('UY=Uruguay, NZ=Neuseeland, ES=Spanien, AU=Australien, CY=Zypern, KAN=Kanaren, CR=Costa Rica, CL=Chile, NAM=Namibia, DE=Deutschland, SE=Schweden, NI=Nicaragua, NG=Nigeria')
+    run.font.size = Pt(8)
+
+    doc.add_paragraph()
+
+    # Matrix mit 20 Kriterien inkl. Tennis + Wind
+    matrix_rows = data['matrix_rows']
+
+    # Create matrix table
+    add_matrix_table(doc, matrix_rows)
+
+    doc.add_page_break()
+
+    # =============================================================================
+    # TENNIS + WIND ANALYSE
+    # =============================================================================
+    on_section(doc, 'TENNIS + WIND ANALYSE')
+    h = doc.add_paragraph()
+    run = h.add_run('TENNIS-WETTER & WIND - DETAILANALYSE')
+    run.bold = True
+    run.font.size = Pt(14)
+    run.font.color.rgb = RGBColor(47, 84, 150)
+
+    doc.add_paragraph()
+
+    h3 = doc.add_paragraph()
+    h3.add_run('TENNIS-WETTER (ganzjährig spielbar):').bold = True
+
+    doc.add_paragraph()
+
+    doc.add_paragraph('++ ZYPERN: 3.300 Sonnenstunden, ganzjährig 15-35°C - perfekt für Tennis!')
+    doc.add_paragraph('++ KANAREN: 2.800h, ganzjährig 18-28°C - ideale Bedingungen')
+    doc.add_paragraph('++ SPANIEN SÜD: 3.000h, 10+ Monate spielbar')
+    doc.add_paragraph('++ URUGUAY: 2.400h, milde Winter, gut spielbar')
+    doc.add_paragraph('++ AUSTRALIEN: Ganzjährig (außer tropischer Norden im Sommer)')
+    doc.add_paragraph('++ NAMIBIA: 3.000h Sonne, sehr trocken - top für Outdoor')
+    doc.add_paragraph('o NEUSEELAND: 2.200h, aber Regen möglich, nicht immer ideal')
+    doc.add_paragraph('o COSTA RICA: Tropisch, nachmittags oft Regen')
+    doc.add_paragraph('-- DEUTSCHLAND: Winter 4-5 Monate nicht outdoor spielbar')
+    doc.add_paragraph('-- SCHWEDEN: 6+ Monate zu kalt/dunkel')
+
+    doc.add_paragraph()
+
+    h3 = doc.add_paragraph()
+    h3.add_run('WIND (wenig = gut für Tennis/Outdoor):').bold = True
+
+    doc.add_paragraph()
+
+    doc.add_paragraph('++ COSTA RICA: Geschützte Täler, wenig Wind')
+    doc.add_paragraph('o ZYPERN: Mittelmeer, moderater Wind')
+    doc.add_paragraph('o SPANIEN: Inland OK, Küste (Costa de la Luz) windig')
+    doc.add_paragraph('o AUSTRALIEN: Variiert stark nach Region')
+    doc.add_paragraph('-- KANAREN: SEHR windig! Fuerteventura = Windsurf-Paradies = Tennis-Hölle')
+    doc.add_paragraph('-- NEUSEELAND: Bekannt für Wind! Wellington = "Windy Welly"')
+    doc.add_paragraph('-- URUGUAY: Atlantikküste sehr windig')
+    doc.add_paragraph('-- CHILE: Patagonien extrem windig')
+
+    doc.add_paragraph()
+
+    # =============================================================================
+    # FINALE EMPFEHLUNG
+    # =============================================================================
+    on_section(doc, 'FINALE EMPFEHLUNG')
+    places, _ = placements(data['matrix_rows'])
+    h = doc.add_paragraph()
+    run = h.add_run('FINALE EMPFEHLUNG - MIT TENNIS + WIND')
+    run.bold = True
+    run.font.size = Pt(14)
+    run.font.color.rgb = RGBColor(47, 84, 150)
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    run = p.add_run('FÜR TENNIS-SPIELER:')
+    run.bold = True
+    run.font.size = Pt(12)
+    run.font.color.rgb = RGBColor(0, 112, 192)
+
+    doc.add_paragraph()
+
+    picks = data['tennis_picks']
+    tennis = criteria_order(data['matrix_rows'], data['tennis_criteria'])[:len(picks)]
+    check_countries('tennis picks', picks, tennis)
+    for number, country in enumerate(tennis, start=1):
+        name, reason = picks[country]
+        doc.add_paragraph(f"{number}. {name} - {reason}")
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    p.add_run('ACHTUNG bei diesen Ländern: ').bold = True
+
+    doc.add_paragraph()
+
+    doc.add_paragraph('• KANAREN: Super Klima, ABER sehr windig - Tennis frustrierend!')
+    doc.add_paragraph('• NEUSEELAND: Top bei allem, ABER windig - outdoor Tennis eingeschränkt')
+    doc.add_paragraph('• URUGUAY: Atlantikküste windig - besser im Landesinneren')
+
+    doc.add_paragraph()
+
+    p = doc.add_paragraph()
+    run = p.add_run('GESAMTEMPFEHLUNG:')
+    run.bold = True
+    run.font.size = Pt(12)
+    run.font.color.rgb = RGBColor(0, 112, 192)
+
+    doc.add_paragraph()
+
+    doc.add_paragraph(f"Wenn Tennis wichtig ist: {picks[tennis[0]][0]} oder {picks[tennis[1]][0]}")
+    doc.add_paragraph(f"Wenn alles andere wichtiger ist: NEUSEELAND "
+                      f"({placement_text(places['NZ'])}, aber mit Wind leben)")
+
+    doc.add_paragraph()
+
+    doc.add_paragraph('─' * 70)
+
+    p = doc.add_paragraph()
+    p.add_run('Erstellt: Januar 2025 | FINALE VERSION mit Tennis + Wind').font.size = Pt(9)
+    p = doc.add_paragraph()
+    p.add_run(f"20 Kriterien | {profile['families']}").font.size = Pt(9)
+
+    return doc
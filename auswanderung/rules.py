@@ -0,0 +1,181 @@
+"""Derive matrix symbols and points from raw metrics by thresholds.
+
+Symbols and points in ``matrix_rows`` are assigned by hand from the facts
+in the explanation ("2400h", "12h", "-4h"). A Rule ties a criterion to a
+raw metric and two thresholds:
+
+* higher is better: below the first threshold "--", below the second
+  "o", otherwise "++"
+* lower is better: up to the first threshold "++", up to the second "o",
+  otherwise "--"
+
+The metrics live in a MetricTable (countries x metrics, NaN where a value
+is missing), read for example from a CSV file with one row per country.
+``derive`` bins a whole metric column with one ``np.digitize`` per rule and
+rewrites the matching cells of ``matrix_rows``; the explanation becomes the
+rule's template filled with the value, or stays as it was without one.
+Countries without a value keep their hand-assigned cell, so the metrics
+can be filled in one source at a time.
+
+RULES holds the rules for the criteria of the v8 matrix that the climate,
+tennis, wind, time zone and flight modules measure.
+
+Usage: python -m auswanderung.rules REPORT METRICS.csv
+"""
+import argparse
+import csv
+from collections import namedtuple
+from pathlib import Path
+
+import numpy as np
+
+from auswanderung.ranking import format_points
+from auswanderung.reports import load_report
+from auswanderung.scoring import MAX_POINTS, criterion_name, load_matrix, score
+
+# Symbol for 0, 1 and 2 points
+SYMBOLS = ('--', 'o', '++')
+
+Rule = namedtuple('Rule', ['criterion', 'metric', 'thresholds', 'higher_is_better',
+                           'explanation'])
+Rule.__doc__ = """Binning of one raw metric into the points of one criterion.
+
+thresholds are the MAX_POINTS ascending bin edges; explanation is a
+format string with ``{value}`` or None to keep the explanation text.
+"""
+
+MetricTable = namedtuple('MetricTable', ['countries', 'metrics', 'values'])
+MetricTable.__doc__ = """Raw metrics: values is a float array (countries, metrics), NaN if unknown
+"""
+
+
+def rule(criterion, metric, thresholds, higher_is_better=True, explanation=None):
+    """Create a Rule, checking its thresholds"""
+    thresholds = tuple(float(value) for value in thresholds)
+    if len(thresholds) != MAX_POINTS or list(thresholds) != sorted(thresholds):
+        raise ValueError(f"{criterion}: expected {MAX_POINTS} ascending thresholds, "
+                         f"got {thresholds}")
+    return Rule(criterion, metric, thresholds, higher_is_better, explanation)
+
+
+RULES = (
+    rule('Klima', 'sunshine_hours', (2000, 2800), explanation='{value}h'),
+    rule('Tennis-Wetter', 'tennis_days', (150, 250), explanation='{value} Tage'),
+    rule('Wind (wenig=gut)', 'windy_percent', (10, 25), higher_is_better=False,
+         explanation='{value}% windig'),
+    rule('Zeitzone', 'overlap_hours', (1, 4), explanation='{value}h gemeinsam'),
+    rule('Nähe EU', 'flight_hours', (5, 12), higher_is_better=False, explanation='{value}h'),
+)
+
+
+def metric_table(values):
+    """Build a MetricTable from ``{country: {metric: value}}``"""
+    countries = tuple(values)
+    metrics = tuple(dict.fromkeys(metric for row in values.values() for metric in row))
+    table = np.full((len(countries), len(metrics)), np.nan)
+    column = {metric: j for j, metric in enumerate(metrics)}
+    for i, country in enumerate(countries):
+        for metric, value in values[country].items():
+            table[i, column[metric]] = np.nan if value is None else float(value)
+    return MetricTable(countries, metrics, table)
+
+
+def read_metrics(path):
+    """Read a MetricTable from a CSV file: a "country" column, then one column per metric"""
+    with open(path, newline='', encoding='utf-8') as source:
+        reader = csv.reader(source)
+        header = next(reader)
+        if not header or header[0] != 'country':
+            raise ValueError(f"{path}: the first column must be 'country'")
+        rows = [row for row in reader if row]
+    values = np.full((len(rows), len(header) - 1), np.nan)
+    for i, row in enumerate(rows):
+        for j, text in enumerate(row[1:len(header)]):
+            if text.strip():
+                values[i, j] = float(text.replace(',', '.'))
+    return MetricTable(tuple(row[0] for row in rows), tuple(header[1:]), values)
+
+
+def write_metrics(path, table):
+    """Write a MetricTable as CSV for read_metrics, one decimal, empty where unknown"""
+    with open(path, 'w', newline='', encoding='utf-8') as output:
+        writer = csv.writer(output, lineterminator='\n')
+        writer.writerow(('country',) + tuple(table.metrics))
+        for country, row in zip(table.countries, table.values):
+            writer.writerow([country] + ['' if np.isnan(value) else f"{value:.1f}"
+                                         for value in row])
+
+
+def bin_points(values, thresholds, higher_is_better=True):
+    """Points for an array of metric values; -1 where a value is NaN"""
+    values = np.asarray(values, dtype=np.float64)
+    if higher_is_better:
+        points = np.digitize(values, thresholds)
+    else:
+        points = MAX_POINTS - np.digitize(values, thresholds, right=True)
+    return np.where(np.isnan(values), -1, points).astype(np.int8)
+
+
+def format_value(value):
+    """Format a metric value for an explanation: 2400.0 -> '2400', 4.25 -> '4,3'"""
+    return format_points(round(float(value), 1))
+
+
+def derive(matrix_rows, metrics, rules=RULES):
+    """Return ``matrix_rows`` with the cells of every rule derived from ``metrics``.
+
+    Rules whose criterion or metric is missing are skipped, so the same
+    rules serve reports with fewer criteria.
+    """
+    countries = matrix_rows[0][1:]
+    metric_of = {metric: j for j, metric in enumerate(metrics.metrics)}
+    row_of = {country: i for i, country in enumerate(metrics.countries)}
+    present = np.array([country in row_of for country in countries])
+    rows_index = np.array([row_of.get(country, 0) for country in countries], dtype=np.intp)
+    criterion_row = {criterion_name(row[0]): r for r, row in enumerate(matrix_rows) if r}
+    result = [list(row) for row in matrix_rows]
+    for item in rules:
+        if item.criterion not in criterion_row or item.metric not in metric_of:
+            continue
+        values = np.full(len(countries), np.nan)
+        values[present] = metrics.values[rows_index[present], metric_of[item.metric]]
+        points = bin_points(values, item.thresholds, item.higher_is_better)
+        row = result[criterion_row[item.criterion]]
+        for i in np.flatnonzero(points >= 0):
+            explanation = row[i + 1][2] if item.explanation is None \
+                else item.explanation.format(value=format_value(values[i]))
+            row[i + 1] = (SYMBOLS[points[i]], str(points[i]), explanation)
+    return result
+
+
+def changed_cells(before, after):
+    """Yield (country, criterion, old cell, new cell) for every cell that differs"""
+    countries = before[0][1:]
+    for old, new in zip(before[1:], after[1:]):
+        for country, old_cell, new_cell in zip(countries, old[1:], new[1:]):
+            if old_cell != new_cell:
+                yield country, criterion_name(old[0]), old_cell, new_cell
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('report', help="report name, e.g. final_v8_tennis_wind")
+    parser.add_argument('metrics', type=Path, help="CSV file with one row per country")
+    args = parser.parse_args(argv)
+    data = load_report(args.report).DATA
+    if 'matrix_rows' not in data:
+        parser.error(f"{args.report} hat keine Detailmatrix")
+    before = data['matrix_rows']
+    after = derive(before, read_metrics(args.metrics))
+    changes = list(changed_cells(before, after))
+    for country, criterion, old, new in changes:
+        print(f"{country:<6} {criterion:<24} {old[0]:>2} {old[2]!r:<20} -> {new[0]:>2} {new[2]!r}")
+    old_scores, new_scores = score(load_matrix(before)), score(load_matrix(after))
+    print(f"\n{len(changes)} Zellen geändert")
+    for i in new_scores.order:
+        print(f"{new_scores.ranks[i]:>3} {before[0][i + 1]:<6} {new_scores.percent[i]:>5.1f}% "
+              f"(vorher {old_scores.ranks[i]}., {old_scores.percent[i]:.1f}%)")
+
+
+if __name__ == '__main__':
+    main()
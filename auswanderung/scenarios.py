@@ -0,0 +1,198 @@
+"""Scenario overlays on top of a base matrix.
+
+A scenario only describes what differs from the base: criteria added or
+removed, countries added, single cells overridden and additive per-country
+modifiers (points added to a country's total). Scenarios are evaluated
+against a precomputed ``Base``, so scoring a combination of scenarios costs
+the size of its deltas instead of a copy and rescore of the whole matrix.
+``materialize`` builds the full matrix when a report needs to render it.
+
+Criteria are addressed by name without weight ("Geopolitik"), added criteria
+by their full label with weight ("Tennis-Wetter x0.5"), cells are
+``(symbol, points, explanation)`` tuples as in ``matrix_rows``.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from auswanderung.scoring import MAX_POINTS, Matrix, Scores, criterion_name, parse_weight, rank_desc
+
+Scenario = namedtuple('Scenario', ['name', 'add_criteria', 'remove_criteria', 'add_countries',
+                                   'overrides', 'modifiers'])
+Scenario.__doc__ = """Deltas against a base matrix.
+
+add_criteria maps a label with weight to ``{country: cell}`` for every
+country including added ones, remove_criteria lists criterion names,
+add_countries maps a country code to ``{criterion: cell}`` for every kept
+base criterion, overrides
+maps ``(country, criterion)`` to a cell and modifiers maps a country to points
+added to its total (not to the maximum).
+"""
+
+Base = namedtuple('Base', ['matrix', 'totals', 'max_total', 'country_index', 'criterion_index'])
+Base.__doc__ = """A matrix with its totals and lookup tables, computed once for all scenarios"""
+
+
+def scenario(name, add_criteria=None, remove_criteria=(), add_countries=None, overrides=None,
+             modifiers=None):
+    """Create a Scenario; omitted deltas are empty"""
+    return Scenario(name, dict(add_criteria or {}), tuple(remove_criteria),
+                    dict(add_countries or {}), dict(overrides or {}), dict(modifiers or {}))
+
+
+def compose(*scenarios):
+    """Merge scenarios into one, later scenarios taking precedence.
+
+    Removing a criterion also drops the overrides earlier scenarios made for
+    it, whether it was a base criterion or added by an earlier scenario.
+    """
+    add_criteria, removed, add_countries, overrides, modifiers = {}, [], {}, {}, {}
+    for item in scenarios:
+        for name in item.remove_criteria:
+            dropped = [label for label in add_criteria if criterion_name(label) == name]
+            for label in dropped:
+                del add_criteria[label]
+            if not dropped and name not in removed:
+                removed.append(name)
+            for key in [key for key in overrides if key[1] == name]:
+                del overrides[key]
+        add_criteria.update(item.add_criteria)
+        add_countries.update(item.add_countries)
+        overrides.update(item.overrides)
+        for country, delta in item.modifiers.items():
+            modifiers[country] = modifiers.get(country, 0) + delta
+    name = ' + '.join(item.name for item in scenarios)
+    return Scenario(name, add_criteria, tuple(removed), add_countries, overrides, modifiers)
+
+
+def base(matrix):
+    """Precompute totals and indices of ``matrix`` for scenario evaluation"""
+    return Base(matrix, matrix.points @ matrix.weights, MAX_POINTS * matrix.weights.sum(),
+                {country: i for i, country in enumerate(matrix.countries)},
+                {name: j for j, name in enumerate(matrix.criteria)})
+
+
+def cell_points(cell):
+    points = int(cell[1])
+    if not 0 <= points <= MAX_POINTS:
+        raise ValueError(f"points must be between 0 and {MAX_POINTS}: {cell!r}")
+    return points
+
+
+def resolve(base, delta):
+    """Check ``delta`` against ``base``; return kept and added criteria and all countries"""
+    matrix = base.matrix
+    unknown = [name for name in delta.remove_criteria if name not in base.criterion_index]
+    if unknown:
+        raise ValueError(f"{delta.name}: cannot remove unknown criteria {unknown}")
+    added = [criterion_name(label) for label in delta.add_criteria]
+    kept = [name for name in matrix.criteria if name not in delta.remove_criteria]
+    duplicate = set(added) & set(kept)
+    if duplicate or len(set(added)) != len(added):
+        raise ValueError(f"{delta.name}: criteria added twice: {sorted(duplicate) or added}")
+    duplicate = set(delta.add_countries) & set(matrix.countries)
+    if duplicate:
+        raise ValueError(f"{delta.name}: countries already in the matrix: {sorted(duplicate)}")
+    countries = list(matrix.countries) + list(delta.add_countries)
+    for label, cells in delta.add_criteria.items():
+        missing = [country for country in countries if country not in cells]
+        if missing:
+            raise ValueError(f"{delta.name}: {label!r} has no cell for {missing}")
+    for country, cells in delta.add_countries.items():
+        missing = [name for name in kept if name not in cells]
+        if missing:
+            raise ValueError(f"{delta.name}: {country!r} has no cell for {missing}")
+    for country, name in delta.overrides:
+        if country not in countries or (name not in kept and name not in added):
+            raise ValueError(f"{delta.name}: override for unknown cell {(country, name)!r}")
+    unknown = [country for country in delta.modifiers if country not in countries]
+    if unknown:
+        raise ValueError(f"{delta.name}: modifiers for unknown countries {unknown}")
+    return kept, added, countries
+
+
+def evaluate(base, *scenarios):
+    """Score the base matrix with ``scenarios`` applied, touching only the changed cells"""
+    delta = compose(*scenarios)
+    kept, _, countries = resolve(base, delta)
+    matrix = base.matrix
+    first_added = len(matrix.countries)
+    added = {criterion_name(label): (parse_weight(label), cells)
+             for label, cells in delta.add_criteria.items()}
+    row = {country: i for i, country in enumerate(delta.add_countries, start=first_added)}
+    row.update((country, base.country_index[country])
+               for country, _ in delta.overrides if country not in row)
+    row.update((country, base.country_index[country])
+               for country in delta.modifiers if country not in row)
+
+    def weight(name):
+        return added[name][0] if name in added else matrix.weights[base.criterion_index[name]]
+
+    totals = np.empty(len(countries), dtype=np.float64)
+    totals[:first_added] = base.totals
+    max_total = base.max_total
+    if delta.remove_criteria:
+        removed = [base.criterion_index[name] for name in delta.remove_criteria]
+        totals[:first_added] -= matrix.points[:, removed] @ matrix.weights[removed]
+        max_total -= MAX_POINTS * matrix.weights[removed].sum()
+    for criterion_weight, cells in added.values():
+        totals[:first_added] += criterion_weight * np.array(
+            [cell_points(cells[country]) for country in matrix.countries], dtype=np.float64)
+        max_total += MAX_POINTS * criterion_weight
+    for country, cells in delta.add_countries.items():
+        totals[row[country]] = sum(weight(name) * cell_points(cells[name]) for name in kept)
+        totals[row[country]] += sum(criterion_weight * cell_points(by_country[country])
+                                    for criterion_weight, by_country in added.values())
+
+    for (country, name), cell in delta.overrides.items():
+        if name in added:
+            old = added[name][1][country]
+        elif country in delta.add_countries:
+            old = delta.add_countries[country][name]
+        else:
+            old = matrix.cells[base.criterion_index[name]][base.country_index[country]]
+        totals[row[country]] += weight(name) * (cell_points(cell) - cell_points(old))
+
+    for country, modifier in delta.modifiers.items():
+        totals[row[country]] += modifier
+
+    percent = 100.0 * totals / max_total if max_total else np.zeros_like(totals)
+    order = np.argsort(-totals, kind='stable')
+    return tuple(countries), Scores(totals, max_total, percent, rank_desc(totals), order)
+
+
+def materialize(base, *scenarios):
+    """Build the full Matrix with ``scenarios`` applied; modifiers only affect ``evaluate``"""
+    delta = compose(*scenarios)
+    kept, added_names, countries = resolve(base, delta)
+    criteria = kept + added_names
+    matrix = base.matrix
+    added = {criterion_name(label): (label, cells) for label, cells in delta.add_criteria.items()}
+    weights, cells = [], []
+    for name in criteria:
+        if name in added:
+            label, by_country = added[name]
+            weights.append(parse_weight(label))
+            row = [by_country[country] for country in countries]
+        else:
+            j = base.criterion_index[name]
+            weights.append(matrix.weights[j])
+            row = list(matrix.cells[j]) + [delta.add_countries[country][name]
+                                           for country in countries[len(matrix.countries):]]
+        cells.append(row)
+    column = {country: i for i, country in enumerate(countries)}
+    row_of = {name: j for j, name in enumerate(criteria)}
+    for (country, name), cell in delta.overrides.items():
+        cells[row_of[name]][column[country]] = cell
+    points = np.array([[cell_points(cell) for cell in row] for row in cells], dtype=np.int8)
+    points = np.ascontiguousarray(points.reshape(len(criteria), len(countries)).T)
+    return Matrix(tuple(countries), tuple(criteria), np.array(weights, dtype=np.float64), points,
+                  tuple(tuple(row) for row in cells))
+
+
+def matrix_rows(matrix, title='Kriterium'):
+    """Return ``matrix`` in the ``matrix_rows`` layout the report tables render"""
+    rows = [[title] + list(matrix.countries)]
+    for name, weight, cells in zip(matrix.criteria, matrix.weights, matrix.cells):
+        rows.append([f"{name} x{weight:g}"] + list(cells))
+    return rows
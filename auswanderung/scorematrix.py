@@ -0,0 +1,157 @@
+"""Array-backed score matrix with interned symbols and explanations.
+
+A scoring.Matrix keeps every cell as a tuple of three strings. ScoreMatrix
+keeps the same content in three grids of shape (countries, criteria):
+
+* ``points``: int8
+* ``symbols``: uint8 codes into ``symbol_table``
+* ``explanations``: int32 indices into ``strings``, the deduplicated texts
+
+That is 6 bytes per cell plus each distinct text once, instead of a tuple
+and its pointers per cell. Selecting countries or criteria slices the grids
+and shares the string table; pickling drops texts a selection no longer
+uses. ScoreMatrix has the ``countries``, ``criteria``, ``weights``,
+``points`` and ``cells`` of a Matrix, so the scoring, scenario and ranking
+functions accept it unchanged.
+"""
+import numpy as np
+
+from auswanderung.scoring import MAX_POINTS, criterion_name, parse_weight
+
+
+class CellRows:
+    """Read-only ``cells[criterion][country]`` view that builds tuples on access"""
+
+    __slots__ = ('matrix',)
+
+    def __init__(self, matrix):
+        self.matrix = matrix
+
+    def __len__(self):
+        return len(self.matrix.criteria)
+
+    def __getitem__(self, criterion):
+        matrix = self.matrix
+        return tuple(matrix.cell(country, criterion) for country in range(len(matrix.countries)))
+
+    def __iter__(self):
+        return (self[j] for j in range(len(self)))
+
+
+class ScoreMatrix:
+    """Countries x criteria matrix of points, symbol codes and explanation indices"""
+
+    __slots__ = ('countries', 'criteria', 'weights', 'points', 'symbols', 'explanations',
+                 'symbol_table', 'strings')
+
+    def __init__(self, countries, criteria, weights, points, symbols, explanations, symbol_table,
+                 strings):
+        shape = (len(countries), len(criteria))
+        for name, grid in (('points', points), ('symbols', symbols), ('explanations', explanations)):
+            if grid.shape != shape:
+                raise ValueError(f"{name} has shape {grid.shape}, expected {shape}")
+        if len(weights) != len(criteria):
+            raise ValueError(f"{len(weights)} weights for {len(criteria)} criteria")
+        self.countries = tuple(countries)
+        self.criteria = tuple(criteria)
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.points = np.asarray(points, dtype=np.int8)
+        self.symbols = np.asarray(symbols, dtype=np.uint8)
+        self.explanations = np.asarray(explanations, dtype=np.int32)
+        self.symbol_table = tuple(symbol_table)
+        self.strings = strings
+
+    @classmethod
+    def from_cells(cls, countries, criteria, weights, cells):
+        """Build from ``cells[criterion][country]`` tuples, interning symbols and texts"""
+        shape = (len(countries), len(criteria))
+        points = np.empty(shape, dtype=np.int8)
+        symbols = np.empty(shape, dtype=np.uint8)
+        explanations = np.empty(shape, dtype=np.int32)
+        symbol_codes, string_codes = {}, {}
+        for j, row in enumerate(cells):
+            if len(row) != shape[0]:
+                raise ValueError(
+                    f"criterion {criteria[j]!r} has {len(row)} cells for {shape[0]} countries")
+            for i, (symbol, value, explanation) in enumerate(row):
+                points[i, j] = value = int(value)
+                if not 0 <= value <= MAX_POINTS:
+                    raise ValueError(f"points must be between 0 and {MAX_POINTS}")
+                if symbol not in symbol_codes:
+                    if len(symbol_codes) == 256:
+                        raise ValueError(f"at most 256 distinct symbols, {symbol!r} is one more")
+                    symbol_codes[symbol] = len(symbol_codes)
+                symbols[i, j] = symbol_codes[symbol]
+                explanations[i, j] = string_codes.setdefault(explanation, len(string_codes))
+        return cls(countries, criteria, weights, points, symbols, explanations, symbol_codes,
+                   tuple(string_codes))
+
+    @classmethod
+    def from_rows(cls, matrix_rows):
+        """Parse ``matrix_rows`` (see auswanderung.scoring) without building a Matrix first"""
+        header, rows = matrix_rows[0], matrix_rows[1:]
+        return cls.from_cells(header[1:], [criterion_name(row[0]) for row in rows],
+                              [parse_weight(row[0]) for row in rows], [row[1:] for row in rows])
+
+    @classmethod
+    def from_matrix(cls, matrix):
+        """Convert a scoring.Matrix"""
+        return cls.from_cells(matrix.countries, matrix.criteria, matrix.weights, matrix.cells)
+
+    @classmethod
+    def from_file(cls, matrix_file):
+        """Wrap a MatrixFile (auswanderung.matrixfile) without copying its columns"""
+        return cls(matrix_file.countries, matrix_file.criteria, matrix_file.weights,
+                   matrix_file.points, matrix_file.symbols, matrix_file.explanations,
+                   matrix_file.symbol_table, matrix_file.strings)
+
+    @property
+    def cells(self):
+        return CellRows(self)
+
+    def cell(self, country, criterion):
+        """Return the (symbol, points, explanation) tuple of one cell, by index"""
+        return (self.symbol_table[self.symbols[country, criterion]],
+                str(int(self.points[country, criterion])),
+                self.strings[self.explanations[country, criterion]])
+
+    def positions(self, names, selected):
+        """Turn names, indices or a slice into something NumPy can index with"""
+        if selected is None or isinstance(selected, slice):
+            return slice(None) if selected is None else selected
+        if isinstance(selected, (str, int, np.integer)):
+            selected = (selected,)
+        index = {name: i for i, name in enumerate(names)}
+        return [index[item] if isinstance(item, str) else item for item in selected]
+
+    def select(self, countries=None, criteria=None):
+        """Return the sub-matrix of the given countries and criteria (names, indices or slices).
+
+        A single name or index such as ``countries='NZ'`` keeps just that one.
+        Slices give views of the grids; the string table is shared either way.
+        """
+        rows = self.positions(self.countries, countries)
+        columns = self.positions(self.criteria, criteria)
+        grid = (rows, columns) if isinstance(rows, slice) or isinstance(columns, slice) \
+            else np.ix_(rows, columns)
+        names = np.array(self.countries, dtype=object)[rows]
+        labels = np.array(self.criteria, dtype=object)[columns]
+        return ScoreMatrix(names, labels, self.weights[columns], self.points[grid],
+                           self.symbols[grid], self.explanations[grid], self.symbol_table,
+                           self.strings)
+
+    def compacted(self):
+        """Return a copy whose string table holds only the texts this matrix uses"""
+        used, explanations = np.unique(self.explanations, return_inverse=True)
+        return ScoreMatrix(self.countries, self.criteria, self.weights.copy(), self.points.copy(),
+                           self.symbols.copy(), explanations.reshape(self.explanations.shape),
+                           self.symbol_table, tuple(self.strings[i] for i in used))
+
+    def __reduce__(self):
+        matrix = self.compacted()
+        return (ScoreMatrix, (matrix.countries, matrix.criteria, matrix.weights, matrix.points,
+                              matrix.symbols, matrix.explanations, matrix.symbol_table,
+                              matrix.strings))
+
+    def __repr__(self):
+        return f"<ScoreMatrix {len(self.countries)} countries x {len(self.criteria)} criteria>"
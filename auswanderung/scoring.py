@@ -0,0 +1,130 @@
+"""Weighted scoring of the country x criterion matrix.
+
+The report scripts carry the matrix as ``matrix_rows``: a header row with the
+country codes followed by one row per criterion, whose first entry is the
+criterion label ending in its weight ("Geopolitik x2") and whose remaining
+entries are ``(symbol, points, explanation)`` tuples.
+
+NumPy is imported inside the functions that compute, so importing this
+module for its labels and tuples (parse_weight, criterion_name, Matrix)
+stays cheap.
+"""
+import re
+from collections import namedtuple
+
+MAX_POINTS = 2
+
+WEIGHT_PATTERN = re.compile(r'\s*x(\d+(?:[.,]\d+)?)\s*$')
+
+Matrix = namedtuple('Matrix', ['countries', 'criteria', 'weights', 'points', 'cells'])
+Matrix.__doc__ = """Matrix loaded from ``matrix_rows``.
+
+points is an int8 array of shape (countries, criteria), weights a float
+vector with one entry per criterion and cells the original cell tuples.
+"""
+
+Scores = namedtuple('Scores', ['totals', 'max_total', 'percent', 'ranks', 'order'])
+Scores.__doc__ = """Weighted totals, percentages and competition ranks (1 = best) per country.
+
+order lists the country indices from best to worst.
+"""
+
+ProfileScores = namedtuple('ProfileScores', ['totals', 'percent', 'top', 'top_totals'])
+ProfileScores.__doc__ = """Scores of many weight profiles at once.
+
+totals and percent have shape (profiles, countries); top holds the indices of
+the k best countries per profile, best first, and top_totals their totals.
+"""
+
+
+def parse_weight(label):
+    """Return the weight encoded at the end of a criterion label"""
+    match = WEIGHT_PATTERN.search(label)
+    if match is None:
+        raise ValueError(f"criterion label without weight: {label!r}")
+    return float(match.group(1).replace(',', '.'))
+
+
+def criterion_name(label):
+    """Return the criterion label without its weight and line breaks"""
+    return ' '.join(WEIGHT_PATTERN.sub('', label).split())
+
+
+def load_matrix(matrix_rows):
+    """Load ``matrix_rows`` into a points array and a weight vector"""
+    import numpy as np
+
+    header, rows = matrix_rows[0], matrix_rows[1:]
+    countries = tuple(header[1:])
+    for row in rows:
+        if len(row) != len(header):
+            raise ValueError(
+                f"row {row[0]!r} has {len(row) - 1} cells for {len(countries)} countries")
+    criteria = tuple(criterion_name(row[0]) for row in rows)
+    weights = np.array([parse_weight(row[0]) for row in rows], dtype=np.float64)
+    cells = tuple(tuple(row[1:]) for row in rows)
+    points = np.array([[int(cell[1]) for cell in row] for row in cells], dtype=np.int8)
+    if points.size and (points.min() < 0 or points.max() > MAX_POINTS):
+        raise ValueError(f"points must be between 0 and {MAX_POINTS}")
+    return Matrix(countries, criteria, weights, np.ascontiguousarray(points.T), cells)
+
+
+def rank_desc(totals):
+    """Competition ranks for descending totals: equal totals share a rank"""
+    import numpy as np
+
+    ascending = np.sort(totals)
+    return len(totals) - np.searchsorted(ascending, totals, side='right') + 1
+
+
+def score(matrix, weights=None):
+    """Score all countries of ``matrix`` with one matrix-vector product"""
+    import numpy as np
+
+    weights = matrix.weights if weights is None else np.asarray(weights, dtype=np.float64)
+    totals = matrix.points @ weights
+    max_total = MAX_POINTS * weights.sum()
+    percent = 100.0 * totals / max_total if max_total else np.zeros_like(totals)
+    order = np.argsort(-totals, kind='stable')
+    return Scores(totals, max_total, percent, rank_desc(totals), order)
+
+
+def weight_matrix(profiles, criteria, default=0.0):
+    """Build a (profiles x criteria) weight matrix from ``{criterion: weight}`` mappings"""
+    import numpy as np
+
+    index = {name: j for j, name in enumerate(criteria)}
+    weights = np.full((len(profiles), len(criteria)), default, dtype=np.float64)
+    for i, profile in enumerate(profiles):
+        for name, weight in profile.items():
+            if name not in index:
+                raise ValueError(f"unknown criterion in profile {i}: {name!r}")
+            weights[i, index[name]] = weight
+    return weights
+
+
+def top_k(totals, k):
+    """Indices of the k largest totals per row, best first"""
+    import numpy as np
+
+    k = min(k, totals.shape[1])
+    part = np.argpartition(-totals, k - 1, axis=1)[:, :k]
+    part_totals = np.take_along_axis(totals, part, axis=1)
+    order = np.argsort(-part_totals, axis=1, kind='stable')
+    return np.take_along_axis(part, order, axis=1)
+
+
+def score_profiles(matrix, weights, k=3):
+    """Score a (profiles x criteria) weight matrix with a single matrix multiply"""
+    import numpy as np
+
+    weights = np.asarray(weights, dtype=np.float64)
+    if weights.ndim != 2 or weights.shape[1] != len(matrix.criteria):
+        raise ValueError(
+            f"expected weights of shape (profiles, {len(matrix.criteria)}), got {weights.shape}")
+    totals = weights @ matrix.points.T.astype(np.float64)
+    max_totals = MAX_POINTS * weights.sum(axis=1, keepdims=True)
+    percent = np.divide(100.0 * totals, max_totals,
+                        out=np.zeros_like(totals), where=max_totals != 0)
+    top = top_k(totals, k)
+    return ProfileScores(totals, percent, top, np.take_along_axis(totals, top, axis=1))
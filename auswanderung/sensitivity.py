@@ -0,0 +1,222 @@
+"""Monte Carlo sensitivity of the ranking to the criterion weights.
+
+The weights x2, x1.5, x1 and x0.5 are judgment calls. This module draws
+weight vectors from a Dirichlet distribution centred on them, scores every
+sample and counts how often each country ends up on each rank. Criterion
+j gets the Dirichlet parameter ``concentration * w_j / mean(w)``, so a
+criterion of average weight varies by about ``1 / sqrt(concentration)``
+(20% at the default of 25) while the weights keep their sum, which keeps
+totals and modifiers in points.
+
+Samples are scored in batches with one matrix multiply each and reduced
+to running counts right away, so memory does not grow with the number of
+samples. Every batch has its own seed derived from ``seed``, which makes
+the result independent of the number of worker processes. Each worker
+receives the matrix once, through the pool initializer, and one contiguous
+run of batches, so the processes exchange a few small arrays per batch
+rather than a task and a copy of the matrix each.
+
+Besides the rank distribution the result says which criteria drive the
+flips: for each criterion the standardized difference between its
+relative weight change in samples where the winner changed and in
+samples where it did not, and for each country the mean relative weight
+change of the samples it won.
+
+Usage: python -m auswanderung.sensitivity REPORT [--samples N] [--concentration C]
+                                                 [--jobs N] [--seed S]
+"""
+import argparse
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from auswanderung.ranking import check_countries
+from auswanderung.reports import load_report
+from auswanderung.scoring import load_matrix, score
+
+BATCH = 1 << 16
+
+# Points, weights, offsets and Dirichlet parameters of a worker process
+WORKER = {}
+
+Sensitivity = namedtuple('Sensitivity', ['countries', 'criteria', 'samples', 'base_ranks',
+                                         'rank_counts', 'p_first', 'mean_rank', 'flip_rate',
+                                         'drivers', 'winner_shift'])
+Sensitivity.__doc__ = """Rank distribution of each country over the weight samples.
+
+rank_counts[i, r] counts the samples in which country i had rank r + 1
+(competition ranks, so tied countries share a rank); p_first and mean_rank
+follow from it. flip_rate is the share of samples won by another country
+than the unperturbed winner. drivers has one entry per criterion: positive
+if raising its weight makes a flip more likely, negative if lowering it
+does. winner_shift[i, j] is the mean relative change of weight j in the
+samples country i won (NaN if it won none).
+"""
+
+Counts = namedtuple('Counts', ['samples', 'rank_counts', 'flips', 'delta', 'delta_squared',
+                               'flip_delta', 'wins', 'win_delta'])
+
+
+def dirichlet_alpha(weights, concentration):
+    """Dirichlet parameters centred on ``weights``"""
+    weights = np.asarray(weights, dtype=np.float64)
+    if weights.size == 0 or (weights <= 0).any():
+        raise ValueError("sensitivity analysis needs positive weights")
+    if concentration <= 0:
+        raise ValueError("concentration must be positive")
+    return concentration * weights / weights.mean()
+
+
+def sample_weights(rng, alpha, total, samples):
+    """Draw ``samples`` weight vectors with the given Dirichlet parameters and sum"""
+    draws = rng.standard_gamma(alpha, size=(samples, len(alpha)))
+    draws *= total / draws.sum(axis=1, keepdims=True)
+    return draws
+
+
+def batch_ranks(totals, tolerance):
+    """Competition ranks of each row of totals (1 = best) and the best column per row"""
+    samples, countries = totals.shape
+    order = np.argsort(-totals, axis=1, kind='stable')
+    ordered = np.take_along_axis(totals, order, axis=1)
+    start = np.zeros((samples, countries), dtype=np.intp)
+    start[:, 1:] = np.where(ordered[:, :-1] - ordered[:, 1:] > tolerance,
+                            np.arange(1, countries), 0)
+    np.maximum.accumulate(start, axis=1, out=start)
+    ranks = np.empty_like(start)
+    np.put_along_axis(ranks, order, start + 1, axis=1)
+    return ranks, order[:, 0]
+
+
+def count_batch(points, weights, offsets, alpha, samples, seed):
+    """Score ``samples`` weight vectors and reduce them to Counts"""
+    rng = np.random.default_rng(seed)
+    countries, criteria = points.shape
+    base_winner = int(np.argmax(points @ weights + offsets))
+    sampled = sample_weights(rng, alpha, weights.sum(), samples)
+    totals = sampled @ points.T
+    totals += offsets
+    ranks, winners = batch_ranks(totals, 1e-9 * max(weights.sum(), 1.0))
+    cells = (np.arange(countries) * countries + (ranks - 1)).ravel()
+    rank_counts = np.bincount(cells, minlength=countries * countries).reshape(countries, countries)
+    delta = sampled / weights - 1.0
+    flipped = winners != base_winner
+    win_delta = np.stack([np.bincount(winners, weights=delta[:, j], minlength=countries)
+                          for j in range(criteria)], axis=1)
+    return Counts(samples, rank_counts, int(flipped.sum()), delta.sum(axis=0),
+                  np.square(delta).sum(axis=0), delta[flipped].sum(axis=0),
+                  np.bincount(winners, minlength=countries), win_delta)
+
+
+def init_worker(points, weights, offsets, alpha):
+    WORKER.update(points=points, weights=weights, offsets=offsets, alpha=alpha)
+
+
+def count_run(batches):
+    """Counts of each ``(samples, seed)`` batch, scored against the matrix of the worker"""
+    return [count_batch(WORKER['points'], WORKER['weights'], WORKER['offsets'], WORKER['alpha'],
+                        size, seed) for size, seed in batches]
+
+
+def merge(counts):
+    """Add up the Counts of several batches"""
+    counts = list(counts)
+    return Counts(*(sum(item[field] for item in counts) for field in range(len(Counts._fields))))
+
+
+def sensitivity(matrix, samples=1_000_000, concentration=25.0, modifiers=None, seed=0,
+                jobs=1, batch=BATCH):
+    """Sample weights around ``matrix.weights`` and return the Sensitivity of the ranking.
+
+    ``modifiers`` maps countries to points added after weighting, as in the
+    ranking tables. ``jobs`` > 1 spreads the batches over worker processes.
+    """
+    if samples < 1:
+        raise ValueError("samples must be at least 1")
+    points = np.asarray(matrix.points, dtype=np.float64)
+    weights = np.asarray(matrix.weights, dtype=np.float64)
+    alpha = dirichlet_alpha(weights, concentration)
+    modifiers = modifiers or {}
+    check_countries('modifiers', modifiers, matrix.countries, complete=False)
+    offsets = np.array([modifiers.get(country, 0) for country in matrix.countries],
+                       dtype=np.float64)
+
+    sizes = [batch] * (samples // batch) + ([samples % batch] if samples % batch else [])
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    batches = list(zip(sizes, seeds))
+    jobs = min(jobs, len(batches))
+    if jobs == 1:
+        counts = merge(count_batch(points, weights, offsets, alpha, size, child)
+                       for size, child in batches)
+    else:
+        runs = [batches[k * len(batches) // jobs:(k + 1) * len(batches) // jobs]
+                for k in range(jobs)]
+        with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker,
+                                 initargs=(points, weights, offsets, alpha)) as pool:
+            counts = merge(item for run in pool.map(count_run, runs) for item in run)
+
+    base_totals = score(matrix, weights).totals + offsets
+    base_ranks = batch_ranks(base_totals[None, :], 1e-9 * max(weights.sum(), 1.0))[0][0]
+    mean = counts.delta / samples
+    std = np.sqrt(np.maximum(counts.delta_squared / samples - mean ** 2, 0.0))
+    kept = samples - counts.flips
+    if counts.flips and kept:
+        difference = counts.flip_delta / counts.flips - (counts.delta - counts.flip_delta) / kept
+        drivers = np.divide(difference, std, out=np.zeros_like(std), where=std > 0)
+    else:
+        drivers = np.zeros(len(weights))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        winner_shift = counts.win_delta / counts.wins[:, None]
+    ranks = np.arange(1, len(matrix.countries) + 1)
+    return Sensitivity(tuple(matrix.countries), tuple(matrix.criteria), samples, base_ranks,
+                       counts.rank_counts, counts.rank_counts[:, 0] / samples,
+                       counts.rank_counts @ ranks / samples, counts.flips / samples, drivers,
+                       winner_shift)
+
+
+def top_drivers(result, count=5):
+    """The ``count`` criteria with the strongest effect on flips, as (criterion, effect)"""
+    order = np.argsort(-np.abs(result.drivers), kind='stable')[:count]
+    return [(result.criteria[j], float(result.drivers[j])) for j in order]
+
+
+def summary(result):
+    """Return the rank distribution and the flip drivers as a text table"""
+    lines = [f"{'Land':<12} {'Basis':>5} {'P(1.)':>7} {'Mittel':>7} {'Spanne':>7}"]
+    for i in np.argsort(result.mean_rank, kind='stable'):
+        reached = np.flatnonzero(result.rank_counts[i])
+        lines.append(f"{result.countries[i]:<12} {result.base_ranks[i]:>5} "
+                     f"{result.p_first[i]:>7.1%} {result.mean_rank[i]:>7.2f} "
+                     f"{f'{reached[0] + 1}-{reached[-1] + 1}':>7}")
+    lines.append('')
+    lines.append(f"Anderer Sieger in {result.flip_rate:.1%} der {result.samples:,} Stichproben")
+    if result.flip_rate:
+        for criterion, effect in top_drivers(result):
+            direction = 'höher' if effect > 0 else 'niedriger'
+            lines.append(f"  {criterion:<40} {effect:>+6.2f}  (Gewicht {direction})")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('report', help="report name, e.g. final_v8_tennis_wind")
+    parser.add_argument('--samples', '-n', type=int, default=1_000_000)
+    parser.add_argument('--concentration', '-c', type=float, default=25.0,
+                        help="Dirichlet concentration per average criterion (default: 25)")
+    parser.add_argument('--jobs', '-j', type=int, default=1, help="worker processes")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+    data = load_report(args.report).DATA
+    if 'matrix_rows' not in data:
+        parser.error(f"{args.report} hat keine Detailmatrix")
+    start = time.perf_counter()
+    result = sensitivity(load_matrix(data['matrix_rows']), args.samples, args.concentration,
+                         seed=args.seed, jobs=args.jobs)
+    print(summary(result))
+    print(f"\n{args.samples:,} Stichproben in {time.perf_counter() - start:.2f} s")
+
+
+if __name__ == '__main__':
+    main()
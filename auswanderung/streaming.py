@@ -0,0 +1,78 @@
+"""Stream ``word/document.xml`` to disk section by section.
+
+python-docx keeps the whole document tree in memory until ``doc.save``. The
+report definitions call their ``on_section`` hook at every banner; used as that
+hook, a StreamWriter serializes everything the previous sections added to a
+spool file and drops it from the tree, so the tree only ever holds the
+section being built. ``save`` then writes the package with the spooled body
+spliced back in. The result is byte-identical to ``save_deterministic`` on
+the full tree.
+
+Report code must not reach back into earlier sections (``doc.paragraphs``,
+``doc.tables``) once the next section has started.
+"""
+import shutil
+import tempfile
+import zipfile
+from io import BytesIO
+from pathlib import Path
+
+from lxml import etree
+
+from auswanderung.buildcache import zip_entry
+
+DOCUMENT_PART = 'word/document.xml'
+BODY_START = b'<w:body>'
+BODY_END = b'</w:body>'
+
+# Spool chunks are copied into the zip entry in pieces of this size
+COPY_BUFFER = 1 << 20
+
+
+class StreamWriter:
+    """Spool finished sections of one document and write its package at the end"""
+
+    def __init__(self):
+        self.spool = tempfile.TemporaryFile()
+
+    def section(self, doc, title):
+        """Section hook for ``build_report``: flush everything before the new section"""
+        self.flush(doc)
+
+    def flush(self, doc):
+        """Move the body content of ``doc`` into the spool, keeping only ``w:sectPr``"""
+        body = doc.element.body
+        sect_pr = body.sectPr
+        if sect_pr is not None:
+            body.remove(sect_pr)
+        if len(body):
+            # Serialized as a whole so the children inherit the namespace
+            # declarations of w:body instead of repeating them each
+            xml = etree.tostring(body, encoding='UTF-8')
+            self.spool.write(xml[xml.index(b'>') + 1:-len(BODY_END)])
+            for child in list(body):
+                body.remove(child)
+        if sect_pr is not None:
+            body.append(sect_pr)
+
+    def save(self, doc, path, identifier=None):
+        """Write the package of ``doc`` to ``path`` with the spooled body in place"""
+        self.flush(doc)
+        if identifier is not None:
+            doc.core_properties.identifier = identifier
+        buffer = BytesIO()
+        doc.save(buffer)
+        with zipfile.ZipFile(buffer) as source, open(path, 'wb') as output, \
+                zipfile.ZipFile(output, 'w', zipfile.ZIP_DEFLATED) as target:
+            for info in source.infolist():
+                if info.filename != DOCUMENT_PART:
+                    target.writestr(zip_entry(info.filename), source.read(info.filename))
+                    continue
+                head, tail = source.read(DOCUMENT_PART).split(BODY_START, 1)
+                with target.open(zip_entry(DOCUMENT_PART), 'w') as part:
+                    part.write(head + BODY_START)
+                    self.spool.seek(0)
+                    shutil.copyfileobj(self.spool, part, COPY_BUFFER)
+                    part.write(tail)
+        self.spool.close()
+        return Path(path)
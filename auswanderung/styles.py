@@ -0,0 +1,70 @@
+"""Named paragraph and character styles for tables and the detail matrix.
+
+Runs and paragraphs reference these styles by ID instead of carrying their
+own font properties, so each run writes a single ``w:rStyle`` instead of a
+full ``w:rPr`` block and the formatting lives once in ``styles.xml``.
+
+Assigning a style by name makes python-docx search ``styles.xml`` on every
+assignment, so the table helpers look the IDs up once per document through
+style_ids and write ``w:pStyle`` and ``w:rStyle`` themselves.
+"""
+import weakref
+
+from docx.enum.style import WD_STYLE_TYPE
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.shared import Pt, RGBColor
+
+WHITE = RGBColor(255, 255, 255)
+
+# name -> (type, font properties, paragraph format properties)
+STYLES = {
+    'HeaderCell': (WD_STYLE_TYPE.CHARACTER, {'bold': True, 'color': WHITE}, {}),
+    'MatrixSymbol': (WD_STYLE_TYPE.CHARACTER, {'bold': True, 'size': 11}, {}),
+    'MatrixPoints': (WD_STYLE_TYPE.CHARACTER, {'size': 8}, {}),
+    'MatrixNote': (WD_STYLE_TYPE.CHARACTER, {'italic': True, 'size': 7}, {}),
+    'TableText': (WD_STYLE_TYPE.PARAGRAPH, {'name': 'Calibri', 'size': 9}, {'space_after': 0}),
+    'StyledTableText': (WD_STYLE_TYPE.PARAGRAPH, {'size': 10}, {}),
+    'MatrixHeader': (WD_STYLE_TYPE.PARAGRAPH, {'size': 8},
+                     {'alignment': WD_ALIGN_PARAGRAPH.CENTER}),
+    'MatrixCriterion': (WD_STYLE_TYPE.PARAGRAPH, {'bold': True, 'size': 8}, {}),
+    'MatrixCell': (WD_STYLE_TYPE.PARAGRAPH, {},
+                   {'alignment': WD_ALIGN_PARAGRAPH.CENTER, 'space_before': 0, 'space_after': 0}),
+}
+
+# document part -> {style name: style ID}
+STYLE_IDS = weakref.WeakKeyDictionary()
+
+
+def add_style(doc, name, style_type, font, paragraph_format):
+    style = doc.styles.add_style(name, style_type)
+    if style_type == WD_STYLE_TYPE.PARAGRAPH:
+        style.base_style = doc.styles['Normal']
+        for attr, value in paragraph_format.items():
+            setattr(style.paragraph_format, attr, Pt(value) if attr.startswith('space_') else value)
+    for attr, value in font.items():
+        if attr == 'color':
+            style.font.color.rgb = value
+        else:
+            setattr(style.font, attr, Pt(value) if attr == 'size' else value)
+    return style
+
+
+def register_styles(doc):
+    """Add the table and matrix styles to ``doc`` unless they are already defined"""
+    defined = {style.name for style in doc.styles}
+    for name, (style_type, font, paragraph_format) in STYLES.items():
+        if name not in defined:
+            add_style(doc, name, style_type, font, paragraph_format)
+
+
+def style_ids(part):
+    """The style ID of every name in STYLES for the document of ``part``.
+
+    The styles are registered and looked up on the first call for a
+    document; later calls return the cached mapping.
+    """
+    ids = STYLE_IDS.get(part)
+    if ids is None:
+        register_styles(part.document)
+        ids = STYLE_IDS[part] = {name: part.styles[name].style_id for name in STYLES}
+    return ids
@@ -0,0 +1,135 @@
+"""Table helpers shared by the report definitions.
+
+python-docx is imported lazily so that importing a report module (for its
+data) does not pay for it. Paragraph and run styles are written as style IDs
+from auswanderung.styles.style_ids, looked up once per document.
+"""
+
+
+def document_styles(part):
+    from auswanderung.styles import style_ids
+
+    return style_ids(part)
+
+
+def set_paragraph_style(paragraph, style_id):
+    paragraph._p.get_or_add_pPr().style = style_id
+
+
+def set_run_style(run, style_id):
+    run._r.get_or_add_rPr().style = style_id
+
+
+def add_styled_run(paragraph, text, style_id):
+    run = paragraph.add_run(text)
+    set_run_style(run, style_id)
+    return run
+
+
+def set_cell_shading(cell, color):
+    """Set cell background color"""
+    from docx.oxml import OxmlElement
+    from docx.oxml.ns import qn
+
+    shading = OxmlElement('w:shd')
+    shading.set(qn('w:fill'), color)
+    cell._tc.get_or_add_tcPr().append(shading)
+
+
+def add_heading_with_style(doc, text, level=1):
+    heading = doc.add_heading(text, level=level)
+    return heading
+
+
+def create_table(doc, data, header=True, col_widths=None):
+    """Create a formatted table"""
+    styles = document_styles(doc.part)
+    table = doc.add_table(rows=len(data), cols=len(data[0]))
+    table.style = 'Table Grid'
+
+    for i, row_data in enumerate(data):
+        row = table.rows[i]
+        for j, cell_data in enumerate(row_data):
+            cell = row.cells[j]
+            cell.text = str(cell_data)
+            if i == 0 and header:
+                set_cell_shading(cell, '1F4E79')
+                for paragraph in cell.paragraphs:
+                    for run in paragraph.runs:
+                        set_run_style(run, styles['HeaderCell'])
+
+    return table
+
+
+def create_styled_table(doc, data, header_color='2F5496'):
+    """Create a table matching the original style"""
+    styles = document_styles(doc.part)
+    table = doc.add_table(rows=len(data), cols=len(data[0]))
+    table.style = 'Table Grid'
+
+    for i, row_data in enumerate(data):
+        row = table.rows[i]
+        for j, cell_data in enumerate(row_data):
+            cell = row.cells[j]
+            cell.text = str(cell_data)
+            for paragraph in cell.paragraphs:
+                set_paragraph_style(paragraph, styles['StyledTableText'])
+            # Style header row
+            if i == 0:
+                set_cell_shading(cell, header_color)
+                for paragraph in cell.paragraphs:
+                    for run in paragraph.runs:
+                        set_run_style(run, styles['HeaderCell'])
+    return table
+
+
+def create_table_original_style(doc, data, header_color='1F4E79'):
+    """Create table in original document style"""
+    styles = document_styles(doc.part)
+    table = doc.add_table(rows=len(data), cols=len(data[0]))
+    table.style = 'Table Grid'
+
+    for i, row_data in enumerate(data):
+        row = table.rows[i]
+        for j, cell_data in enumerate(row_data):
+            cell = row.cells[j]
+            cell.text = str(cell_data)
+            for paragraph in cell.paragraphs:
+                set_paragraph_style(paragraph, styles['TableText'])
+                if i == 0:
+                    for run in paragraph.runs:
+                        set_run_style(run, styles['HeaderCell'])
+            if i == 0:
+                set_cell_shading(cell, header_color)
+    return table
+
+
+def create_matrix_cell(cell, symbol, points, explanation, is_header=False):
+    """Create a matrix cell with symbol, points, and explanation"""
+    cell.text = ""
+    styles = document_styles(cell.part)
+
+    if is_header:
+        p = cell.paragraphs[0]
+        set_paragraph_style(p, styles['TableText'])
+        add_styled_run(p, str(symbol), styles['HeaderCell'])
+        set_cell_shading(cell, '1F4E79')
+    else:
+        p = cell.paragraphs[0]
+        set_paragraph_style(p, styles['MatrixCell'])
+        add_styled_run(p, symbol, styles['MatrixSymbol'])
+
+        p2 = cell.add_paragraph()
+        set_paragraph_style(p2, styles['MatrixCell'])
+        add_styled_run(p2, f"({points})", styles['MatrixPoints'])
+
+        p3 = cell.add_paragraph()
+        set_paragraph_style(p3, styles['MatrixCell'])
+        add_styled_run(p3, explanation, styles['MatrixNote'])
+
+        if symbol == "++":
+            set_cell_shading(cell, 'C6EFCE')
+        elif symbol == "o":
+            set_cell_shading(cell, 'FFEB9C')
+        elif symbol == "--":
+            set_cell_shading(cell, 'FFC7CE')
@@ -0,0 +1,127 @@
+"""Playable tennis days from daily weather grids.
+
+"Tennis-Wetter (ganzjährig spielbar)" was scored by hand. Here a day is
+playable under a TennisRule, by default 12-32 °C daily maximum, less than
+1 mm of precipitation and less than 25 km/h of wind. Days with a missing
+value are neither playable nor counted as valid.
+
+The inputs are (locations, days) arrays starting at one date. The rule is
+evaluated on the whole grid at once and the days are summed per month
+with one ``np.add.reduceat`` over the month boundaries, so 1000 locations
+x 30 years are a few array passes. From the monthly counts follow, per
+location,
+
+* the mean playable days of each calendar month, scaled from the valid
+  days so gaps do not bias them,
+* ``tennis_days``: playable days per year, and
+* ``tennis_months``: calendar months with at least PLAYABLE_MONTH playable
+  days on average, the "ganzjährig" part,
+
+as a rules.MetricTable for the Tennis-Wetter rule.
+
+Usage: python -m auswanderung.tennis GRID.npz [--output METRICS.csv]
+                                     [--min-temperature T] [--max-temperature T]
+                                     [--max-precipitation MM] [--max-wind KMH]
+
+GRID.npz holds ``temperature``, ``precipitation`` and ``wind`` arrays of
+shape (locations, days), ``locations`` and the ``start`` date.
+"""
+import argparse
+import time
+from collections import namedtuple
+from pathlib import Path
+
+import numpy as np
+
+from auswanderung.rules import MetricTable, write_metrics
+
+TennisRule = namedtuple('TennisRule', ['min_temperature', 'max_temperature',
+                                       'max_precipitation', 'max_wind'])
+TennisRule.__doc__ = """Thresholds of a playable day in °C, mm and km/h"""
+
+DEFAULT_RULE = TennisRule(12.0, 32.0, 1.0, 25.0)
+
+# Mean playable days that make a calendar month count as playable
+PLAYABLE_MONTH = 15
+
+MONTHS = ('Jan', 'Feb', 'Mär', 'Apr', 'Mai', 'Jun', 'Jul', 'Aug', 'Sep', 'Okt', 'Nov', 'Dez')
+
+PlayableDays = namedtuple('PlayableDays', ['months', 'days', 'valid'])
+PlayableDays.__doc__ = """Playable and valid days per location and month.
+
+months is a datetime64[M] vector, days and valid are (locations, months).
+"""
+
+
+def playable(temperature, precipitation, wind, rule=DEFAULT_RULE):
+    """Boolean array of the playable days; False wherever an input is missing"""
+    temperature, precipitation, wind = (np.asarray(values)
+                                        for values in (temperature, precipitation, wind))
+    with np.errstate(invalid='ignore'):
+        return ((temperature >= rule.min_temperature) & (temperature <= rule.max_temperature)
+                & (precipitation < rule.max_precipitation) & (wind < rule.max_wind))
+
+
+def playable_days(temperature, precipitation, wind, start, rule=DEFAULT_RULE):
+    """Count playable days per location and month of (locations, days) grids from ``start``"""
+    temperature, precipitation, wind = (np.atleast_2d(values)
+                                        for values in (temperature, precipitation, wind))
+    if not temperature.shape == precipitation.shape == wind.shape:
+        raise ValueError(f"grids differ in shape: {temperature.shape}, {precipitation.shape}, "
+                         f"{wind.shape}")
+    month = (np.datetime64(start, 'D') + np.arange(temperature.shape[1])).astype('datetime64[M]')
+    boundaries = np.flatnonzero(np.concatenate([[True], month[1:] != month[:-1]]))
+    valid = ~(np.isnan(temperature) | np.isnan(precipitation) | np.isnan(wind))
+    days = np.add.reduceat(playable(temperature, precipitation, wind, rule), boundaries,
+                           axis=1, dtype=np.int32)
+    return PlayableDays(month[boundaries], days,
+                        np.add.reduceat(valid, boundaries, axis=1, dtype=np.int32))
+
+
+def monthly_means(result):
+    """(locations, 12) mean playable days per calendar month, nan without valid days"""
+    calendar = np.zeros((len(result.months), 12))
+    calendar[np.arange(len(result.months)), result.months.astype(np.int64) % 12] = 1.0
+    lengths = ((result.months + 1).astype('datetime64[D]')
+               - result.months.astype('datetime64[D]')).astype(np.float64)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        share = (result.days @ calendar) / (result.valid @ calendar)
+    return share * (lengths @ calendar) / calendar.sum(axis=0)
+
+
+def tennis_metrics(locations, result):
+    """MetricTable of ``tennis_days`` per year and playable ``tennis_months``"""
+    means = monthly_means(result)
+    values = np.stack([means.sum(axis=1), (means >= PLAYABLE_MONTH).sum(axis=1)], axis=1)
+    values[np.isnan(means).any(axis=1)] = np.nan
+    return MetricTable(tuple(locations), ('tennis_days', 'tennis_months'), values)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('grid', type=Path, help=".npz file with the daily grids")
+    parser.add_argument('--output', '-o', type=Path, help="write the metrics to this CSV file")
+    for field, default in zip(TennisRule._fields, DEFAULT_RULE):
+        parser.add_argument(f"--{field.replace('_', '-')}", type=float, default=default,
+                            help=f"default: {default:g}")
+    args = parser.parse_args(argv)
+    rule = TennisRule(*(getattr(args, field) for field in TennisRule._fields))
+    with np.load(args.grid) as grid:
+        locations = [str(name) for name in grid['locations']]
+        start = time.perf_counter()
+        result = playable_days(grid['temperature'], grid['precipitation'], grid['wind'],
+                               grid['start'], rule)
+    table = tennis_metrics(locations, result)
+    means = monthly_means(result)
+    print(f"{'Ort':<20}" + ''.join(f"{month:>5}" for month in MONTHS) + f"{'Tage':>6}{'Monate':>7}")
+    for location, row, (days, months) in zip(locations, means, table.values):
+        print(f"{location[:20]:<20}" + ''.join(f"{value:>5.0f}" for value in row)
+              + f"{days:>6.0f}{months:>7.0f}")
+    print(f"\n{len(locations)} Orte, {len(result.months)} Monate in "
+          f"{time.perf_counter() - start:.2f} s")
+    if args.output:
+        write_metrics(args.output, table)
+
+
+if __name__ == '__main__':
+    main()
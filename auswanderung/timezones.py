@@ -0,0 +1,172 @@
+"""Overlap of remote working hours with the German office, day by day.
+
+"Remote-Work Zeitzone x1" is scored from notes like "-4h ideal". What
+counts for the remote Data Architect is how many hours of the German
+office day fall into acceptable working hours at home, on every working
+day of the year and across both daylight saving changes, which do not
+happen on the same dates everywhere.
+
+The UTC offset of a zone is taken at OFFSET_HOUR UTC each day (transitions
+happen at night). It is read from ``zoneinfo`` once a week and bisected
+to the day where two weekly samples differ, so a zone costs about sixty
+lookups instead of one per day. Everything after that is array arithmetic
+over (zones, days): both working windows are moved to UTC and their
+intersection is measured, also against the home window of the previous
+and the next day.
+
+Per zone the result gives the overlap on every working day of the office
+(Monday to Friday in the office zone) and from it the mean
+(``overlap_hours``, the Zeitzone metric of auswanderung.rules), minimum and
+maximum and the share of days with at least FULL_OVERLAP hours.
+
+COUNTRY_ZONES names one zone for every country code of the matrices, so
+``--countries`` writes metrics the rules can use directly.
+
+Usage: python -m auswanderung.timezones [ZONE ...] [--all] [--countries] [--year Y]
+                                        [--office START END] [--home START END]
+                                        [--output METRICS.csv]
+"""
+import argparse
+import time
+from collections import namedtuple
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from zoneinfo import ZoneInfo, available_timezones
+
+import numpy as np
+
+from auswanderung.rules import MetricTable, write_metrics
+
+OFFICE_ZONE = 'Europe/Berlin'
+OFFICE_HOURS = (9.0, 17.0)
+HOME_HOURS = (7.0, 19.0)
+OFFSET_HOUR = 12
+SAMPLE_DAYS = 7
+FULL_OVERLAP = 6.0
+
+# One representative zone per country code of the report matrices
+COUNTRY_ZONES = {
+    'AU': 'Australia/Sydney',
+    'CL': 'America/Santiago',
+    'CR': 'America/Costa_Rica',
+    'CY': 'Asia/Nicosia',
+    'DE': 'Europe/Berlin',
+    'ES': 'Europe/Madrid',
+    'ES-S': 'Europe/Madrid',
+    'KAN': 'Atlantic/Canary',
+    'NAM': 'Africa/Windhoek',
+    'NG': 'Africa/Lagos',
+    'NI': 'America/Managua',
+    'NZ': 'Pacific/Auckland',
+    'SE': 'Europe/Stockholm',
+    'UY': 'America/Montevideo',
+}
+
+Overlap = namedtuple('Overlap', ['zones', 'days', 'hours'])
+Overlap.__doc__ = """Overlap hours per zone on every office working day.
+
+days is a datetime64[D] vector of the working days, hours a (zones, days)
+array.
+"""
+
+
+def utc_offset(zone, instant):
+    return instant.astimezone(zone).utcoffset().total_seconds() / 3600.0
+
+
+def daily_offsets(zone, year):
+    """UTC offset in hours of ``zone`` at OFFSET_HOUR UTC on every day of ``year``"""
+    zone = ZoneInfo(zone) if isinstance(zone, str) else zone
+    first = datetime(year, 1, 1, OFFSET_HOUR, tzinfo=timezone.utc)
+    days = (date(year + 1, 1, 1) - date(year, 1, 1)).days
+    samples = list(range(0, days - 1, SAMPLE_DAYS)) + [days - 1]
+    values = [utc_offset(zone, first + timedelta(days=day)) for day in samples]
+    offsets = np.empty(days)
+    offsets[-1] = values[-1]
+    for (start, before), (end, after) in zip(zip(samples, values), zip(samples[1:], values[1:])):
+        offsets[start:end] = before
+        if before != after:
+            low, high = start, end
+            while high - low > 1:
+                middle = (low + high) // 2
+                if utc_offset(zone, first + timedelta(days=middle)) == before:
+                    low = middle
+                else:
+                    high = middle
+            offsets[high:end] = after
+    return offsets
+
+
+def window_overlap(start, end, other_start, other_end):
+    """Overlap in hours of two windows given as arrays of UTC hours"""
+    return np.maximum(0.0, np.minimum(end, other_end) - np.maximum(start, other_start))
+
+
+def overlap(zones, year, office_zone=OFFICE_ZONE, office_hours=OFFICE_HOURS,
+            home_hours=HOME_HOURS):
+    """Overlap of ``home_hours`` in each of ``zones`` with the office on its working days"""
+    zones = list(zones)
+    dates = np.arange(f'{year}-01-01', f'{year + 1}-01-01', dtype='datetime64[D]')
+    # 1970-01-01 was a Thursday
+    working = (dates.astype(np.int64) + 3) % 7 < 5
+    office = daily_offsets(office_zone, year)[working]
+    home = np.stack([daily_offsets(zone, year)[working] for zone in zones]) if zones \
+        else np.empty((0, working.sum()))
+    office_start, office_end = office_hours[0] - office, office_hours[1] - office
+    home_start, home_end = home_hours[0] - home, home_hours[1] - home
+    hours = sum(window_overlap(office_start, office_end, home_start + shift, home_end + shift)
+                for shift in (-24.0, 0.0, 24.0))
+    return Overlap(tuple(zones), dates[working], hours)
+
+
+def overlap_metrics(result, names=None):
+    """MetricTable of mean, minimum and maximum overlap and the share of full-overlap days"""
+    hours = result.hours
+    values = np.column_stack([hours.mean(axis=1), hours.min(axis=1), hours.max(axis=1),
+                              100.0 * (hours >= FULL_OVERLAP).mean(axis=1)])
+    return MetricTable(tuple(names or result.zones),
+                       ('overlap_hours', 'overlap_min', 'overlap_max', 'full_overlap_percent'),
+                       values)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('zones', nargs='*', help="IANA zones, e.g. America/Montevideo")
+    parser.add_argument('--all', action='store_true', help="every zone zoneinfo knows")
+    parser.add_argument('--countries', action='store_true',
+                        help="the zones of COUNTRY_ZONES, named by country code")
+    parser.add_argument('--year', type=int, default=date.today().year)
+    parser.add_argument('--office', type=float, nargs=2, default=OFFICE_HOURS,
+                        metavar=('START', 'END'), help="office hours in Berlin (default: 9 17)")
+    parser.add_argument('--home', type=float, nargs=2, default=HOME_HOURS,
+                        metavar=('START', 'END'), help="acceptable hours at home (default: 7 19)")
+    parser.add_argument('--output', '-o', type=Path, help="write the metrics to this CSV file")
+    args = parser.parse_args(argv)
+    names = None
+    zones = list(args.zones)
+    if args.all:
+        zones += sorted(available_timezones())
+    if args.countries:
+        names = list(args.zones) + list(COUNTRY_ZONES)
+        zones += list(COUNTRY_ZONES.values())
+        if args.all:
+            parser.error("--countries and --all cannot be combined")
+    if not zones:
+        parser.error("no zones given")
+    unknown = [zone for zone in zones if zone not in available_timezones()]
+    if unknown:
+        parser.error(f"unbekannte Zeitzonen: {', '.join(unknown)}")
+    start = time.perf_counter()
+    result = overlap(zones, args.year, office_hours=args.office, home_hours=args.home)
+    table = overlap_metrics(result, names)
+    seconds = time.perf_counter() - start
+    print(f"{'Zone':<32} {'Mittel':>7} {'Min':>5} {'Max':>5} {'Volle Tage':>11}")
+    for name, (mean, low, high, full) in zip(table.countries, table.values):
+        print(f"{name[:32]:<32} {mean:>6.1f}h {low:>4.1f}h {high:>4.1f}h {full:>10.0f}%")
+    print(f"\n{len(zones)} Zonen, {len(result.days)} Arbeitstage in {seconds:.2f} s")
+    if args.output:
+        write_metrics(args.output, table)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,232 @@
+"""Wind exposure per region from hourly wind speed, direction and gusts.
+
+The Wind column ("Neuseeland ... aber windig!") is a yes/no judgment.
+This module reads hourly series, CSV files with a header row and the
+columns
+
+* ``region``: the key of the result
+* ``speed``: mean wind speed in km/h
+* ``direction``: direction the wind comes from, degrees clockwise from north
+* ``gust``: peak gust in km/h (optional)
+
+and keeps only fixed-size histograms per region: speeds and gusts in
+1 km/h bins up to MAX_SPEED (faster values land in the last bin) and a
+wind rose of SECTORS directions x the speed bands ROSE_BANDS. Every chunk
+of the file (auswanderung.climate.read_chunks) is added to them with one
+``np.bincount`` per histogram, so decades of hourly data stream through
+in constant memory. As with the climate totals, the histograms of each
+file are cached under its fingerprint, and files are merged by region.
+
+From the histograms follow, per region, ``mean_wind``, the share of hours
+at or above each of COMFORT_THRESHOLDS (``windy_percent`` for WINDY, used by
+the Wind rule of auswanderung.rules), gust percentiles interpolated within
+their bin and the prevailing direction.
+
+Usage: python -m auswanderung.wind CSV [CSV ...] [--cache DIR] [--output METRICS.csv]
+                                   [--rose REGION]
+"""
+import argparse
+import time
+from collections import namedtuple
+from pathlib import Path
+
+import numpy as np
+
+from auswanderung.climate import cache_path, fingerprint, grow_rows, read_chunks, station_ids
+from auswanderung.rules import MetricTable, write_metrics
+
+COLUMNS = ('speed', 'direction', 'gust')
+
+MAX_SPEED = 200
+SECTORS = 16
+SECTOR_NAMES = ('N', 'NNO', 'NO', 'ONO', 'O', 'OSO', 'SO', 'SSO',
+                'S', 'SSW', 'SW', 'WSW', 'W', 'WNW', 'NW', 'NNW')
+ROSE_BANDS = (10.0, 20.0, 30.0, 40.0, 50.0)
+
+# km/h; hours at or above these are reported, WINDY as windy_percent
+COMFORT_THRESHOLDS = (20, 30, 40)
+WINDY = 30
+GUST_PERCENTILES = (50, 90, 99)
+
+WindHistograms = namedtuple('WindHistograms', ['regions', 'speeds', 'gusts', 'rose', 'speed_sum'])
+WindHistograms.__doc__ = """Hourly wind histograms per region.
+
+speeds and gusts count hours per 1 km/h bin, shape (regions, MAX_SPEED + 1);
+rose counts hours per direction sector and speed band, shape (regions,
+SECTORS, len(ROSE_BANDS) + 1); speed_sum is the sum of all speeds.
+"""
+
+
+def empty_histograms(regions):
+    count = len(regions)
+    return WindHistograms(tuple(regions), np.zeros((count, MAX_SPEED + 1), dtype=np.int64),
+                          np.zeros((count, MAX_SPEED + 1), dtype=np.int64),
+                          np.zeros((count, SECTORS, len(ROSE_BANDS) + 1), dtype=np.int64),
+                          np.zeros(count))
+
+
+def speed_bins(values):
+    """1 km/h bin of each value, clipped to the last bin"""
+    return np.minimum(values, MAX_SPEED).astype(np.intp)
+
+
+def histograms(regions, ids, speed, direction=None, gust=None):
+    """WindHistograms of hourly arrays; ``ids`` gives each hour's index into ``regions``"""
+    count = len(regions)
+    result = empty_histograms(regions)
+    speed = np.asarray(speed, dtype=np.float64)
+    measured = ~np.isnan(speed) & (speed >= 0)
+    bins = MAX_SPEED + 1
+    result.speeds[:] = np.bincount(ids[measured] * bins + speed_bins(speed[measured]),
+                                   minlength=count * bins).reshape(count, bins)
+    result.speed_sum[:] = np.bincount(ids[measured], weights=speed[measured], minlength=count)
+    if gust is not None:
+        gust = np.asarray(gust, dtype=np.float64)
+        gusted = ~np.isnan(gust) & (gust >= 0)
+        result.gusts[:] = np.bincount(ids[gusted] * bins + speed_bins(gust[gusted]),
+                                      minlength=count * bins).reshape(count, bins)
+    if direction is not None:
+        direction = np.asarray(direction, dtype=np.float64)
+        aimed = measured & ~np.isnan(direction)
+        sector = (np.mod(direction[aimed] + 180.0 / SECTORS, 360.0)
+                  // (360.0 / SECTORS)).astype(np.intp) % SECTORS
+        band = np.digitize(speed[aimed], ROSE_BANDS)
+        cells = SECTORS * (len(ROSE_BANDS) + 1)
+        index = ids[aimed] * cells + sector * (len(ROSE_BANDS) + 1) + band
+        result.rose[:] = np.bincount(index, minlength=count * cells).reshape(result.rose.shape)
+    return result
+
+
+def merge_histograms(items):
+    """Add up WindHistograms, matching regions by name, one item at a time"""
+    index = {}
+    result = empty_histograms(())
+    for item in items:
+        rows = np.array([index.setdefault(region, len(index)) for region in item.regions],
+                        dtype=np.intp)
+        if len(index) > len(result.regions):
+            result = WindHistograms(tuple(index), *(grow_rows(total, len(index))
+                                                    for total in result[1:]))
+        for total, part in zip(result[1:], item[1:]):
+            total[rows] += part
+    return result
+
+
+def chunk_histograms(chunk):
+    regions, ids = station_ids(chunk['region'])
+    fields = chunk.dtype.names
+    return histograms(regions, ids, chunk['speed'],
+                      chunk['direction'] if 'direction' in fields else None,
+                      chunk['gust'] if 'gust' in fields else None)
+
+
+def read_histograms(path):
+    """Stream one hourly CSV file into WindHistograms"""
+    def chunks():
+        for chunk in read_chunks(path, COLUMNS, key='region'):
+            if 'speed' not in chunk.dtype.names:
+                raise ValueError(f"{path}: no 'speed' column in the header")
+            yield chunk_histograms(chunk)
+    return merge_histograms(chunks())
+
+
+def cached_histograms(path, cache_dir):
+    """WindHistograms of ``path`` from the cache in ``cache_dir``, reading it on a miss"""
+    key = fingerprint(path)
+    cache = cache_path(path, cache_dir, 'wind')
+    if cache.exists():
+        with np.load(cache) as stored:
+            if str(stored['fingerprint']) == key:
+                return WindHistograms(tuple(str(name) for name in stored['regions']),
+                                      *(stored[field] for field in WindHistograms._fields[1:]))
+    result = read_histograms(path)
+    cache.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache, 'wb') as output:
+        np.savez_compressed(output, fingerprint=np.array(key),
+                            regions=np.array(result.regions, dtype=str),
+                            **{field: getattr(result, field)
+                               for field in WindHistograms._fields[1:]})
+    return result
+
+
+def read_wind(paths, cache_dir=None):
+    """Merge the WindHistograms of all ``paths``, through the cache if ``cache_dir`` is given"""
+    if cache_dir is None:
+        return merge_histograms(read_histograms(path) for path in paths)
+    return merge_histograms(cached_histograms(path, cache_dir) for path in paths)
+
+
+def percentiles(counts, levels):
+    """Percentiles of 1 km/h histograms, interpolated within the bin; nan without data"""
+    cumulative = np.cumsum(counts, axis=1)
+    totals = cumulative[:, -1:]
+    result = np.full((len(counts), len(levels)), np.nan)
+    for k, level in enumerate(levels):
+        target = totals[:, 0] * level / 100.0
+        bins = np.minimum((cumulative < target[:, None]).sum(axis=1), counts.shape[1] - 1)
+        before = np.where(bins > 0, cumulative[np.arange(len(counts)), bins - 1], 0)
+        inside = counts[np.arange(len(counts)), bins]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            fraction = np.where(inside > 0, (target - before) / inside, 0.0)
+        result[:, k] = np.where(totals[:, 0] > 0, bins + fraction, np.nan)
+    return result
+
+
+def wind_metrics(result):
+    """MetricTable of mean wind, hours above the comfort thresholds, gust percentiles, direction"""
+    hours = result.speeds.sum(axis=1).astype(np.float64)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = result.speed_sum / hours
+        above = [100.0 * result.speeds[:, threshold:].sum(axis=1) / hours
+                 for threshold in COMFORT_THRESHOLDS]
+    sectors = result.rose.sum(axis=2)
+    prevailing = np.where(sectors.sum(axis=1) > 0,
+                          np.argmax(sectors, axis=1) * (360.0 / SECTORS), np.nan)
+    names = (('mean_wind', 'windy_percent')
+             + tuple(f"above_{threshold}_percent" for threshold in COMFORT_THRESHOLDS)
+             + tuple(f"gust_p{level}" for level in GUST_PERCENTILES)
+             + ('prevailing_direction',))
+    values = np.column_stack([mean, above[COMFORT_THRESHOLDS.index(WINDY)]] + above
+                             + [percentiles(result.gusts, GUST_PERCENTILES), prevailing])
+    return MetricTable(tuple(result.regions), names, values)
+
+
+def rose_table(result, region):
+    """Return the wind rose of ``region`` as a text table, in percent of its hours"""
+    rose = result.rose[result.regions.index(region)]
+    total = rose.sum() or 1
+    edges = ('0',) + tuple(f"{edge:g}" for edge in ROSE_BANDS)
+    bands = [f"{low}-{high}" for low, high in zip(edges, edges[1:])] + [f">{edges[-1]}"]
+    lines = [f"{'Sektor':<7}" + ''.join(f"{band:>8}" for band in bands) + f"{'Summe':>8}"]
+    for name, row in zip(SECTOR_NAMES, rose):
+        lines.append(f"{name:<7}" + ''.join(f"{100 * value / total:>7.1f}%" for value in row)
+                     + f"{100 * row.sum() / total:>7.1f}%")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('sources', nargs='+', type=Path, help="hourly wind CSV files")
+    parser.add_argument('--cache', type=Path, metavar='DIR',
+                        help="cache per-file histograms in DIR")
+    parser.add_argument('--output', '-o', type=Path, help="write the metrics to this CSV file")
+    parser.add_argument('--rose', metavar='REGION', help="print the wind rose of REGION")
+    args = parser.parse_args(argv)
+    start = time.perf_counter()
+    result = read_wind(args.sources, args.cache)
+    table = wind_metrics(result)
+    print(f"{'Region':<20}" + ''.join(f" {name[:14]:>14}" for name in table.metrics))
+    for region, row in zip(table.countries, table.values):
+        print(f"{region[:20]:<20}" + ''.join(f" {value:>14.1f}" for value in row))
+    print(f"\n{len(table.countries)} Regionen, {int(result.speeds.sum()):,} Stunden in "
+          f"{time.perf_counter() - start:.2f} s")
+    if args.rose:
+        if args.rose not in result.regions:
+            parser.error(f"unbekannte Region: {args.rose}")
+        print(f"\n{rose_table(result, args.rose)}")
+    if args.output:
+        write_metrics(args.output, table)
+
+
+if __name__ == '__main__':
+    main()
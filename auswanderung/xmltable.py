@@ -0,0 +1,130 @@
+"""Render the detail matrix as a finished ``w:tbl`` element in one pass.
+
+Filling the matrix through python-docx goes through ``table.rows[i].cells[j]``
+(which rebuilds the cell grid on every access) and sets each run property
+separately. Here the whole table is written as one XML string straight from
+``matrix_rows`` and parsed once.
+"""
+from collections import namedtuple
+from functools import lru_cache
+from xml.sax.saxutils import escape
+
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from docx.table import Table
+
+from auswanderung.styles import style_ids
+
+HEADER_FILL = '1F4E79'
+CRITERION_FILL = 'D9E2F3'
+SYMBOL_FILLS = {'++': 'C6EFCE', 'o': 'FFEB9C', '--': 'FFC7CE'}
+
+EMUS_PER_TWIP = 635
+
+# Upper bound for distinct matrix cells kept serialized in memory
+CELL_CACHE_SIZE = 4096
+
+TABLE_LOOK = ('<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" '
+              'w:noHBand="0" w:noVBand="1" w:val="04A0"/>')
+
+MatrixStyles = namedtuple('MatrixStyles', ['header', 'criterion', 'cell', 'header_run', 'symbol',
+                                           'points', 'note'])
+MatrixStyles.__doc__ = """IDs of the auswanderung.styles the matrix XML refers to, in one document.
+
+The first three are paragraph styles, the rest character styles. It is
+hashable, so the cell cache keeps the cells of each set of IDs apart.
+"""
+
+
+def matrix_styles(part):
+    """MatrixStyles of the document of ``part``, registering the styles if needed"""
+    ids = style_ids(part)
+    return MatrixStyles(ids['MatrixHeader'], ids['MatrixCriterion'], ids['MatrixCell'],
+                        ids['HeaderCell'], ids['MatrixSymbol'], ids['MatrixPoints'],
+                        ids['MatrixNote'])
+
+
+def text_xml(text):
+    """Return ``w:t`` elements for text, turning line breaks into ``w:br`` like python-docx"""
+    parts = []
+    for line in str(text).split('\n'):
+        if line != line.strip():
+            parts.append(f'<w:t xml:space="preserve">{escape(line)}</w:t>')
+        elif line:
+            parts.append(f'<w:t>{escape(line)}</w:t>')
+    return '<w:br/>'.join(parts)
+
+
+def paragraph_xml(text, paragraph_style, run_style=None):
+    rpr = f'<w:rPr><w:rStyle w:val="{run_style}"/></w:rPr>' if run_style else ''
+    return (f'<w:p><w:pPr><w:pStyle w:val="{paragraph_style}"/></w:pPr>'
+            f'<w:r>{rpr}{text_xml(text)}</w:r></w:p>')
+
+
+def cell_xml(width, fill, content):
+    shading = f'<w:shd w:val="clear" w:color="auto" w:fill="{fill}"/>' if fill else ''
+    return f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{width}"/>{shading}</w:tcPr>{content}</w:tc>'
+
+
+@lru_cache(maxsize=CELL_CACHE_SIZE)
+def matrix_cell_xml(width, symbol, points, explanation, styles):
+    """Return the ``w:tc`` for one (symbol, points, explanation) matrix cell.
+
+    Matrices repeat the same cells a lot ("++", "2", "EU-Recht"), so the
+    serialized cell is memoized and spliced into every later occurrence.
+    ``styles`` is a MatrixStyles.
+    """
+    content = (paragraph_xml(symbol, styles.cell, styles.symbol)
+               + paragraph_xml(f"({points})", styles.cell, styles.points)
+               + paragraph_xml(explanation, styles.cell, styles.note))
+    return cell_xml(width, SYMBOL_FILLS.get(symbol), content)
+
+
+def cell_cache_stats():
+    """Return hits, misses, size and hit rate of the matrix cell cache"""
+    info = matrix_cell_xml.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        'hits': info.hits,
+        'misses': info.misses,
+        'size': info.currsize,
+        'hit_rate': info.hits / lookups if lookups else 0.0,
+    }
+
+
+def matrix_table_xml(matrix_rows, col_width, styles, style_id='TableGrid'):
+    """Return the complete ``w:tbl`` XML for ``matrix_rows``; col_width is in twips.
+
+    ``styles`` is the MatrixStyles and ``style_id`` the table style of the
+    target document.
+    """
+    num_cols = len(matrix_rows[0])
+    parts = [f'<w:tbl {nsdecls("w")}><w:tblPr><w:tblStyle w:val="{style_id}"/>'
+             f'<w:tblW w:type="auto" w:w="0"/>{TABLE_LOOK}</w:tblPr><w:tblGrid>']
+    parts.append(f'<w:gridCol w:w="{col_width}"/>' * num_cols)
+    parts.append('</w:tblGrid><w:tr>')
+    for header in matrix_rows[0]:
+        parts.append(cell_xml(col_width, HEADER_FILL,
+                              paragraph_xml(header, styles.header, styles.header_run)))
+    parts.append('</w:tr>')
+    for row_data in matrix_rows[1:]:
+        parts.append('<w:tr>')
+        parts.append(cell_xml(col_width, CRITERION_FILL,
+                              paragraph_xml(row_data[0], styles.criterion)))
+        for symbol, points, explanation in row_data[1:]:
+            parts.append(matrix_cell_xml(col_width, symbol, points, explanation, styles))
+        parts.append('</w:tr>')
+    parts.append('</w:tbl>')
+    return ''.join(parts)
+
+
+def add_matrix_table(doc, matrix_rows, style='Table Grid'):
+    """Append the detail matrix to ``doc`` as a 'Table Grid' table and return it"""
+    styles = matrix_styles(doc.part)
+    section = doc.sections[-1]
+    block_width = section.page_width - section.left_margin - section.right_margin
+    col_width = round(block_width // len(matrix_rows[0]) / EMUS_PER_TWIP)
+    style_id = doc.styles[style].style_id
+    tbl = parse_xml(matrix_table_xml(matrix_rows, col_width, styles, style_id))
+    doc.element.body._insert_tbl(tbl)
+    return Table(tbl, doc._body)
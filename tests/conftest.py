@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+
+from auswanderung.scoring import MAX_POINTS
+
+SYMBOLS = ('--', 'o', '++')
+
+
+def random_rows(seed, countries=7, criteria=5):
+    """matrix_rows with random points and weights, including ties"""
+    rng = np.random.default_rng(seed)
+    codes = [f'C{i}' for i in range(countries)]
+    rows = [['Kriterium'] + codes]
+    for j in range(criteria):
+        weight = rng.choice([0.5, 1, 1.5, 2, 3])
+        points = rng.integers(0, MAX_POINTS + 1, countries)
+        rows.append([f'K{j} x{weight:g}']
+                    + [(SYMBOLS[p], str(p), f'Text {j}/{p}') for p in points])
+    return rows
+
+
+@pytest.fixture(params=range(5))
+def rows(request):
+    return random_rows(request.param)
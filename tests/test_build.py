@@ -0,0 +1,39 @@
+import pytest
+
+from auswanderung.build import build_all, discover_reports, main
+from auswanderung.buildcache import report_hash, stored_hash
+
+NAMES = ('final_v7_korrigiert', 'word_analysis_styled')
+
+
+@pytest.fixture
+def reports():
+    return [report for report in discover_reports() if report.name in NAMES]
+
+
+def outputs(results):
+    return {result.name: result.output.read_bytes() for result in results}
+
+
+def test_cache_force_and_stream(tmp_path, reports, capsys):
+    first = build_all(reports, tmp_path / 'normal', jobs=2)
+    assert not any(result.cached for result in first)
+    for result, report in zip(sorted(first), sorted(reports)):
+        assert stored_hash(result.output) == report_hash(report.script)
+
+    cached = build_all(reports, tmp_path / 'normal', jobs=2)
+    assert all(result.cached for result in cached)
+    assert outputs(cached) == outputs(first)
+
+    forced = build_all(reports, tmp_path / 'normal', jobs=2, force=True)
+    assert not any(result.cached for result in forced)
+    assert outputs(forced) == outputs(first)
+
+    streamed = build_all(reports, tmp_path / 'stream', jobs=2, stream=True)
+    assert outputs(streamed) == outputs(first)
+    assert 'unverändert' in capsys.readouterr().out
+
+
+def test_unknown_report_is_an_error(tmp_path):
+    with pytest.raises(SystemExit):
+        main(['gibt_es_nicht', '--output-dir', str(tmp_path)])
@@ -0,0 +1,68 @@
+import numpy as np
+
+from auswanderung import dominance as module
+from auswanderung.dominance import dominance, dominators, frontier, prune_rows
+from auswanderung.scoring import load_matrix
+
+from conftest import random_rows
+
+
+def brute_dominates(points, a, b):
+    return bool((points[a] >= points[b]).all() and (points[a] > points[b]).any())
+
+
+def brute_fronts(points):
+    countries = len(points)
+    fronts = [None] * countries
+    front, remaining = 0, set(range(countries))
+    while remaining:
+        current = {b for b in remaining
+                   if not any(brute_dominates(points, a, b) for a in remaining)}
+        for b in current:
+            fronts[b] = front
+        remaining -= current
+        front += 1
+    return fronts
+
+
+def check(points):
+    matrix = load_matrix([['K'] + [f'C{i}' for i in range(len(points))]]
+                         + [[f'K{j} x1'] + [('o', str(p), '') for p in column]
+                            for j, column in enumerate(points.T)])
+    result = dominance(matrix)
+    countries = len(points)
+    for b in range(countries):
+        expected = [a for a in range(countries) if brute_dominates(points, a, b)]
+        assert dominators(result, b).tolist() == expected
+        assert result.dominated_by[b] == len(expected)
+    assert result.fronts.tolist() == brute_fronts(points)
+    mask = [front == 0 for front in brute_fronts(points)]
+    assert frontier(result) == [country for country, keep in zip(matrix.countries, mask) if keep]
+
+
+def test_frontier_matches_brute_force():
+    rng = np.random.default_rng(3)
+    for countries in (1, 2, 9, 40):
+        for criteria in (1, 3, 6):
+            check(rng.integers(0, 3, (countries, criteria)))
+
+
+def test_blocks_give_the_same_graph(monkeypatch):
+    points = np.random.default_rng(4).integers(0, 3, (30, 4))
+    monkeypatch.setattr(module, 'BLOCK', 7)
+    check(points)
+
+
+def test_dominance_over_selected_criteria():
+    rows = random_rows(5, countries=12, criteria=5)
+    matrix = load_matrix(rows)
+    result = dominance(matrix, ['K0', 'K3'])
+    points = matrix.points[:, [0, 3]]
+    assert result.fronts.tolist() == brute_fronts(points)
+
+
+def test_prune_rows_keeps_order():
+    rows = random_rows(6, countries=4, criteria=2)
+    pruned = prune_rows(rows, {'C3', 'C1'})
+    assert pruned[0] == ['Kriterium', 'C1', 'C3']
+    assert pruned[1][1:] == [rows[1][2], rows[1][4]]
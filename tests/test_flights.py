@@ -0,0 +1,46 @@
+import math
+
+import numpy as np
+import pytest
+
+from auswanderung.flights import EARTH_RADIUS, Points, flight_time, flights, haversine
+
+HEATHROW = (51.4700, -0.4543)
+JFK = (40.6413, -73.7781)
+SYDNEY = (-33.9461, 151.1772)
+
+
+def test_haversine_on_exact_distances():
+    distances = haversine(np.array([(0.0, 0.0)]),
+                          np.array([(0.0, 0.0), (0.0, 1.0), (90.0, 0.0), (0.0, 180.0)]))
+    circumference = 2.0 * math.pi * EARTH_RADIUS
+    assert distances[0] == pytest.approx([0.0, circumference / 360.0, circumference / 4.0,
+                                          circumference / 2.0])
+
+
+def test_haversine_on_known_routes():
+    # Published great-circle distances; the sphere is within half a percent of the ellipsoid
+    distances = haversine(np.array([HEATHROW]), np.array([JFK, SYDNEY]))
+    assert distances[0] == pytest.approx([5555.0, 17016.0], rel=0.005)
+
+
+def test_haversine_is_symmetric_and_shaped():
+    rng = np.random.default_rng(0)
+    first = np.column_stack([rng.uniform(-90, 90, 5), rng.uniform(-180, 180, 5)])
+    second = np.column_stack([rng.uniform(-90, 90, 3), rng.uniform(-180, 180, 3)])
+    distances = haversine(first, second)
+    assert distances.shape == (5, 3)
+    assert np.allclose(distances, haversine(second, first).T)
+    assert (distances <= math.pi * EARTH_RADIUS + 1e-6).all()
+
+
+def test_flights_use_the_nearest_airport():
+    airports = Points(('LHR', 'JFK', 'SYD'), np.array([HEATHROW, JFK, SYDNEY]))
+    places = Points(('London', 'Manly'), np.array([(51.5072, -0.1276), (-33.7969, 151.2879)]))
+    result = flights(places, airports, {'LHR': HEATHROW})
+    assert result.airports == ('LHR', 'SYD')
+    assert np.allclose(result.airport_km, haversine(places.coordinates,
+                                                    airports.coordinates[[0, 2]]).diagonal())
+    assert result.distances[0, 0] == pytest.approx(0.0)
+    assert result.distances[1, 0] == pytest.approx(17016.0, rel=0.005)
+    assert flight_time(result.distances)[1, 0] > flight_time(17016.0 - 1.0)
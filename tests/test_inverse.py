@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from auswanderung.inverse import TOLERANCE, inverse_weights
+from auswanderung.scoring import load_matrix
+
+from conftest import random_rows
+
+
+def check_feasible(matrix, change, margin, modifiers, keep_total):
+    points = np.asarray(matrix.points, dtype=np.float64)
+    offsets = np.array([modifiers.get(country, 0) for country in matrix.countries])
+    totals = points @ change.weights + offsets
+    i = matrix.countries.index(change.country)
+    others = np.delete(totals, i)
+    assert (totals[i] - others >= margin - 1e-6).all()
+    assert (change.weights >= 0).all()
+    assert np.allclose(change.weights, np.maximum(matrix.weights + change.delta, 0.0),
+                       atol=TOLERANCE)
+    if keep_total:
+        assert change.weights.sum() == pytest.approx(matrix.weights.sum())
+
+
+@pytest.mark.parametrize('norm', ['l1', 'l2'])
+@pytest.mark.parametrize('keep_total', [True, False])
+def test_solutions_put_the_country_first(rows, norm, keep_total):
+    matrix = load_matrix(rows)
+    modifiers = {'C1': 1.0}
+    changes = inverse_weights(matrix, norm, 0.5, modifiers, keep_total)
+    assert [change.country for change in changes] == list(matrix.countries)
+    for change in changes:
+        if change.feasible:
+            check_feasible(matrix, change, 0.5, modifiers, keep_total)
+            expected = (np.abs(change.delta).sum() if norm == 'l1'
+                        else np.linalg.norm(change.delta))
+            assert change.distance == pytest.approx(expected)
+        else:
+            assert change.distance == float('inf')
+            assert change.weights is None and change.delta is None
+
+
+def test_dominated_country_has_no_solution():
+    rows = [['K', 'A', 'B', 'C'],
+            ['X x1', ('++', '2', ''), ('o', '1', ''), ('--', '0', '')],
+            ['Y x1', ('o', '1', ''), ('o', '1', ''), ('++', '2', '')]]
+    changes = inverse_weights(load_matrix(rows), 'l1')
+    assert [change.feasible for change in changes] == [True, False, True]
+
+
+def test_leader_needs_no_change():
+    rows = [['K', 'A', 'B'],
+            ['X x1', ('++', '2', ''), ('o', '1', '')],
+            ['Y x1', ('o', '1', ''), ('o', '1', '')]]
+    leader, other = inverse_weights(load_matrix(rows), 'l2')
+    assert leader.feasible and leader.distance == 0.0
+    assert not other.feasible
+
+
+def test_l1_is_not_beaten_by_l2(rows):
+    matrix = load_matrix(rows)
+    for l1, l2 in zip(inverse_weights(matrix, 'l1'), inverse_weights(matrix, 'l2')):
+        assert l1.feasible == l2.feasible
+        if l1.feasible:
+            assert l1.distance <= np.abs(l2.delta).sum() + 1e-6
+
+
+def test_unknown_norm():
+    with pytest.raises(ValueError):
+        inverse_weights(load_matrix(random_rows(0)), 'l3')
@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+from auswanderung.scenarios import (base, compose, evaluate, materialize, matrix_rows, resolve,
+                                    scenario)
+from auswanderung.scoring import MAX_POINTS, criterion_name, load_matrix, parse_weight, score
+
+from conftest import random_rows
+
+
+def apply_by_hand(rows, delta):
+    """Apply a composed scenario to a copy of ``rows`` cell by cell"""
+    rows = [list(row) for row in rows]
+    rows = [rows[0]] + [row for row in rows[1:]
+                        if criterion_name(row[0]) not in delta.remove_criteria]
+    for country, cells in delta.add_countries.items():
+        rows[0].append(country)
+        for row in rows[1:]:
+            row.append(cells[criterion_name(row[0])])
+    for label, cells in delta.add_criteria.items():
+        rows.append([label] + [cells[country] for country in rows[0][1:]])
+    for (country, name), cell in delta.overrides.items():
+        row = next(row for row in rows[1:] if criterion_name(row[0]) == name)
+        row[rows[0].index(country)] = cell
+    return rows
+
+
+def brute_scores(rows, modifiers):
+    countries = rows[0][1:]
+    totals = [sum(parse_weight(row[0]) * int(row[i][1]) for row in rows[1:])
+              + modifiers.get(country, 0) for i, country in enumerate(countries, start=1)]
+    max_total = MAX_POINTS * sum(parse_weight(row[0]) for row in rows[1:])
+    return countries, totals, max_total
+
+
+def layers(rows):
+    countries = rows[0][1:]
+    criteria = [criterion_name(row[0]) for row in rows[1:]]
+    new = scenario('Neu', add_countries={'NEU': {name: ('o', '1', '') for name in criteria}},
+                   overrides={(countries[0], criteria[1]): ('++', '2', 'besser')},
+                   modifiers={countries[2]: -2})
+    tennis = scenario('Tennis', add_criteria={
+        'Tennis x0.5': {country: ('++', '2', '') for country in countries + ['NEU']}},
+        overrides={('NEU', 'Tennis'): ('--', '0', '')})
+    removal = scenario('Ohne', remove_criteria=[criteria[1]], modifiers={countries[2]: 1, 'NEU': 3})
+    return [new, tennis, removal]
+
+
+@pytest.mark.parametrize('count', [1, 2, 3])
+def test_evaluate_and_materialize_match_brute_force(rows, count):
+    scenarios = layers(rows)[:count]
+    delta = compose(*scenarios)
+    countries, totals, max_total = brute_scores(apply_by_hand(rows, delta), delta.modifiers)
+    prepared = base(load_matrix(rows))
+
+    names, scores = evaluate(prepared, *scenarios)
+    assert list(names) == countries
+    assert np.allclose(scores.totals, totals)
+    assert scores.max_total == pytest.approx(max_total)
+    assert scores.ranks.tolist() == [1 + sum(o > t for o in totals) for t in totals]
+
+    matrix = materialize(prepared, *scenarios)
+    assert matrix_rows(matrix)[1:] == [[f"{criterion_name(row[0])} x{parse_weight(row[0]):g}"]
+                                       + list(row[1:])
+                                       for row in apply_by_hand(rows, delta)[1:]]
+    offsets = np.array([delta.modifiers.get(country, 0) for country in matrix.countries])
+    assert np.allclose(score(matrix).totals + offsets, totals)
+
+
+def test_compose_precedence_and_removal():
+    first = scenario('a', add_criteria={'Neu x1': {}}, overrides={('A', 'X'): ('o', '1', ''),
+                                                                  ('A', 'Y'): ('o', '1', '')},
+                     modifiers={'A': 1})
+    second = scenario('b', remove_criteria=['X', 'Neu'], overrides={('A', 'Y'): ('++', '2', '')},
+                      modifiers={'A': 2, 'B': -1})
+    delta = compose(first, second)
+    assert delta.name == 'a + b'
+    assert delta.add_criteria == {}
+    assert delta.remove_criteria == ('X',)
+    assert delta.overrides == {('A', 'Y'): ('++', '2', '')}
+    assert delta.modifiers == {'A': 3, 'B': -1}
+
+
+def test_compose_keeps_overrides_of_later_scenarios():
+    delta = compose(scenario('a', remove_criteria=['X']),
+                    scenario('b', overrides={('A', 'X'): ('o', '1', '')}))
+    assert delta.overrides == {('A', 'X'): ('o', '1', '')}
+
+
+@pytest.mark.parametrize('delta', [
+    scenario('x', remove_criteria=['Fehlt']),
+    scenario('x', add_criteria={'K0 x1': {}}),
+    scenario('x', add_criteria={'Neu x1': {'C0': ('o', '1', '')}}),
+    scenario('x', add_countries={'C0': {}}),
+    scenario('x', add_countries={'NEU': {'K0': ('o', '1', '')}}),
+    scenario('x', overrides={('C0', 'Fehlt'): ('o', '1', '')}),
+    scenario('x', overrides={('FEHLT', 'K0'): ('o', '1', '')}),
+    scenario('x', remove_criteria=['K0'], overrides={('C0', 'K0'): ('o', '1', '')}),
+    scenario('x', modifiers={'FEHLT': 1}),
+])
+def test_resolve_rejects_invalid_deltas(delta):
+    with pytest.raises(ValueError):
+        resolve(base(load_matrix(random_rows(0))), delta)
+
+
+def test_resolve_returns_kept_added_and_countries():
+    rows = random_rows(0, countries=3, criteria=3)
+    delta = scenario('x', remove_criteria=['K1'],
+                     add_criteria={'Neu x2': {c: ('o', '1', '') for c in ('C0', 'C1', 'C2')}})
+    assert resolve(base(load_matrix(rows)), delta) == (['K0', 'K2'], ['Neu'], ['C0', 'C1', 'C2'])
@@ -0,0 +1,92 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from auswanderung.matrixfile import read_matrix, to_matrix, write_matrix
+from auswanderung.reports import load_report
+from auswanderung.scenarios import scenario
+from auswanderung.scorematrix import ScoreMatrix
+from auswanderung.scoring import criterion_name, load_matrix, score
+
+
+@pytest.fixture(params=['random', 'final_v8_tennis_wind'])
+def matrix_rows(request, rows):
+    if request.param == 'random':
+        return rows
+    return load_report(request.param).DATA['matrix_rows']
+
+
+def assert_same_matrix(matrix, expected):
+    assert tuple(matrix.countries) == tuple(expected.countries)
+    assert tuple(matrix.criteria) == tuple(expected.criteria)
+    assert np.array_equal(matrix.weights, expected.weights)
+    assert np.array_equal(matrix.points, expected.points)
+    assert [tuple(row) for row in matrix.cells] == [tuple(row) for row in expected.cells]
+
+
+def test_score_matrix_round_trips(matrix_rows):
+    matrix = load_matrix(matrix_rows)
+    for converted in (ScoreMatrix.from_rows(matrix_rows), ScoreMatrix.from_matrix(matrix)):
+        assert_same_matrix(converted, matrix)
+        assert_same_matrix(pickle.loads(pickle.dumps(converted)), matrix)
+        assert np.array_equal(score(converted).totals, score(matrix).totals)
+
+
+def test_select_matches_a_matrix_of_the_selection(matrix_rows):
+    matrix = ScoreMatrix.from_rows(matrix_rows)
+    countries = [matrix.countries[-1], matrix.countries[0]]
+    criteria = list(matrix.criteria[1::2])
+    expected = load_matrix([[matrix_rows[0][0]] + countries]
+                           + [[row[0]] + [row[1 + matrix.countries.index(c)] for c in countries]
+                              for row in matrix_rows[1:] if criterion_name(row[0]) in criteria])
+    selected = matrix.select(countries, criteria)
+    assert_same_matrix(selected, expected)
+    assert_same_matrix(pickle.loads(pickle.dumps(selected)), expected)
+    assert len(pickle.loads(pickle.dumps(selected)).strings) <= len(matrix.strings)
+    view = matrix.select(slice(1, None))
+    assert np.shares_memory(view.points, matrix.points)
+    assert_same_matrix(view, matrix.select(list(range(1, len(matrix.countries)))))
+
+
+def test_matrix_file_round_trips(tmp_path, matrix_rows):
+    matrix = load_matrix(matrix_rows)
+    layers = [scenario('Tennis', add_criteria={'Tennis x0.5': {c: ('++', '2', 'ja')
+                                                              for c in matrix.countries}},
+                       remove_criteria=[matrix.criteria[0]],
+                       overrides={(matrix.countries[0], matrix.criteria[1]): ('o', '1', 'ä')},
+                       modifiers={matrix.countries[1]: -2}),
+              scenario('Leer')]
+    path = write_matrix(tmp_path / 'matrix.bin', matrix, layers)
+    stored = read_matrix(path)
+    assert stored.layers == layers
+    assert_same_matrix(to_matrix(stored), matrix)
+    assert_same_matrix(ScoreMatrix.from_file(stored), matrix)
+    assert np.array_equal(score(stored).totals, score(matrix).totals)
+    assert path.stat().st_size % 64 == 0
+
+
+def test_matrix_file_rejects_other_files(tmp_path):
+    path = tmp_path / 'kein.bin'
+    path.write_bytes(b'PK\x03\x04' + bytes(60))
+    with pytest.raises(ValueError):
+        read_matrix(path)
+
+
+def test_select_a_single_name(matrix_rows):
+    matrix = ScoreMatrix.from_rows(matrix_rows)
+    country, criterion = matrix.countries[1], matrix.criteria[0]
+    selected = matrix.select(country, criterion)
+    assert selected.countries == (country,) and selected.criteria == (criterion,)
+    assert selected.points.shape == (1, 1)
+    assert_same_matrix(matrix.select(1, 0), selected)
+    assert_same_matrix(matrix.select(country), matrix.select([country]))
+
+
+def test_too_many_symbols():
+    countries = [f'C{i}' for i in range(257)]
+    cells = [[(f'S{i}', '1', '') for i in range(257)]]
+    with pytest.raises(ValueError, match='256'):
+        ScoreMatrix.from_cells(countries, ['K'], [1.0], cells)
+    matrix = ScoreMatrix.from_cells(countries[:256], ['K'], [1.0], [cells[0][:256]])
+    assert matrix.cell(255, 0) == ('S255', '1', '')
@@ -0,0 +1,86 @@
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from auswanderung.scoring import (MAX_POINTS, criterion_name, load_matrix, parse_weight,
+                                  rank_desc, score, score_profiles, top_k)
+
+
+def brute_totals(rows):
+    return [sum(parse_weight(row[0]) * int(row[i][1]) for row in rows[1:])
+            for i in range(1, len(rows[0]))]
+
+
+def brute_ranks(totals):
+    return [1 + sum(other > total for other in totals) for total in totals]
+
+
+def test_parse_weight_and_name():
+    assert parse_weight('Geopolitik x2') == 2.0
+    assert parse_weight('Tennis-Wetter\n(ganzjährig) x0,5') == 0.5
+    assert criterion_name('Tennis-Wetter\n(ganzjährig) x0,5') == 'Tennis-Wetter (ganzjährig)'
+    with pytest.raises(ValueError):
+        parse_weight('Geopolitik')
+
+
+def test_load_matrix_rejects_bad_rows():
+    with pytest.raises(ValueError):
+        load_matrix([['K', 'A', 'B'], ['X x1', ('o', '1', '')]])
+    with pytest.raises(ValueError):
+        load_matrix([['K', 'A'], ['X x1', ('o', str(MAX_POINTS + 1), '')]])
+
+
+def test_rank_desc_matches_brute_force():
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        totals = rng.integers(0, 6, rng.integers(1, 12)).astype(np.float64)
+        assert rank_desc(totals).tolist() == brute_ranks(totals.tolist())
+
+
+def test_score_matches_brute_force(rows):
+    matrix = load_matrix(rows)
+    scores = score(matrix)
+    totals = brute_totals(rows)
+    max_total = MAX_POINTS * sum(parse_weight(row[0]) for row in rows[1:])
+    assert np.allclose(scores.totals, totals)
+    assert scores.max_total == pytest.approx(max_total)
+    assert np.allclose(scores.percent, [100.0 * total / max_total for total in totals])
+    assert scores.ranks.tolist() == brute_ranks(totals)
+    assert scores.order.tolist() == sorted(range(len(totals)), key=lambda i: -totals[i])
+
+
+def test_score_with_zero_weights(rows):
+    matrix = load_matrix(rows)
+    scores = score(matrix, np.zeros(len(matrix.criteria)))
+    assert not scores.percent.any()
+    assert (scores.ranks == 1).all()
+
+
+def test_top_k_matches_brute_force():
+    rng = np.random.default_rng(1)
+    totals = rng.integers(0, 8, (40, 9)).astype(np.float64)
+    for k in (1, 3, 9, 20):
+        top = top_k(totals, k)
+        assert top.shape == (40, min(k, 9))
+        for row, indices in zip(totals, top):
+            assert sorted(row, reverse=True)[:len(indices)] == row[indices].tolist()
+            assert len(set(indices.tolist())) == len(indices)
+
+
+def test_score_profiles_matches_single_scores(rows):
+    matrix = load_matrix(rows)
+    rng = np.random.default_rng(2)
+    weights = rng.uniform(0, 3, (6, len(matrix.criteria)))
+    result = score_profiles(matrix, weights, k=2)
+    for i, profile in enumerate(weights):
+        single = score(matrix, profile)
+        assert np.allclose(result.totals[i], single.totals)
+        assert np.allclose(result.percent[i], single.percent)
+        assert np.allclose(result.top_totals[i], sorted(single.totals, reverse=True)[:2])
+
+
+def test_import_does_not_load_numpy():
+    code = "import sys, auswanderung.scoring; sys.exit('numpy' in sys.modules)"
+    assert subprocess.run([sys.executable, '-c', code]).returncode == 0
@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+from auswanderung.scoring import load_matrix
+from auswanderung.sensitivity import sensitivity
+
+from conftest import random_rows
+
+
+@pytest.fixture
+def matrix():
+    return load_matrix(random_rows(8, countries=6, criteria=5))
+
+
+def test_result_does_not_depend_on_jobs(matrix):
+    single = sensitivity(matrix, samples=5000, jobs=1, batch=700, modifiers={'C2': 1})
+    for jobs in (2, 3, 20):
+        spread = sensitivity(matrix, samples=5000, jobs=jobs, batch=700, modifiers={'C2': 1})
+        assert spread.countries == single.countries and spread.criteria == single.criteria
+        for field in single._fields[2:]:
+            assert np.array_equal(getattr(spread, field), getattr(single, field), equal_nan=True)
+
+
+def test_rank_counts_cover_every_sample(matrix):
+    result = sensitivity(matrix, samples=3000, batch=1000)
+    assert (result.rank_counts.sum(axis=1) == 3000).all()
+    # Tied winners share the first rank
+    assert result.rank_counts[:, 0].sum() >= 3000
+    # Whenever the unperturbed winner is not first, another country won
+    assert result.flip_rate >= 1.0 - result.p_first[np.argmin(result.base_ranks)] - 1e-12
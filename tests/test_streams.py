@@ -0,0 +1,196 @@
+"""Chunked and streamed results against the same computation on whole arrays"""
+import numpy as np
+import pytest
+
+from auswanderung.climate import (STATION_BYTES, STATISTICS, chunk_totals, climate_metrics, ingest,
+                                  ingest_file, merge_totals, read_chunks)
+from auswanderung.tennis import monthly_means, playable, playable_days
+from auswanderung.wind import (COLUMNS, chunk_histograms, histograms, merge_histograms,
+                               read_histograms, read_wind)
+
+STATIONS = ('Montevideo', 'Nicosia', 'Auckland', 'Las Palmas')
+
+
+def station_rows(seed, days=200):
+    """Station CSV rows, sorted by station, with some missing fields"""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for station in STATIONS:
+        for _ in range(days):
+            values = [f'{rng.uniform(5, 38):.1f}', f'{rng.exponential(1.5):.1f}',
+                      f'{rng.uniform(0, 12):.1f}', f'{rng.uniform(0, 40):.1f}']
+            gap = rng.integers(0, 10)
+            if gap < len(values):
+                values[gap] = ''
+            rows.append([station] + values)
+    return rows
+
+
+def write_csv(path, header, rows):
+    path.write_text('\n'.join(','.join(row) for row in [header] + rows) + '\n', encoding='utf-8')
+    return path
+
+
+def totals_by_station(totals):
+    return {station: (totals.sums[i], totals.counts[i])
+            for i, station in enumerate(totals.stations)}
+
+
+def assert_same_totals(first, second):
+    first, second = totals_by_station(first), totals_by_station(second)
+    assert first.keys() == second.keys()
+    for station, (sums, counts) in first.items():
+        assert np.allclose(sums, second[station][0])
+        assert (counts == second[station][1]).all()
+
+
+@pytest.fixture
+def station_file(tmp_path):
+    header = ['station', 'tmax', 'precipitation', 'sunshine', 'wind']
+    return write_csv(tmp_path / 'stationen.csv', header, station_rows(0))
+
+
+@pytest.mark.parametrize('chunk_bytes', [64, 1000, 1 << 24])
+def test_climate_chunks_match_whole_file(station_file, chunk_bytes):
+    whole = chunk_totals(np.concatenate(list(read_chunks(station_file, chunk_bytes=1 << 30))))
+    assert_same_totals(ingest_file(station_file, chunk_bytes), whole)
+
+
+def test_climate_totals_match_loop(station_file):
+    totals = ingest_file(station_file, chunk_bytes=256)
+    rows = [line.split(',') for line in station_file.read_text().splitlines()[1:]]
+    for station in STATIONS:
+        values = np.array([[float(value) if value else np.nan for value in row[1:]]
+                           for row in rows if row[0] == station])
+        tmax, precipitation, sunshine, wind = values.T
+        tennis = playable(tmax, precipitation, wind).astype(float)
+        tennis[np.isnan(values[:, [0, 1, 3]]).any(axis=1)] = np.nan
+        heat = np.where(np.isnan(tmax), np.nan, tmax >= 30.0)
+        daily = np.stack([sunshine, tennis, heat, precipitation, wind], axis=1)
+        sums, counts = totals_by_station(totals)[station]
+        assert np.allclose(sums, np.nansum(daily, axis=0))
+        assert (counts == (~np.isnan(daily)).sum(axis=0)).all()
+
+
+def test_climate_merge_across_files_and_cache(tmp_path, station_file):
+    header = ['station', 'tmax', 'precipitation', 'sunshine', 'wind']
+    other = write_csv(tmp_path / 'mehr.csv', header, station_rows(1, days=30))
+    merged = ingest([station_file, other])
+    expected = merge_totals([ingest_file(station_file), ingest_file(other)])
+    assert_same_totals(merged, expected)
+    cache = tmp_path / 'cache'
+    assert_same_totals(ingest([station_file, other], cache), merged)
+    assert_same_totals(ingest([station_file, other], cache), merged)
+    assert len(list(cache.iterdir())) == 2
+    table = climate_metrics(merged)
+    assert table.metrics == STATISTICS
+    assert table.values.shape == (len(STATIONS), len(STATISTICS))
+
+
+def test_merge_totals_of_nothing():
+    totals = merge_totals([])
+    assert totals.stations == ()
+    assert totals.sums.shape == totals.counts.shape == (0, len(STATISTICS))
+
+
+def test_station_names_up_to_the_limit(tmp_path):
+    names = ['ä' * (STATION_BYTES // 2), 'x' * STATION_BYTES]
+    path = write_csv(tmp_path / 'lang.csv', ['station', 'tmax'],
+                     [[name, '20'] for name in names])
+    assert sorted(ingest_file(path).stations) == sorted(names)
+
+
+@pytest.mark.parametrize('name', ['x' * (STATION_BYTES + 1), 'x' + 'ä' * (STATION_BYTES // 2)])
+def test_longer_station_names_are_an_error(tmp_path, name):
+    path = write_csv(tmp_path / 'lang.csv', ['station', 'tmax'], [['Kurz', '20'], [name, '21']])
+    with pytest.raises(ValueError, match='longer than'):
+        ingest_file(path)
+    wind = write_csv(tmp_path / 'wind.csv', ['region', 'speed'], [[name, '20']])
+    with pytest.raises(ValueError, match='longer than'):
+        read_histograms(wind)
+
+
+def wind_rows(seed, hours=300):
+    rng = np.random.default_rng(seed)
+    rows = []
+    for region in STATIONS:
+        for _ in range(hours):
+            speed = rng.gamma(2.0, 9.0)
+            rows.append([region, f'{speed:.1f}', f'{rng.uniform(0, 360):.0f}',
+                         f'{speed * rng.uniform(1.2, 2.5):.1f}' if rng.random() > 0.1 else ''])
+    return rows
+
+
+@pytest.fixture
+def wind_file(tmp_path):
+    return write_csv(tmp_path / 'wind.csv', ['region', 'speed', 'direction', 'gust'], wind_rows(2))
+
+
+def assert_same_histograms(first, second):
+    assert set(first.regions) == set(second.regions)
+    for region in first.regions:
+        i, j = first.regions.index(region), second.regions.index(region)
+        for a, b in zip(first[1:], second[1:]):
+            assert np.allclose(a[i], b[j])
+
+
+@pytest.mark.parametrize('chunk_bytes', [64, 2000])
+def test_wind_chunks_match_whole_arrays(wind_file, chunk_bytes):
+    rows = [line.split(',') for line in wind_file.read_text().splitlines()[1:]]
+    regions = sorted(set(row[0] for row in rows))
+    ids = np.array([regions.index(row[0]) for row in rows])
+    speed, direction, gust = (np.array([float(row[k]) if row[k] else np.nan for row in rows])
+                              for k in (1, 2, 3))
+    whole = histograms(regions, ids, speed, direction, gust)
+    chunked = merge_histograms(chunk_histograms(chunk) for chunk in
+                               read_chunks(wind_file, COLUMNS, key='region',
+                                           chunk_bytes=chunk_bytes))
+    assert_same_histograms(chunked, whole)
+    assert_same_histograms(read_histograms(wind_file), whole)
+
+
+def test_wind_merge_across_files_and_cache(tmp_path, wind_file):
+    other = write_csv(tmp_path / 'mehr.csv', ['region', 'speed', 'direction'], wind_rows(3, 20))
+    merged = read_wind([wind_file, other])
+    expected = merge_histograms([read_histograms(wind_file), read_histograms(other)])
+    assert_same_histograms(merged, expected)
+    assert_same_histograms(read_wind([wind_file, other], tmp_path / 'cache'), merged)
+    assert_same_histograms(read_wind([wind_file, other], tmp_path / 'cache'), merged)
+
+
+def tennis_grid(seed, locations=6, days=400):
+    rng = np.random.default_rng(seed)
+    temperature = rng.uniform(0, 40, (locations, days))
+    precipitation = rng.exponential(1.0, (locations, days))
+    wind = rng.uniform(0, 40, (locations, days))
+    temperature[rng.random((locations, days)) < 0.05] = np.nan
+    return temperature, precipitation, wind
+
+
+def test_tennis_chunks_match_whole_grid():
+    grid = tennis_grid(4)
+    start = '2023-01-01'
+    whole = playable_days(*grid, start)
+    by_location = [playable_days(*(values[i:i + 2] for values in grid), start)
+                   for i in range(0, grid[0].shape[0], 2)]
+    assert (np.concatenate([part.days for part in by_location]) == whole.days).all()
+    assert (np.concatenate([part.valid for part in by_location]) == whole.valid).all()
+    # 2023-01-01 + 181 days is 2023-07-01, a month boundary
+    first = playable_days(*(values[:, :181] for values in grid), start)
+    second = playable_days(*(values[:, 181:] for values in grid), '2023-07-01')
+    assert (np.concatenate([first.months, second.months]) == whole.months).all()
+    assert (np.concatenate([first.days, second.days], axis=1) == whole.days).all()
+    assert (np.concatenate([first.valid, second.valid], axis=1) == whole.valid).all()
+
+
+def test_tennis_days_match_loop():
+    grid = tennis_grid(5, locations=2, days=70)
+    result = playable_days(*grid, '2024-01-01')
+    assert result.months.tolist() == list(np.array(['2024-01', '2024-02', '2024-03'],
+                                                   dtype='datetime64[M]'))
+    for month, (begin, end) in enumerate([(0, 31), (31, 60), (60, 70)]):
+        days = playable(*(values[:, begin:end] for values in grid)).sum(axis=1)
+        assert (result.days[:, month] == days).all()
+    means = monthly_means(result)
+    assert means.shape == (2, 12)
+    assert np.isnan(means[:, 3:]).all()
@@ -0,0 +1,51 @@
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pytest
+
+from auswanderung.timezones import OFFSET_HOUR, daily_offsets, overlap
+
+ZONES = ('Europe/Berlin', 'Pacific/Auckland', 'America/Santiago', 'Australia/Sydney',
+         'Atlantic/Canary', 'America/Montevideo', 'Africa/Windhoek')
+
+
+def day_index(year, month, day):
+    return (date(year, month, day) - date(year, 1, 1)).days
+
+
+@pytest.mark.parametrize('zone', ZONES)
+@pytest.mark.parametrize('year', [2024, 2025])
+def test_daily_offsets_match_every_day(zone, year):
+    offsets = daily_offsets(zone, year)
+    first = datetime(year, 1, 1, OFFSET_HOUR, tzinfo=timezone.utc)
+    expected = [(first + timedelta(days=day)).astimezone(ZoneInfo(zone)).utcoffset()
+                .total_seconds() / 3600.0 for day in range(len(offsets))]
+    assert len(offsets) == (366 if year == 2024 else 365)
+    assert offsets.tolist() == expected
+
+
+def test_known_transitions_2025():
+    berlin = daily_offsets('Europe/Berlin', 2025)
+    assert berlin[day_index(2025, 3, 29)] == 1.0
+    assert berlin[day_index(2025, 3, 30)] == 2.0
+    assert berlin[day_index(2025, 10, 25)] == 2.0
+    assert berlin[day_index(2025, 10, 26)] == 1.0
+    auckland = daily_offsets('Pacific/Auckland', 2025)
+    assert auckland[day_index(2025, 4, 5)] == 13.0
+    assert auckland[day_index(2025, 4, 6)] == 12.0
+    assert auckland[day_index(2025, 9, 27)] == 12.0
+    assert auckland[day_index(2025, 9, 28)] == 13.0
+
+
+def test_overlap_follows_the_office_transitions():
+    result = overlap(['Europe/Berlin', 'America/Montevideo', 'Pacific/Auckland'], 2025)
+    assert ((result.days.astype(np.int64) + 3) % 7 < 5).all()
+    berlin, montevideo, auckland = result.hours
+    assert (berlin == 8.0).all()
+    assert not auckland.any()
+    # Montevideo stays at UTC-3: 4 hours behind Berlin in winter, 5 in summer
+    summer = ((result.days >= np.datetime64('2025-03-30'))
+              & (result.days < np.datetime64('2025-10-26')))
+    assert (montevideo[~summer] == 6.0).all()
+    assert (montevideo[summer] == 5.0).all()
@@ -0,0 +1,27 @@
+from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
+
+from auswanderung.xmltable import add_matrix_table
+
+ROWS = [['Kriterium', 'NZ', 'UY'],
+        ['Geopolitik x2', ('++', '2', 'Isoliert'), ('o', '1', 'Neutral')],
+        ['Sprache x1', ('++', '2', 'Englisch'), ('--', '0', 'Spanisch')]]
+
+
+def paragraph_styles(table):
+    return {paragraph.style.name: paragraph._p.pPr.style
+            for cell in table._cells for paragraph in cell.paragraphs}
+
+
+def test_matrix_uses_the_style_ids_of_each_document():
+    plain = add_matrix_table(Document(), ROWS)
+    assert paragraph_styles(plain)['MatrixCell'] == 'MatrixCell'
+
+    doc = Document()
+    doc.styles.add_style('MatrixCell', WD_STYLE_TYPE.PARAGRAPH).style_id = 'Matrixzelle'
+    table = add_matrix_table(doc, ROWS)
+    styles = paragraph_styles(table)
+    assert styles['MatrixCell'] == 'Matrixzelle'
+    assert styles['MatrixHeader'] == 'MatrixHeader'
+    assert table.cell(1, 1).paragraphs[0].text == '++'
+    assert table.cell(2, 2).paragraphs[2].text == 'Spanisch'